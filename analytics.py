@@ -0,0 +1,91 @@
+"""Career distribution analytics: which careers are predicted most, by education level,
+percentage band and week.
+
+Every saved result is counted in the career_stats summary table in the same transaction that
+inserts it (Database.save_user_results), so a report reads one summary row per week, career,
+education level and percentage band instead of scanning user_results. Its cost depends on the
+number of weeks asked for, not on how many assessments are stored.
+
+    python analytics.py report [--weeks 12] [--education-level 12th]
+    python analytics.py backfill        # recount career_stats from user_results
+
+Backfill is only needed for results written outside the app (or by a version without the
+summary); the migration that adds career_stats counts the results already stored.
+"""
+import argparse
+import os
+from collections import Counter
+from datetime import date, datetime, timedelta, timezone
+
+from db import Database, week_start
+
+DEFAULT_WEEKS = 12
+MAX_WEEKS = 520
+
+
+def week_range(weeks, today=None):
+    """(first, last) Monday of the last `weeks` weeks, the current (UTC) one included"""
+    last = date.fromisoformat(week_start(today or datetime.now(timezone.utc).date()))
+    return (last - timedelta(weeks=weeks - 1)).isoformat(), last.isoformat()
+
+
+def career_distribution(db, weeks=DEFAULT_WEEKS, education_level=None, percentage_band=None,
+                        career=None, today=None):
+    """Result counts per career overall and per education level, percentage band and week"""
+    first, last = week_range(weeks, today)
+    rows = [row for row in db.get_career_stats(first, last)
+            if (education_level is None or row[2] == education_level)
+            and (percentage_band is None or row[3] == percentage_band)
+            and (career is None or row[1] == career)]
+    totals = Counter()
+    by_field = {'education_level': {}, 'percentage_band': {}, 'week': {}}
+    for week, name, level, band, results in rows:
+        totals[name] += results
+        for field, value in (('education_level', level), ('percentage_band', band), ('week', week)):
+            by_field[field].setdefault(value, Counter())[name] += results
+    return {
+        'first_week': first,
+        'last_week': last,
+        'results': sum(totals.values()),
+        'careers': _ranked(totals),
+        **{f'by_{field}': {value: _ranked(counts) for value, counts in sorted(groups.items())}
+           for field, groups in by_field.items()},
+    }
+
+
+def _ranked(counts):
+    return [{'career': career, 'results': n} for career, n in counts.most_common()]
+
+
+def print_report(report, top=5):
+    print(f'{report["results"]} results, weeks {report["first_week"]} to {report["last_week"]}')
+    for career in report['careers'][:top]:
+        print(f'  {career["results"]:>7}  {career["career"]}')
+    for field in ('education_level', 'percentage_band'):
+        print(f'By {field.replace("_", " ")}:')
+        for value, careers in report[f'by_{field}'].items():
+            leaders = ', '.join(f'{c["career"]} ({c["results"]})' for c in careers[:3])
+            print(f'  {value}: {leaders}')
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Career distribution analytics')
+    parser.add_argument('command', choices=('report', 'backfill'))
+    parser.add_argument('--db', default=os.environ.get('PATHFINDER_DB', 'pathfinder.db'))
+    parser.add_argument('--weeks', type=int, default=DEFAULT_WEEKS)
+    parser.add_argument('--education-level')
+    parser.add_argument('--percentage-band')
+    args = parser.parse_args()
+
+    db = Database(args.db)
+    db.init_schema()
+    if args.command == 'backfill':
+        print(f'Counted {db.rebuild_career_stats()} results into career_stats')
+    else:
+        print_report(career_distribution(db, min(max(args.weeks, 1), MAX_WEEKS),
+                                          args.education_level, args.percentage_band))
+    db.close()
+
+
+if __name__ == '__main__':
+    main()
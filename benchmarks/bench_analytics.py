@@ -0,0 +1,121 @@
+"""Career distribution query cost as user_results grows: full scan vs the career_stats summary.
+
+For each table size, fills a temporary database with results spread over --weeks weeks and
+times the same 12-week report two ways: scanning user_results and parsing every stored
+str(dict) profile (how the numbers had to be pulled before career_stats), and
+analytics.career_distribution on the summary table. Also reports the cost per result of
+keeping the summary up to date on save and the time of a full backfill.
+
+    python benchmarks/bench_analytics.py [--rows 10000 100000 1000000]
+"""
+import argparse
+import ast
+import os
+import random
+import sys
+import tempfile
+import time
+import warnings
+from collections import Counter
+from datetime import date, timedelta
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import db
+from analytics import DEFAULT_WEEKS, career_distribution, week_range
+from model_registry import load_model_handle
+
+EDUCATION_LEVELS = ('10th', '12th', 'Graduate', 'Postgraduate')
+BATCH = 10000
+
+
+def fill(database, rows, weeks, careers, rng):
+    """Insert results for careers spread over the last `weeks` weeks"""
+    today = date.today()
+    with database.transaction() as conn:
+        for start in range(0, rows, BATCH):
+            batch = []
+            for _ in range(min(BATCH, rows - start)):
+                profile = {'age': rng.randint(14, 25), 'percentage': rng.randint(35, 100),
+                           'education_level': rng.choice(EDUCATION_LEVELS), 'interests': ['Technology']}
+                created = today - timedelta(days=rng.randrange(weeks * 7))
+                batch.append((1, rng.choice(careers), str(profile), f'{created} 12:00:00'))
+            conn.executemany('INSERT INTO user_results (user_id, predicted_career, profile_data, created_at) '
+                             'VALUES (?, ?, ?, ?)', batch)
+
+
+def scan_report(database, weeks):
+    """The report computed from user_results: parse every profile in the date range"""
+    first, last = week_range(weeks)
+    end = (date.fromisoformat(last) + timedelta(days=7)).isoformat()
+    counts = Counter()
+    with database.connection() as conn:
+        for career, profile_data in conn.execute(
+                'SELECT predicted_career, profile_data FROM user_results WHERE created_at >= ? AND created_at < ?',
+                (first, end)):
+            profile = ast.literal_eval(profile_data)
+            counts[career, profile.get('education_level'), db.percentage_band(profile.get('percentage'))] += 1
+    return counts
+
+
+def best_ms(fn, repeat=3):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best * 1e3
+
+
+def save_us(database, careers, rng, rows, with_summary):
+    profile = {'age': 16, 'percentage': 82.0, 'education_level': '12th', 'interests': ['Technology']}
+    batch = [(1, rng.choice(careers), profile, None, None) for _ in range(rows)]
+    start = time.perf_counter()
+    if with_summary:
+        for row in batch:
+            database.save_user_result(*row)
+    else:
+        for row in batch:
+            with database.transaction() as conn:
+                conn.execute(db.INSERT_RESULT, db._result_params(*row))
+    return (time.perf_counter() - start) / rows * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, nargs='+', default=[10000, 100000, 1000000])
+    parser.add_argument('--weeks', type=int, default=52, help='weeks the results are spread over')
+    parser.add_argument('--model', default=os.path.join(ROOT, 'ml_model', 'career_predictor.pkl'))
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    # The careers the model can predict, so the summary has the shape production traffic gives it
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        careers = list(load_model_handle(args.model).columns)
+    rng = random.Random(args.seed)
+    print(f'{DEFAULT_WEEKS}-week report over results spread across {args.weeks} weeks')
+    print(f'{"results":>9} {"scan ms":>10} {"summary ms":>11} {"summary rows":>13} {"backfill s":>11}')
+    for rows in args.rows:
+        database = db.Database(os.path.join(tempfile.mkdtemp(prefix='pathfinder-bench-'), 'bench.db'))
+        database.init_schema()
+        fill(database, rows, args.weeks, careers, rng)
+        start = time.perf_counter()
+        database.rebuild_career_stats()
+        backfill = time.perf_counter() - start
+        summary_rows = len(database.get_career_stats('0000-01-01', '9999-12-31'))
+        print(f'{rows:>9} {best_ms(lambda: scan_report(database, DEFAULT_WEEKS)):>10.1f} '
+              f'{best_ms(lambda: career_distribution(database)):>11.2f} {summary_rows:>13} {backfill:>11.2f}')
+        database.close()
+
+    database = db.Database(os.path.join(tempfile.mkdtemp(prefix='pathfinder-bench-'), 'bench.db'))
+    database.init_schema()
+    plain = save_us(database, careers, rng, 2000, False)
+    counted = save_us(database, careers, rng, 2000, True)
+    print(f'save_user_result: {plain:.0f} us without the summary, {counted:.0f} us with it')
+    database.close()
+
+
+if __name__ == '__main__':
+    main()
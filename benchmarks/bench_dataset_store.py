@@ -0,0 +1,110 @@
+"""Time course queries against a large synthetic catalog in the columnar dataset store.
+
+Replicates the rows of datasets/courses_dataset.csv (with varied fees, durations and
+percentages) up to --rows courses, checks each query against a plain Python filter/sort over
+the same records, and reports the mean time per query:
+
+    python benchmarks/bench_dataset_store.py [--rows 50000] [--repeat 200] [--seed 42]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from dataset_store import (COURSES_CSV, ColumnStore, parse_duration_months, parse_fees,
+                           parse_number, read_loose_csv)
+
+NUMERIC = {'min_percentage': parse_number, 'duration': parse_duration_months, 'fees': parse_fees}
+QUERIES = {
+    'all, by name': {},
+    'category': {'category': 'Engineering'},
+    'category + percentage': {'category': 'Technical', 'max_min_percentage': '40'},
+    'eligibility + fees, by fees': {'eligibility': '10th pass', 'max_fees': '50000', 'sort': 'fees'},
+    'duration range, by -duration': {'min_duration': '12', 'max_duration': '36', 'sort': '-duration'},
+    'page 50': {'sort': 'min_percentage', 'page': '50'},
+}
+
+
+def synthetic_courses(n, seed):
+    rng = random.Random(seed)
+    base = read_loose_csv(os.path.join(ROOT, COURSES_CSV))
+    courses = []
+    for i in range(n):
+        row = dict(rng.choice(base))
+        row['name'] = f"{row['name']} #{i}"
+        row['min_percentage'] = str(rng.randint(30, 95))
+        row['duration'] = rng.choice(['6 months', '1 year', '2 years', '3 years', '4 years', '4-6 years'])
+        row['fees'] = rng.choice([f'₹{rng.randint(1, 9)}-{rng.randint(10, 20)} LPA',
+                                  f'₹{rng.randint(5, 50)},000-{rng.randint(51, 99)},000'])
+        courses.append(row)
+    return courses
+
+
+def reference_query(courses, args):
+    """The same query as ColumnStore.query_args, one record at a time"""
+    def matches(row):
+        for column in ('category', 'eligibility'):
+            if column in args and row[column].casefold() != args[column].casefold():
+                return False
+        for column, parse in NUMERIC.items():
+            value = parse(row[column])
+            for prefix, check in (('min', lambda v, b: v >= b), ('max', lambda v, b: v <= b)):
+                bound = args.get(f'{prefix}_{column}')
+                if bound is not None and not (value == value and check(value, float(bound))):
+                    return False
+        return True
+
+    sort = args.get('sort', 'name')
+    field = sort.lstrip('-')
+    sign = -1 if sort.startswith('-') else 1
+    rows = [row for row in courses if matches(row)]
+    if field == 'name':
+        rows.sort(key=lambda row: row['name'], reverse=sign < 0)
+    else:
+        def key(row):
+            value = NUMERIC[field](row[field])
+            missing = value != value
+            return missing, 0 if missing else sign * value, row['name']
+        rows.sort(key=key)
+    page, per_page = int(args.get('page', 1)), 12
+    pages = max(1, -(-len(rows) // per_page))
+    page = min(max(page, 1), pages)
+    return [row['name'] for row in rows[(page - 1) * per_page:page * per_page]], len(rows)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, default=50000)
+    parser.add_argument('--repeat', type=int, default=200)
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    courses = synthetic_courses(args.rows, args.seed)
+    start = time.perf_counter()
+    store = ColumnStore(courses, categorical=('category', 'eligibility'), numeric=NUMERIC)
+    print(f'Loaded {len(store)} courses in {(time.perf_counter() - start) * 1e3:.1f} ms')
+
+    print(f'{"query":<30} {"matches":>8} {"mean ms":>9} {"max ms":>8}')
+    for name, query in QUERIES.items():
+        result = store.query_args(query)
+        expected_names, expected_total = reference_query(courses, query)
+        if [row['name'] for row in result['items']] != expected_names or result['total'] != expected_total:
+            print(f'{name}: result differs from the reference filter')
+            sys.exit(1)
+        samples = []
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            store.query_args(query)
+            samples.append(time.perf_counter() - start)
+        samples = np.array(samples) * 1e3
+        print(f'{name:<30} {result["total"]:>8} {samples.mean():>9.3f} {samples.max():>8.3f}')
+
+
+if __name__ == '__main__':
+    main()
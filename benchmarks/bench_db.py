@@ -0,0 +1,126 @@
+"""Concurrent write throughput: per-call sqlite3.connect vs the pooled WAL Database.
+
+Each writer thread saves results and reads the user's history back, the way /submit_profile
+and /my-results do. The legacy path opens a new connection with the default rollback
+journal for every call, like pathfinder_app.py did before db.py. The write-behind column
+queues results on a ResultWriter and includes the time to flush the queue at the end.
+
+    python benchmarks/bench_db.py [--writers 1 4 8] [--ops 300]
+"""
+import argparse
+import os
+import sqlite3
+import sys
+import tempfile
+import threading
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import db
+from result_writer import ResultWriter
+
+PROFILE = {'age': 16, 'percentage': 82.0, 'interests': ['Technology'], 'skills': ['Programming']}
+
+
+class LegacyDatabase:
+    """Connection-per-call access with default settings"""
+
+    def __init__(self, path):
+        self.path = path
+
+    def save_user_result(self, user_id, predicted_career, profile_data):
+        conn = sqlite3.connect(self.path)
+        conn.execute(db.INSERT_RESULT, (user_id, predicted_career, str(profile_data), None, None))
+        conn.commit()
+        conn.close()
+
+    def get_user_results(self, user_id):
+        conn = sqlite3.connect(self.path)
+        rows = conn.execute('''
+            SELECT predicted_career, profile_data, created_at
+            FROM user_results
+            WHERE user_id = ?
+            ORDER BY created_at DESC
+        ''', (user_id,)).fetchall()
+        conn.close()
+        return rows
+
+
+class WriteBehindDatabase:
+    """Pooled Database with saves going through a ResultWriter"""
+
+    def __init__(self, path):
+        self.database = db.Database(path)
+        self.writer = ResultWriter(self.database).start()
+
+    def save_user_result(self, user_id, predicted_career, profile_data):
+        self.writer.submit(user_id, predicted_career, profile_data)
+
+    def get_user_results(self, user_id):
+        return self.database.get_user_results(user_id)
+
+    def flush(self):
+        self.writer.flush()
+
+    def close(self):
+        self.writer.close()
+        self.database.close()
+
+
+def run(database, writers, ops):
+    errors = []
+
+    def work(user_id):
+        for i in range(ops):
+            try:
+                database.save_user_result(user_id, 'Software Engineer', PROFILE)
+                if i % 10 == 0:
+                    database.get_user_results(user_id)
+            except sqlite3.OperationalError as e:
+                errors.append(str(e))
+
+    threads = [threading.Thread(target=work, args=(user_id,)) for user_id in range(1, writers + 1)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    if hasattr(database, 'flush'):
+        database.flush()
+    elapsed = time.perf_counter() - start
+    return writers * ops / elapsed, len(errors)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--writers', type=int, nargs='+', default=[1, 4, 8])
+    parser.add_argument('--ops', type=int, default=300, help='results saved per writer')
+    args = parser.parse_args()
+
+    print(f'{"writers":>7} {"legacy ops/s":>13} {"errors":>7} {"pooled ops/s":>13} {"errors":>7} '
+          f'{"write-behind ops/s":>19} {"errors":>7}')
+    for writers in args.writers:
+        row = []
+        for make in (LegacyDatabase, db.Database, WriteBehindDatabase):
+            with tempfile.TemporaryDirectory() as tmp:
+                path = os.path.join(tmp, 'bench.db')
+                setup = db.Database(path)
+                setup.init_schema()
+                setup.close()
+                if make is LegacyDatabase:
+                    # The schema setup switched the file to WAL; go back to the default journal
+                    conn = sqlite3.connect(path)
+                    conn.execute('PRAGMA journal_mode = DELETE')
+                    conn.close()
+                database = make(path)
+                row.extend(run(database, writers, args.ops))
+                if hasattr(database, 'close'):
+                    database.close()
+        print(f'{writers:>7} {row[0]:>13.0f} {row[1]:>7} {row[2]:>13.0f} {row[3]:>7} '
+              f'{row[4]:>19.0f} {row[5]:>7}')
+
+
+if __name__ == '__main__':
+    main()
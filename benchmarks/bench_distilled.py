@@ -0,0 +1,137 @@
+"""Escalation rate, agreement and latency of the distilled fast path on assessment traffic.
+
+Traffic is the profiles saved in a Pathfinder database (--db, the user_results table) or,
+without one, generated profiles (--traffic): random web-form profiles like the ones
+bench_routes.py submits, or synthetic_profiles.py profiles around the dataset's rows. For each
+confidence threshold it reports how many profiles the distilled tree sends to the forest,
+how often the cascade's top career matches the forest's, and the mean/p50 time to encode a
+profile and rank its top careers (the serving path of /predict and /submit_profile) with the
+forest alone and with the cascade.
+
+A model trained by train_model.py carries its distilled tree. For a model without one (such
+as an older career_predictor.pkl), the tree is distilled here on synthetic profiles first.
+
+    python benchmarks/bench_distilled.py [--model ml_model/career_predictor.pkl] [--db pathfinder.db]
+        [--traffic form|synthetic]
+"""
+import argparse
+import json
+import os
+import random
+import sqlite3
+import sys
+import time
+import warnings
+from dataclasses import replace
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from benchmarks.bench_routes import random_profile
+from distilled_model import DEFAULT_MAX_DEPTH, CascadePredictor, DistilledModel
+from feature_encoder import parse_labels
+from model_registry import load_model_handle
+from synthetic_profiles import CareersSchema
+
+THRESHOLDS = '0.8,0.9,0.95,0.99'
+
+
+def saved_profiles(db_path, rows):
+    conn = sqlite3.connect(f'file:{db_path}?mode=ro', uri=True)
+    texts = [text for (text,) in conn.execute(
+        'SELECT profile_data FROM user_results ORDER BY id DESC LIMIT ?', (rows,))]
+    conn.close()
+    profiles = []
+    for text in texts:
+        try:
+            profile = json.loads(text)
+        except (TypeError, ValueError):
+            continue
+        if isinstance(profile, dict):
+            profiles.append(profile)
+    return profiles
+
+
+def synthetic_profile_dicts(rows, seed):
+    """synthetic_profiles.py careers rows as the profile dicts the app encodes"""
+    df = CareersSchema(os.path.join(ROOT, 'datasets', 'careers_dataset.csv')).block(np.random.default_rng(seed), rows)
+    profiles = []
+    for record in df.to_dict('records'):
+        for field in ('interests', 'skills', 'hobbies'):
+            record[field] = parse_labels(record[field])
+        profiles.append(record)
+    return profiles
+
+
+def traffic_profiles(args):
+    if args.db:
+        profiles = saved_profiles(args.db, args.rows)
+        if profiles:
+            return profiles, f'{len(profiles)} saved profiles from {args.db}'
+        print(f'No JSON profiles in {args.db}, using {args.traffic} profiles')
+    if args.traffic == 'synthetic':
+        return synthetic_profile_dicts(args.rows, args.seed), f'{args.rows} synthetic profiles'
+    rng = random.Random(args.seed)
+    return [random_profile(rng) for _ in range(args.rows)], f'{args.rows} random web-form profiles'
+
+
+def serving_ms(handle, profiles, k=3):
+    """Per-profile ms to encode and rank the top k careers, one profile at a time"""
+    samples = []
+    for profile in profiles:
+        start = time.perf_counter()
+        handle.top_k(handle.encoder.encode(profile), k)
+        samples.append(time.perf_counter() - start)
+    return np.array(samples) * 1e3
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--model', default=os.path.join(ROOT, 'ml_model', 'career_predictor.pkl'))
+    parser.add_argument('--db', help='Pathfinder database whose saved profiles are the traffic')
+    parser.add_argument('--traffic', choices=('form', 'synthetic'), default='form',
+                        help='profiles to generate without --db (default %(default)s)')
+    parser.add_argument('--rows', type=int, default=2000, help='traffic profiles to evaluate')
+    parser.add_argument('--thresholds', default=THRESHOLDS, help='comma-separated confidence thresholds')
+    parser.add_argument('--flat-forest', action='store_true', help='compare against FlatForest instead of sklearn')
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        forest = load_model_handle(args.model, flat_forest=args.flat_forest)
+    distilled = forest.bundle.get('distilled')
+    if distilled is None:
+        from train_model import DISTILL_ROWS, distillation_features
+        X_distill = distillation_features(os.path.join(ROOT, 'datasets', 'careers_dataset.csv'),
+                                          forest.bundle, DISTILL_ROWS, seed=1)
+        distilled = DistilledModel.fit(forest.predictor, X_distill, max_depth=DEFAULT_MAX_DEPTH)
+        print(f'{args.model} has no distilled tree; distilled one on {len(X_distill)} unlabelled profiles')
+
+    profiles, source = traffic_profiles(args)
+    X, errors = forest.encoder.encode_many(profiles)
+    X = X[[error is None for error in errors]]
+    print(f'Traffic: {source}; distilled tree with {distilled.n_leaves} leaves; '
+          f'forest: {type(forest.predictor).__name__}')
+
+    forest_top = forest.predictor.predict_proba(X).argmax(axis=1)
+    confidence = distilled.predict_proba(X)[1]
+    forest_ms = serving_ms(forest, profiles)
+    print(f'{"threshold":>9} {"escalated":>9} {"agreement":>9} {"fast agree":>10} '
+          f'{"forest ms":>9} {"cascade ms":>10} {"p50 forest/cascade":>18} {"saved":>6}')
+    for threshold in (float(t) for t in args.thresholds.split(',')):
+        cascade = replace(forest, predictor=CascadePredictor(distilled, forest.predictor, threshold))
+        agrees = cascade.predictor.predict_proba(X).argmax(axis=1) == forest_top
+        fast = confidence >= threshold
+        fast_agreement = f'{agrees[fast].mean():.2%}' if fast.any() else '-'
+        cascade_ms = serving_ms(cascade, profiles)
+        p50 = f'{np.percentile(forest_ms, 50):.3f}/{np.percentile(cascade_ms, 50):.3f}'
+        print(f'{threshold:>9.2f} {1 - fast.mean():>9.1%} {agrees.mean():>9.2%} {fast_agreement:>10} '
+              f'{forest_ms.mean():>9.3f} {cascade_ms.mean():>10.3f} {p50:>18} '
+              f'{1 - cascade_ms.mean() / forest_ms.mean():>6.0%}')
+
+
+if __name__ == '__main__':
+    main()
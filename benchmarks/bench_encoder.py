@@ -0,0 +1,94 @@
+"""Compare per-request feature encoding: sklearn transformers vs FeatureEncoder.
+
+Checks that both produce identical rows for generated profiles, then reports the mean
+encode time per profile for each path.
+
+    python benchmarks/bench_encoder.py [--profiles 2000] [--seed 42]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+import warnings
+
+import joblib
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from feature_encoder import FeatureEncoder, QUIZ_FIELDS
+
+
+def random_profiles(bundle, n, seed):
+    rng = random.Random(seed)
+    interests = list(bundle['mlb_interests'].classes_)
+    skills = list(bundle['mlb_skills'].classes_)
+    hobbies = list(bundle['mlb_hobbies'].classes_)
+    profiles = []
+    for _ in range(n):
+        profile = {
+            'age': rng.randint(14, 20),
+            'percentage': rng.randint(30, 100),
+            'interests': rng.sample(interests, rng.randint(0, 3)),
+            'skills': rng.sample(skills, rng.randint(0, 3)),
+            'hobbies': rng.sample(hobbies, rng.randint(0, 2)),
+            'personality': rng.choice(bundle['le_personality'].classes_),
+            'work_style': rng.choice(bundle['le_work_style'].classes_),
+        }
+        for field in QUIZ_FIELDS:
+            profile[field] = rng.randint(1, 5)
+        profiles.append(profile)
+    return profiles
+
+
+def sklearn_encode(bundle, data):
+    """The per-request encoding pathfinder_app.py used before FeatureEncoder"""
+    return np.hstack([
+        [[data['age'], data['percentage']]],
+        bundle['mlb_interests'].transform([data['interests']]),
+        bundle['mlb_skills'].transform([data['skills']]),
+        bundle['mlb_hobbies'].transform([data['hobbies']]),
+        bundle['le_personality'].transform([data['personality']]).reshape(1, -1),
+        bundle['le_work_style'].transform([data['work_style']]).reshape(1, -1),
+        [[data[field] for field in QUIZ_FIELDS]]
+    ])
+
+
+def time_per_call(fn, profiles):
+    start = time.perf_counter()
+    for data in profiles:
+        fn(data)
+    return (time.perf_counter() - start) / len(profiles)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--model', default=os.path.join(ROOT, 'ml_model', 'career_predictor.pkl'))
+    parser.add_argument('--profiles', type=int, default=2000)
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    bundle = joblib.load(args.model)
+    encoder = FeatureEncoder.from_bundle(bundle)
+    profiles = random_profiles(bundle, args.profiles, args.seed)
+
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        for data in profiles:
+            expected = sklearn_encode(bundle, data)
+            actual = encoder.encode(data)
+            if not np.array_equal(expected, actual):
+                sys.exit(f'Encoding mismatch for {data}:\n{expected}\n{actual}')
+        print(f'{len(profiles)} profiles encode identically')
+
+        sklearn_time = time_per_call(lambda data: sklearn_encode(bundle, data), profiles)
+    encoder_time = time_per_call(encoder.encode, profiles)
+    print(f'sklearn transformers: {sklearn_time * 1e6:8.1f} us/profile')
+    print(f'FeatureEncoder:       {encoder_time * 1e6:8.1f} us/profile '
+          f'({sklearn_time / encoder_time:.0f}x faster)')
+
+
+if __name__ == '__main__':
+    main()
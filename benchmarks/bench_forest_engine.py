@@ -0,0 +1,93 @@
+"""Check FlatForest against the sklearn forest and compare their latency.
+
+Equivalence is checked on encoded random profiles and on random feature matrices that cover
+the whole range of every column, then single-row and small-batch latency is reported for
+clf.predict and FlatForest.predict.
+
+    python benchmarks/bench_forest_engine.py [--rows 5000] [--repeat 200] [--seed 42]
+"""
+import argparse
+import os
+import sys
+import time
+import warnings
+
+import joblib
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from benchmarks.bench_encoder import random_profiles
+from feature_encoder import FeatureEncoder
+from forest_engine import FlatForest
+
+
+def random_matrix(encoder, n, rng):
+    """Feature rows with every column drawn from (slightly beyond) its valid range"""
+    X = rng.integers(0, 2, size=(n, encoder.n_features)).astype(float)
+    X[:, 0] = rng.integers(10, 25, size=n)
+    X[:, 1] = rng.uniform(0, 100, size=n).round(1)
+    X[:, encoder.personality_column] = rng.integers(0, len(encoder.personality_codes), size=n)
+    X[:, encoder.work_style_column] = rng.integers(0, len(encoder.work_style_codes), size=n)
+    X[:, encoder.quiz_start:] = rng.integers(1, 6, size=(n, encoder.n_features - encoder.quiz_start))
+    return X
+
+
+def check_equivalent(clf, forest, X):
+    expected_proba = clf.predict_proba(X)
+    actual_proba = forest.predict_proba(X)
+    if not np.allclose(expected_proba, actual_proba, rtol=0, atol=1e-9):
+        worst = np.abs(expected_proba - actual_proba).max()
+        sys.exit(f'predict_proba differs by up to {worst}')
+    # Exact ties could break differently after float summation, so only compare the rest
+    top2 = np.sort(expected_proba, axis=1)[:, -2:]
+    clear = top2[:, 1] - top2[:, 0] > 1e-9
+    if not np.array_equal(clf.predict(X)[clear], forest.predict(X)[clear]):
+        sys.exit('predict differs')
+    return int((~clear).sum())
+
+
+def latency(fn, X, repeat):
+    fn(X)
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn(X)
+    return (time.perf_counter() - start) / repeat
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--model', default=os.path.join(ROOT, 'ml_model', 'career_predictor.pkl'))
+    parser.add_argument('--rows', type=int, default=5000)
+    parser.add_argument('--repeat', type=int, default=200)
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        bundle = joblib.load(args.model)
+    clf = bundle['model']
+    encoder = FeatureEncoder.from_bundle(bundle)
+    forest = FlatForest.from_sklearn(clf)
+    print(f'{forest.n_trees} trees, {len(forest.feature)} nodes, max depth {forest.max_depth}, '
+          f'{forest.nbytes / 1024:.0f} KiB')
+
+    rng = np.random.default_rng(args.seed)
+    X_profiles, _ = encoder.encode_many(random_profiles(bundle, args.rows, args.seed))
+    X_random = random_matrix(encoder, args.rows, rng)
+    for name, X in (('encoded profiles', X_profiles), ('random matrix', X_random)):
+        ties = check_equivalent(clf, forest, X)
+        print(f'{name}: {len(X)} rows match predict_proba/predict ({ties} exact ties skipped)')
+
+    print(f'{"batch":>6} {"sklearn ms":>11} {"flat ms":>9} {"speedup":>8}')
+    for size in (1, 10, 100):
+        X = X_profiles[:size]
+        sklearn_time = latency(clf.predict, X, args.repeat)
+        flat_time = latency(forest.predict, X, args.repeat)
+        print(f'{size:>6} {sklearn_time * 1e3:>11.3f} {flat_time * 1e3:>9.3f} '
+              f'{sklearn_time / flat_time:>7.1f}x')
+
+
+if __name__ == '__main__':
+    main()
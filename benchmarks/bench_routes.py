@@ -0,0 +1,205 @@
+"""Per-route latency and allocation benchmark driven through the Flask test client.
+
+Imports pathfinder_app against a temporary database, logs a benchmark user in and times
+each route with a fixed random seed, then writes a JSON report:
+
+    python benchmarks/bench_routes.py --output bench_routes.json
+    python benchmarks/bench_routes.py --compare bench_routes.json   # exit 1 on regressions
+
+Latency percentiles come from a timing pass; allocations (peak traced bytes per request)
+from a separate pass under tracemalloc, so tracing does not skew the timings.
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+import warnings
+from datetime import datetime
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+INTERESTS = ['Technology', 'Science', 'Business', 'Arts', 'Engineering']
+SKILLS = ['Programming', 'Communication', 'Leadership', 'Creativity', 'Medical Knowledge', 'Technical Skills']
+HOBBIES = ['Reading', 'Music', 'Gaming', 'Drawing', 'Sports']
+CAREERS = ['Software Engineer', 'B.Tech Computer Science', 'Medical Doctor', 'Business Manager',
+           'Engineering - Alternative Paths Available', 'Unknown Career']
+
+
+def random_profile(rng):
+    profile = {
+        'name': 'Bench User',
+        'age': rng.randint(14, 20),
+        'education_level': rng.choice(['10th', '12th', 'Other']),
+        'percentage': rng.randint(35, 99),
+        'interests': rng.sample(INTERESTS, rng.randint(1, 3)),
+        'skills': rng.sample(SKILLS, rng.randint(1, 3)),
+        'hobbies': rng.sample(HOBBIES, rng.randint(1, 2)),
+        'personality': rng.choice(['Introvert', 'Extrovert', 'Ambivert']),
+        'work_style': rng.choice(['Analytical', 'Creative', 'Leadership', 'Patient']),
+    }
+    for i in range(1, 11):
+        profile[f'quiz_q{i}'] = rng.randint(1, 5)
+    return profile
+
+
+def make_requests(client, rng, profiles=64):
+    """Map route name -> callable issuing one request; each call uses the next profile"""
+    pool = [random_profile(rng) for _ in range(profiles)]
+    counter = {'i': 0}
+
+    def next_profile():
+        counter['i'] += 1
+        return pool[counter['i'] % len(pool)]
+
+    def next_career():
+        return CAREERS[counter['i'] % len(CAREERS)]
+
+    def career():
+        counter['i'] += 1
+        return client.get(f'/career/{next_career()}')
+
+    etag = client.get('/courses').headers.get('ETag')
+
+    return {
+        'POST /predict': lambda: client.post('/predict', json=next_profile()),
+        'POST /submit_profile': lambda: client.post('/submit_profile', data=next_profile()),
+        'GET /results': lambda: client.get('/results', follow_redirects=True),
+        'GET /courses': lambda: client.get('/courses'),
+        'GET /courses (304)': lambda: client.get('/courses', headers={'If-None-Match': etag}),
+        'GET /skills': lambda: client.get('/skills'),
+        'GET /career/<name>': career,
+    }
+
+
+def time_route(request, iterations, warmup):
+    for _ in range(warmup):
+        request()
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        response = request()
+        samples.append(time.perf_counter() - start)
+        if response.status_code >= 400:
+            raise RuntimeError(f'request failed with {response.status_code}')
+    return np.array(samples) * 1e3
+
+
+def allocations(request, iterations):
+    peaks = []
+    tracemalloc.start()
+    try:
+        for _ in range(iterations):
+            tracemalloc.reset_peak()
+            baseline = tracemalloc.get_traced_memory()[0]
+            request()
+            peaks.append(tracemalloc.get_traced_memory()[1] - baseline)
+    finally:
+        tracemalloc.stop()
+    return float(np.mean(peaks))
+
+
+def run(iterations, warmup, seed):
+    os.chdir(ROOT)
+    tmp = tempfile.mkdtemp(prefix='pathfinder-bench-')
+    os.environ['PATHFINDER_DB'] = os.path.join(tmp, 'bench.db')
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        import pathfinder_app
+
+    rng = random.Random(seed)
+    client = pathfinder_app.app.test_client()
+    user_id = pathfinder_app.create_user('Bench', 'User', 'bench@example.com', 'benchmark', 16, '10th')
+    with client.session_transaction() as sess:
+        sess['user_id'] = user_id
+        sess['user_name'] = 'Bench User'
+    # /results needs a submitted profile in the session
+    client.post('/submit_profile', data=random_profile(rng))
+
+    routes = {}
+    for name, request in make_requests(client, rng).items():
+        samples = time_route(request, iterations, warmup)
+        routes[name] = {
+            'p50_ms': round(float(np.percentile(samples, 50)), 4),
+            'p95_ms': round(float(np.percentile(samples, 95)), 4),
+            'p99_ms': round(float(np.percentile(samples, 99)), 4),
+            'mean_ms': round(float(samples.mean()), 4),
+            'peak_alloc_kib': round(allocations(request, max(iterations // 10, 10)) / 1024, 1),
+        }
+    return {
+        'meta': {
+            'created': datetime.now().isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'iterations': iterations,
+            'seed': seed,
+        },
+        'routes': routes,
+    }
+
+
+def compare(report, baseline, threshold):
+    """Print a comparison table and return the list of regressed (route, metric) pairs"""
+    regressions = []
+    print(f'{"route":<22} {"metric":<15} {"baseline":>10} {"current":>10} {"change":>8}')
+    for route, metrics in report['routes'].items():
+        base = baseline['routes'].get(route)
+        if base is None:
+            continue
+        for metric in ('p50_ms', 'p95_ms', 'p99_ms', 'peak_alloc_kib'):
+            if not base.get(metric):
+                continue
+            change = metrics[metric] / base[metric] - 1
+            flag = ''
+            # p99 is too noisy on short runs to gate on; it is reported only
+            if change > threshold and metric != 'p99_ms':
+                regressions.append((route, metric))
+                flag = '  REGRESSION'
+            print(f'{route:<22} {metric:<15} {base[metric]:>10} {metrics[metric]:>10} {change:>+8.0%}{flag}')
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--iterations', type=int, default=300)
+    parser.add_argument('--warmup', type=int, default=20)
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--output', help='write the JSON report to this file')
+    parser.add_argument('--compare', metavar='BASELINE', help='JSON report to compare against')
+    parser.add_argument('--threshold', type=float, default=0.25,
+                        help='relative slowdown flagged as a regression (default 0.25 = 25%%)')
+    args = parser.parse_args()
+    # run() changes into the repository root, so resolve paths first
+    output = args.output and os.path.abspath(args.output)
+    baseline_path = args.compare and os.path.abspath(args.compare)
+
+    report = run(args.iterations, args.warmup, args.seed)
+    print(f'{"route":<22} {"p50 ms":>8} {"p95 ms":>8} {"p99 ms":>8} {"alloc KiB":>10}')
+    for route, metrics in report['routes'].items():
+        print(f'{route:<22} {metrics["p50_ms"]:>8.3f} {metrics["p95_ms"]:>8.3f} '
+              f'{metrics["p99_ms"]:>8.3f} {metrics["peak_alloc_kib"]:>10.1f}')
+    if output:
+        with open(output, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f'Report written to {output}')
+
+    if baseline_path:
+        with open(baseline_path) as f:
+            baseline = json.load(f)
+        print()
+        regressions = compare(report, baseline, args.threshold)
+        if regressions:
+            print(f'{len(regressions)} regression(s) over {args.threshold:.0%}')
+            sys.exit(1)
+        print('No regressions')
+
+
+if __name__ == '__main__':
+    main()
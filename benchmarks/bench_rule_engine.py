@@ -0,0 +1,77 @@
+"""Time the fallback rules one profile at a time and in bulk.
+
+Evaluates every combination of the interests and skills the rules test (plus one label they
+ignore), every education level and a percentage grid that covers each breakpoint and the
+values just below it, with RuleEngine.recommend and RuleEngine.score, and checks that the
+two agree. tests/test_rule_engine.py checks the rules against the hand-written cascades they
+replaced.
+
+    python benchmarks/bench_rule_engine.py [--step 0.5]
+"""
+import argparse
+import itertools
+import os
+import sys
+import time
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from rule_engine import RuleEngine
+
+INTERESTS = ['Technology', 'Science', 'Commerce', 'Business', 'Arts', 'Engineering', 'Music']
+SKILLS = ['Programming', 'Creativity', 'Technical Skills', 'Leadership', 'Communication']
+LEVELS = ['10th', '12th', 'Graduate']
+
+
+def subsets(labels):
+    return [list(combo) for n in range(len(labels) + 1) for combo in itertools.combinations(labels, n)]
+
+
+def percentage_grid(engine, step):
+    breakpoints = {b for table in engine.tables.values() for rule in table for b in rule[2]}
+    grid = set(np.arange(0, 100 + step, step).tolist())
+    grid |= breakpoints | {np.nextafter(b, -np.inf) for b in breakpoints}
+    return sorted(grid) + [float('nan')]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--step', type=float, default=0.5, help='percentage grid spacing')
+    args = parser.parse_args()
+
+    engine = RuleEngine.from_file(os.path.join(ROOT, 'datasets', 'fallback_rules.json'))
+
+    profiles = [{'interests': interests, 'skills': skills, 'percentage': percentage,
+                 'education_level': level}
+                for level in LEVELS
+                for interests in subsets(INTERESTS)
+                for skills in subsets(SKILLS)
+                for percentage in percentage_grid(engine, args.step)]
+    print(f'{len(profiles)} profiles in the grid')
+
+    start = time.perf_counter()
+    single = [engine.recommend(profile) for profile in profiles]
+    single_seconds = time.perf_counter() - start
+
+    arrays = engine.encode(profiles)
+    start = time.perf_counter()
+    codes = engine.score(*arrays)
+    bulk_seconds = time.perf_counter() - start
+    bulk = [engine.careers[code] for code in codes]
+
+    for profile, want, got in zip(profiles, single, bulk):
+        if want != got:
+            print(f'score mismatch for {profile}: recommend gives {want!r}, score {got!r}')
+            sys.exit(1)
+
+    print(f'{"path":<28} {"total s":>9} {"per profile us":>15}')
+    for name, seconds in (('RuleEngine.recommend', single_seconds),
+                          ('RuleEngine.score (arrays)', bulk_seconds)):
+        print(f'{name:<28} {seconds:>9.3f} {seconds / len(profiles) * 1e6:>15.3f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,83 @@
+"""Compare request size and latency of the cookie, memory and SQLite session backends.
+
+For each backend, logs a user in through the Flask test client and submits an assessment so
+the session holds a profile and its ranked careers. Then it reports:
+- the Cookie header the browser sends back on every request
+- the Set-Cookie bytes of the submit response
+- the bytes stored on the server
+- p50 latency of a static page (/about) and of the stored result page the submission redirects to
+
+    python benchmarks/bench_sessions.py [--iterations 500]
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+import warnings
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from bench_routes import random_profile
+
+
+def p50_ms(client, path, iterations):
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        response = client.get(path)
+        samples.append(time.perf_counter() - start)
+        if response.status_code != 200:
+            raise RuntimeError(f'GET {path} returned {response.status_code}')
+    return float(np.percentile(samples, 50)) * 1e3
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--iterations', type=int, default=500)
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    os.chdir(ROOT)
+    os.environ['PATHFINDER_DB'] = os.path.join(tempfile.mkdtemp(prefix='pathfinder-bench-'), 'bench.db')
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        import pathfinder_app
+    from session_store import MemorySessionStore, SQLiteSessionStore, ServerSessionInterface
+
+    app = pathfinder_app.app
+    cookie_interface = app.session_interface
+    backends = {
+        'cookie': cookie_interface,
+        'memory': ServerSessionInterface(MemorySessionStore()),
+        'sqlite': ServerSessionInterface(SQLiteSessionStore(pathfinder_app.db)),
+    }
+    profile = random_profile(random.Random(args.seed))
+
+    print(f'{"backend":<8} {"Cookie B":>9} {"Set-Cookie B":>13} {"stored B":>9} '
+          f'{"/about p50 ms":>14} {"/results p50 ms":>16}')
+    for name, interface in backends.items():
+        app.session_interface = interface
+        email = f'bench-{name}@example.com'
+        pathfinder_app.create_user('Bench', 'User', email, 'benchmark', 16, '10th')
+        client = app.test_client()
+        client.post('/login', data={'email': email, 'password': 'benchmark'})
+        submit = client.post('/submit_profile', data=profile)
+        set_cookie = sum(len(value) for value in submit.headers.getlist('Set-Cookie'))
+        cookie = client.get_cookie(app.config['SESSION_COOKIE_NAME'])
+        cookie_header = len(f'{cookie.key}={cookie.value}')
+
+        stored = 0 if name == 'cookie' else len(interface.store.load(cookie.value)[0])
+        print(f'{name:<8} {cookie_header:>9} {set_cookie:>13} {stored:>9} '
+              f'{p50_ms(client, "/about", args.iterations):>14.3f} '
+              f'{p50_ms(client, submit.headers["Location"], args.iterations):>16.3f}')
+    app.session_interface = cookie_interface
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,155 @@
+"""Throughput of serve.py as the number of gunicorn workers grows.
+
+For each worker count, starts `serve.py` on a free port against a temporary database and waits
+for GET /ready. Then client processes (each with a keep-alive connection) send a fixed-seed mix
+of POST /predict, GET /courses and GET /career/<name> for --duration seconds. Prints requests
+per second, p50/p99 latency and the speed-up over one worker:
+
+    python benchmarks/load_test.py --workers 1,2,4 --clients 8 --duration 10
+
+Run the clients on another machine (or give the server more cores than the clients need) to
+measure the server rather than the load generator.
+"""
+import argparse
+import http.client
+import json
+import multiprocessing
+import os
+import random
+import signal
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from urllib.parse import quote
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from bench_routes import random_profile
+from career_catalog import catalog
+
+READY_TIMEOUT = 120  # seconds to wait for the server to load the model
+# Careers with a detail page, so /career/<name> never falls back to the generic record
+CAREERS = tuple(catalog.names())
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+
+def wait_ready(port, process):
+    deadline = time.monotonic() + READY_TIMEOUT
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f'server exited with {process.returncode}')
+        try:
+            conn = http.client.HTTPConnection('127.0.0.1', port, timeout=2)
+            conn.request('GET', '/ready')
+            if conn.getresponse().status == 200:
+                return
+        except OSError:
+            pass
+        time.sleep(0.2)
+    raise RuntimeError(f'server not ready after {READY_TIMEOUT}s')
+
+
+def make_requests(rng, count):
+    """A shuffled mix: half predictions, the rest catalog pages"""
+    requests = []
+    for i in range(count):
+        if i % 2 == 0:
+            body = json.dumps(random_profile(rng))
+            requests.append(('POST', '/predict', body, {'Content-Type': 'application/json'}))
+        elif i % 4 == 1:
+            requests.append(('GET', '/courses', None, {}))
+        else:
+            career = quote(rng.choice(CAREERS))
+            requests.append(('GET', f'/career/{career}', None, {}))
+    rng.shuffle(requests)
+    return requests
+
+
+def client(port, seed, duration, results):
+    """Send requests on one keep-alive connection until duration runs out"""
+    requests = make_requests(random.Random(seed), 500)
+    conn = http.client.HTTPConnection('127.0.0.1', port, timeout=30)
+    latencies, errors = [], 0
+    deadline = time.perf_counter() + duration
+    i = 0
+    while time.perf_counter() < deadline:
+        method, path, body, headers = requests[i % len(requests)]
+        i += 1
+        start = time.perf_counter()
+        try:
+            conn.request(method, path, body=body, headers=headers)
+            response = conn.getresponse()
+            response.read()
+            if response.status >= 400:
+                errors += 1
+        except (OSError, http.client.HTTPException):
+            errors += 1
+            conn.close()
+            conn = http.client.HTTPConnection('127.0.0.1', port, timeout=30)
+            continue
+        latencies.append(time.perf_counter() - start)
+    results.put((latencies, errors))
+
+
+def run(workers, threads, clients, duration, seed):
+    port = free_port()
+    env = dict(os.environ, PATHFINDER_DB=os.path.join(tempfile.mkdtemp(prefix='pathfinder-load-'), 'load.db'))
+    process = subprocess.Popen(
+        [sys.executable, '-W', 'ignore', 'serve.py', '--bind', f'127.0.0.1:{port}',
+         '--workers', str(workers), '--threads', str(threads)],
+        cwd=ROOT, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        wait_ready(port, process)
+        results = multiprocessing.Queue()
+        procs = [multiprocessing.Process(target=client, args=(port, seed + i, duration, results))
+                 for i in range(clients)]
+        for p in procs:
+            p.start()
+        collected = [results.get() for _ in procs]
+        for p in procs:
+            p.join()
+    finally:
+        process.send_signal(signal.SIGTERM)
+        process.wait(timeout=60)
+    latencies = np.concatenate([np.array(l) for l, _ in collected]) * 1e3
+    return {
+        'workers': workers,
+        'requests_per_second': len(latencies) / duration,
+        'p50_ms': float(np.percentile(latencies, 50)),
+        'p99_ms': float(np.percentile(latencies, 99)),
+        'errors': sum(e for _, e in collected),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--workers', default='1,2,4', help='comma-separated worker counts')
+    parser.add_argument('--threads', type=int, default=1)
+    parser.add_argument('--clients', type=int, default=8, help='concurrent client processes')
+    parser.add_argument('--duration', type=float, default=10.0, help='seconds per worker count')
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    print(f'{os.cpu_count()} CPUs, {args.clients} clients, {args.threads} thread(s) per worker')
+    print(f'{"workers":>7} {"req/s":>9} {"p50 ms":>8} {"p99 ms":>8} {"errors":>7} {"speed-up":>9}')
+    baseline = None
+    for workers in (int(w) for w in args.workers.split(',')):
+        r = run(workers, args.threads, args.clients, args.duration, args.seed)
+        baseline = baseline or r['requests_per_second']
+        print(f'{r["workers"]:>7} {r["requests_per_second"]:>9.1f} {r["p50_ms"]:>8.2f} '
+              f'{r["p99_ms"]:>8.2f} {r["errors"]:>7} {r["requests_per_second"] / baseline:>8.2f}x')
+
+
+if __name__ == '__main__':
+    main()
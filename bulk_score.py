@@ -0,0 +1,190 @@
+"""Score a cohort CSV file with the career model.
+
+Reads a CSV in the datasets/careers_dataset.csv layout (label fields comma-separated) in
+chunks, encodes and scores each chunk in a pool of worker processes and writes the predicted
+career with the top-k probabilities for every row, in input order:
+
+    python bulk_score.py students.csv predictions.csv
+    python bulk_score.py students.csv predictions.parquet --top-k 5 --workers 8
+
+The model is loaded once in the parent. Where processes are forked the workers share it
+copy-on-write (an artifact directory is also shared through the page cache); elsewhere each
+worker loads it once in its initializer. At most --max-in-flight chunks are read ahead of the
+writer, so memory stays bounded by chunk size, not file size. Parquet output needs pyarrow.
+"""
+import argparse
+import multiprocessing
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from model_registry import load_model_handle, top_k_indices
+
+DEFAULT_MODEL = 'ml_model/career_predictor.pkl'
+DEFAULT_CHUNK_SIZE = 10000
+# Input columns copied to the output to identify rows, when present
+ID_COLUMNS = ('id', 'student_id', 'name')
+
+# The model in this process: set by the parent before forking, or by _init_worker
+_handle = None
+
+
+def _init_worker(source, flat_forest):
+    global _handle
+    if _handle is None:
+        _handle = load_model_handle(source, flat_forest=flat_forest)
+
+
+def score_frame(handle, df, top_k, id_columns=()):
+    """Predictions for one chunk of input rows.
+
+    Returns a DataFrame with the id columns, predicted_career, top{i}_career and
+    top{i}_probability for i in 1..top_k, and error ('' for rows that were scored).
+    """
+    X, valid = handle.encoder.encode_frame(df)
+    out = pd.DataFrame({column: df[column].to_numpy() for column in id_columns}, index=df.index)
+    k = min(top_k, len(handle.columns))
+    careers = np.full((len(df), k), None, dtype=object)
+    probabilities = np.full((len(df), k), np.nan)
+    if valid.any():
+        proba = handle.predictor.predict_proba(X[valid])
+        top = top_k_indices(proba, k)
+        careers[valid] = handle.columns[top]
+        probabilities[valid] = np.take_along_axis(proba, top, axis=1).round(4)
+    out['predicted_career'] = careers[:, 0]
+    for i in range(k):
+        out[f'top{i + 1}_career'] = careers[:, i]
+        out[f'top{i + 1}_probability'] = probabilities[:, i]
+    out['error'] = np.where(valid, '', 'invalid age, percentage or quiz answer')
+    return out
+
+
+def _score_chunk(df, top_k, id_columns):
+    return score_frame(_handle, df, top_k, id_columns)
+
+
+class CsvWriter:
+    def __init__(self, path):
+        self.path = path
+        self.header = True
+
+    def write(self, frame):
+        frame.to_csv(self.path, mode='w' if self.header else 'a', header=self.header, index=False)
+        self.header = False
+
+    def close(self):
+        pass
+
+
+class ParquetWriter:
+    """Appends each chunk as a row group of one Parquet file"""
+
+    def __init__(self, path):
+        try:
+            import pyarrow
+            import pyarrow.parquet
+        except ImportError:
+            raise SystemExit('Parquet output needs pyarrow: pip install pyarrow')
+        self.pa = pyarrow
+        self.pq = pyarrow.parquet
+        self.path = path
+        self.writer = None
+
+    def write(self, frame):
+        table = self.pa.Table.from_pandas(frame, preserve_index=False)
+        if self.writer is None:
+            self.writer = self.pq.ParquetWriter(self.path, table.schema)
+        self.writer.write_table(table.cast(self.writer.schema))
+
+    def close(self):
+        if self.writer is not None:
+            self.writer.close()
+
+
+def open_writer(path, output_format=None):
+    output_format = output_format or ('parquet' if path.endswith(('.parquet', '.pq')) else 'csv')
+    return ParquetWriter(path) if output_format == 'parquet' else CsvWriter(path)
+
+
+def score_file(input_path, output_path, source=DEFAULT_MODEL, top_k=3, chunksize=DEFAULT_CHUNK_SIZE,
+               workers=None, max_in_flight=None, output_format=None, flat_forest=False):
+    """Score input_path into output_path; returns {'rows', 'invalid', 'seconds', 'rows_per_second'}"""
+    global _handle
+    if workers is None:
+        workers = os.cpu_count() or 1
+    max_in_flight = max_in_flight or 2 * max(workers, 1)
+    start = time.perf_counter()
+    _handle = load_model_handle(source, flat_forest=flat_forest)
+
+    # Label fields must stay strings; everything else is converted by the encoder
+    chunks = pd.read_csv(input_path, chunksize=chunksize, dtype=str, keep_default_na=False,
+                         na_values=[''])
+    writer = open_writer(output_path, output_format)
+    rows = invalid = 0
+
+    def write(frame):
+        nonlocal rows, invalid
+        writer.write(frame)
+        rows += len(frame)
+        invalid += int((frame['error'] != '').sum())
+
+    try:
+        if workers <= 1:
+            for df in chunks:
+                write(score_frame(_handle, df, top_k, [c for c in ID_COLUMNS if c in df]))
+        else:
+            methods = multiprocessing.get_all_start_methods()
+            context = multiprocessing.get_context('fork' if 'fork' in methods else None)
+            with ProcessPoolExecutor(workers, mp_context=context, initializer=_init_worker,
+                                     initargs=(source, flat_forest)) as pool:
+                pending = deque()
+                for df in chunks:
+                    pending.append(pool.submit(_score_chunk, df, top_k,
+                                               [c for c in ID_COLUMNS if c in df]))
+                    # Results are written in submission order; wait for the oldest chunk
+                    # before reading more once max_in_flight chunks are outstanding
+                    while len(pending) >= max_in_flight:
+                        write(pending.popleft().result())
+                while pending:
+                    write(pending.popleft().result())
+    finally:
+        writer.close()
+
+    seconds = time.perf_counter() - start
+    return {'rows': rows, 'invalid': invalid, 'seconds': round(seconds, 3),
+            'rows_per_second': round(rows / seconds, 1) if seconds else 0.0}
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Score a cohort CSV file with the career model')
+    parser.add_argument('input', help='CSV in the careers_dataset.csv layout')
+    parser.add_argument('output', help='output file (.csv, or .parquet with pyarrow installed)')
+    parser.add_argument('--model', default=DEFAULT_MODEL,
+                        help='career_predictor.pkl bundle or artifact directory (default %(default)s)')
+    parser.add_argument('--top-k', type=int, default=3)
+    parser.add_argument('--chunksize', type=int, default=DEFAULT_CHUNK_SIZE)
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1,
+                        help='scoring processes; 1 scores in this process (default %(default)s)')
+    parser.add_argument('--max-in-flight', type=int,
+                        help='chunks read ahead of the writer (default 2 x workers)')
+    parser.add_argument('--format', choices=('csv', 'parquet'), help='default: from the output extension')
+    parser.add_argument('--flat-forest', action='store_true', help='score with the FlatForest engine')
+    args = parser.parse_args()
+    if args.top_k < 1 or args.chunksize < 1:
+        parser.error('--top-k and --chunksize must be positive')
+
+    stats = score_file(args.input, args.output, source=args.model, top_k=args.top_k,
+                       chunksize=args.chunksize, workers=args.workers,
+                       max_in_flight=args.max_in_flight, output_format=args.format,
+                       flat_forest=args.flat_forest)
+    print(f"Scored {stats['rows']} rows ({stats['invalid']} invalid) in {stats['seconds']} s: "
+          f"{stats['rows_per_second']:.0f} rows/s", file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
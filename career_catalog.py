@@ -0,0 +1,219 @@
+"""Career catalog: the career detail records and an index for looking them up.
+
+The catalog is built once at import. Lookups are constant time for exact and normalized
+(case- and punctuation-insensitive) names, and prefix/typeahead search is a binary search
+over a sorted key list, so cost does not grow with the number of careers.
+"""
+import re
+from bisect import bisect_left
+from types import MappingProxyType
+
+CAREER_DETAILS = {
+    # 10th Grade Career Paths
+    'Computer Science (PCM) - Engineering Path': {
+        'description': 'Choose PCM (Physics, Chemistry, Mathematics) in 12th to pursue engineering careers.',
+        'skills_required': ['Mathematics', 'Physics', 'Chemistry', 'Problem Solving'],
+        'education': '12th with PCM, then B.Tech',
+        'salary_range': '₹4-20 LPA',
+        'job_outlook': 'Excellent - High demand',
+        'companies': ['Engineering Colleges', 'Universities'],
+        'courses': ['B.Tech Computer Science', 'B.Tech IT', 'BCA']
+    },
+    'Medical (PCB) - Pre-Medical Path': {
+        'description': 'Choose PCB (Physics, Chemistry, Biology) in 12th to pursue medical careers.',
+        'skills_required': ['Biology', 'Chemistry', 'Physics', 'Patient Care'],
+        'education': '12th with PCB, then MBBS/BDS',
+        'salary_range': '₹8-30 LPA',
+        'job_outlook': 'Excellent - Always in demand',
+        'companies': ['Medical Colleges', 'Hospitals'],
+        'courses': ['MBBS', 'BDS', 'BAMS', 'BHMS']
+    },
+    'Commerce (PCM/PCB) - Business Path': {
+        'description': 'Choose Commerce stream in 12th to pursue business and management careers.',
+        'skills_required': ['Mathematics', 'Business Studies', 'Economics', 'Leadership'],
+        'education': '12th Commerce, then BBA/B.Com',
+        'salary_range': '₹3-15 LPA',
+        'job_outlook': 'Good - Growing demand',
+        'companies': ['Business Schools', 'Universities'],
+        'courses': ['BBA', 'B.Com', 'BMS', 'CA Foundation']
+    },
+    'Design (Any Stream) - Creative Path': {
+        'description': 'Choose any stream in 12th to pursue creative and design careers.',
+        'skills_required': ['Creativity', 'Art', 'Design Thinking', 'Communication'],
+        'education': '12th any stream, then B.Des/BA',
+        'salary_range': '₹3-12 LPA',
+        'job_outlook': 'Good - Creative industry growth',
+        'companies': ['Design Institutes', 'Art Colleges'],
+        'courses': ['B.Des', 'BA Fine Arts', 'BA Design', 'Diploma in Design']
+    },
+    'Engineering - Alternative Paths Available': {
+        'description': 'With your percentage, you can still pursue engineering through alternative paths like diploma courses, ITI, or certificate programs.',
+        'skills_required': ['Mathematics', 'Physics', 'Problem Solving', 'Technical Aptitude'],
+        'education': '10th pass with 45%+, then diploma/ITI/certificate courses',
+        'salary_range': '₹2-8 LPA (after diploma/certificate)',
+        'job_outlook': 'Good - Technical skills in high demand',
+        'companies': ['Manufacturing Companies', 'Construction Firms', 'IT Companies', 'Government Departments'],
+        'courses': ['Diploma in Engineering', 'ITI Courses', 'Technical Certificates', 'Distance Learning']
+    },
+    
+    # 12th Grade Career Paths
+    'B.Tech Computer Science': {
+        'description': 'Bachelor of Technology in Computer Science - 4-year engineering degree.',
+        'skills_required': ['Programming', 'Mathematics', 'Problem Solving', 'Logic'],
+        'education': '12th PCM with good percentage',
+        'salary_range': '₹4-20 LPA',
+        'job_outlook': 'Excellent - High demand',
+        'companies': ['TCS', 'Infosys', 'Wipro', 'Google', 'Microsoft'],
+        'courses': ['B.Tech CS', 'B.Tech IT', 'BCA']
+    },
+    'MBBS (Medical)': {
+        'description': 'Bachelor of Medicine and Bachelor of Surgery - 5.5-year medical degree.',
+        'skills_required': ['Biology', 'Chemistry', 'Patient Care', 'Critical Thinking'],
+        'education': '12th PCB with NEET qualification',
+        'salary_range': '₹8-30 LPA',
+        'job_outlook': 'Excellent - Always in demand',
+        'companies': ['Hospitals', 'Medical Colleges', 'Research Institutes'],
+        'courses': ['MBBS', 'BDS', 'BAMS', 'BHMS']
+    },
+    'BBA (Bachelor of Business Administration)': {
+        'description': 'Bachelor of Business Administration - 3-year business management degree.',
+        'skills_required': ['Leadership', 'Communication', 'Business Acumen', 'Analytics'],
+        'education': '12th any stream with good percentage',
+        'salary_range': '₹3-12 LPA',
+        'job_outlook': 'Good - Growing demand',
+        'companies': ['Corporate Companies', 'Startups', 'Consulting Firms'],
+        'courses': ['BBA', 'BMS', 'B.Com', 'CA Foundation']
+    },
+    'B.Des (Bachelor of Design)': {
+        'description': 'Bachelor of Design - 4-year design degree for creative careers.',
+        'skills_required': ['Creativity', 'Design Thinking', 'Visual Communication', 'Art'],
+        'education': '12th any stream with portfolio',
+        'salary_range': '₹3-15 LPA',
+        'job_outlook': 'Good - Creative industry growth',
+        'companies': ['Design Studios', 'Advertising Agencies', 'Tech Companies'],
+        'courses': ['B.Des', 'BA Design', 'Diploma in Design']
+    },
+    
+    # General Career Paths
+    'Software Engineer': {
+        'description': 'Software engineers design, develop, and maintain software applications and systems.',
+        'skills_required': ['Programming', 'Problem Solving', 'Teamwork', 'Communication'],
+        'education': 'B.Tech in Computer Science or related field',
+        'salary_range': '₹4-15 LPA',
+        'job_outlook': 'Excellent - High demand',
+        'companies': ['TCS', 'Infosys', 'Wipro', 'Google', 'Microsoft'],
+        'courses': ['B.Tech Computer Science', 'BCA', 'MCA', 'Diploma in IT']
+    },
+    'Medical Doctor': {
+        'description': 'Medical doctors diagnose and treat patients, providing healthcare services.',
+        'skills_required': ['Medical Knowledge', 'Patient Care', 'Communication', 'Critical Thinking'],
+        'education': 'MBBS degree from recognized medical college',
+        'salary_range': '₹8-25 LPA',
+        'job_outlook': 'Excellent - Always in demand',
+        'companies': ['Hospitals', 'Clinics', 'Research Institutes', 'Private Practice'],
+        'courses': ['MBBS', 'BDS', 'BAMS', 'BHMS']
+    },
+    'Business Manager': {
+        'description': 'Business managers oversee operations and lead teams in organizations.',
+        'skills_required': ['Leadership', 'Communication', 'Strategic Thinking', 'Problem Solving'],
+        'education': 'MBA or Business Administration degree',
+        'salary_range': '₹6-20 LPA',
+        'job_outlook': 'Good - Growing demand',
+        'companies': ['Corporate Companies', 'Startups', 'Consulting Firms'],
+        'courses': ['MBA', 'BBA', 'B.Com', 'PGDM']
+    }
+}
+
+# Shown for careers that are not in the catalog
+DEFAULT_CAREER = {
+    'description': 'Career information not available.',
+    'skills_required': [],
+    'education': 'Varies',
+    'salary_range': '₹3-10 LPA',
+    'job_outlook': 'Good',
+    'companies': [],
+    'courses': []
+}
+
+
+def normalize_name(name):
+    """Lower-case a career name and collapse punctuation and spaces to single spaces"""
+    return re.sub(r'[^a-z0-9]+', ' ', name.lower()).strip()
+
+
+def _freeze(details):
+    return MappingProxyType({key: tuple(value) if isinstance(value, list) else value
+                             for key, value in details.items()})
+
+
+class CareerCatalog:
+    """Immutable index over career detail records"""
+
+    def __init__(self, careers):
+        exact = {}
+        normalized = {}
+        keys = set()
+        for name, details in careers.items():
+            exact[name] = _freeze({'name': name, **details})
+            normalized.setdefault(normalize_name(name), name)
+            # Index the name from every word start, so 'engineer' finds 'Software Engineer'
+            words = normalize_name(name).split()
+            for i in range(len(words)):
+                keys.add((' '.join(words[i:]), name))
+        self._exact = MappingProxyType(exact)
+        self._normalized = MappingProxyType(normalized)
+        self._keys = tuple(sorted(keys))
+        # Whole normalized names, so names starting with a query are found before the rest
+        self._names = tuple(sorted((normalize_name(name), name) for name in careers))
+        self.default = _freeze(DEFAULT_CAREER)
+
+    def __len__(self):
+        return len(self._exact)
+
+    def __contains__(self, name):
+        return self.lookup(name) is not None
+
+    def names(self):
+        return list(self._exact)
+
+    def lookup(self, name):
+        """Details for an exact or normalized name match, or None"""
+        details = self._exact.get(name)
+        if details is None:
+            canonical = self._normalized.get(normalize_name(name))
+            if canonical is not None:
+                details = self._exact[canonical]
+        return details
+
+    def get(self, name):
+        """Details for name, or the generic DEFAULT_CAREER record"""
+        details = self.lookup(name)
+        return self.default if details is None else details
+
+    def search(self, query, limit=10):
+        """Up to limit career names with a word starting with the normalized query.
+
+        Names that start with the query come before names where only a later word does.
+        """
+        prefix = normalize_name(query)
+        if not prefix:
+            return []
+        found = []
+        i = bisect_left(self._names, (prefix,))
+        while i < len(self._names) and len(found) < limit and self._names[i][0].startswith(prefix):
+            found.append(self._names[i][1])
+            i += 1
+        seen = set(found)
+        i = bisect_left(self._keys, (prefix,))
+        while i < len(self._keys) and len(found) < limit:
+            key, name = self._keys[i]
+            if not key.startswith(prefix):
+                break
+            if name not in seen:
+                seen.add(name)
+                found.append(name)
+            i += 1
+        return found
+
+
+catalog = CareerCatalog(CAREER_DETAILS)
@@ -0,0 +1,268 @@
+"""Columnar in-memory store for the course and skill datasets.
+
+datasets/courses_dataset.csv and skills_dataset.csv are loaded once into NumPy columns:
+categorical fields become integer codes into a sorted label array, and duration, fees and
+minimum percentage become numbers. A query is then a handful of vectorized comparisons
+producing one boolean mask, applied to a row order precomputed for the requested sort, and a
+slice for the requested page; only the rows on that page are turned back into dicts.
+
+The dataset files separate fields with "," but also use commas inside fields ("IITs, NITs",
+"₹20,000-50,000", a comma-separated related_careers list), so read_loose_csv() splits them
+with a few rules instead of the csv module.
+"""
+import re
+
+import numpy as np
+
+COURSES_CSV = 'datasets/courses_dataset.csv'
+SKILLS_CSV = 'datasets/skills_dataset.csv'
+DEFAULT_PAGE_SIZE = 12
+MAX_PAGE_SIZE = 100
+
+# Career paths per course; courses_dataset.csv has no careers column
+COURSE_CAREERS = {
+    'B.Tech Computer Science': ['Software Engineer', 'Data Scientist', 'Web Developer'],
+    'MBBS': ['Medical Doctor', 'Surgeon', 'Researcher'],
+    'BBA': ['Business Manager', 'Consultant', 'Entrepreneur'],
+    'B.Des (Design)': ['Graphic Designer', 'UI/UX Designer', 'Fashion Designer'],
+    'BCA': ['Software Developer', 'IT Professional', 'System Analyst'],
+    'B.Com': ['Accountant', 'Financial Analyst', 'Business Executive'],
+    'Diploma in Computer Engineering': ['Computer Technician', 'IT Support', 'Network Administrator'],
+    'Diploma in Business Management': ['Office Manager', 'Sales Executive', 'Administrative Assistant'],
+    'Certificate in Web Development': ['Web Developer', 'Frontend Developer', 'Freelancer'],
+    'Certificate in Graphic Design': ['Graphic Designer', 'Digital Artist', 'Content Creator'],
+    'Vocational Training - Electrician': ['Electrician', 'Maintenance Technician', 'Industrial Worker'],
+    'Vocational Training - Plumber': ['Plumber', 'Pipe Fitter', 'Maintenance Worker'],
+}
+
+# A comma followed by a space is part of a field ("IITs, NITs"), any other comma ends one
+_FIELD_SEPARATOR = re.compile(r',(?! )')
+_THOUSANDS = re.compile(r'\d{3}(?!\d)')
+_NUMBER = r'(\d+(?:\.\d+)?)'
+_DURATION = re.compile(_NUMBER + r'(?:\s*-\s*' + _NUMBER + r')?\s*(year|month|week)', re.I)
+_FEES = re.compile(r'([\d,.]+)\s*(?:-\s*([\d,.]+))?\s*(LPA|lakh|L)?', re.I)
+MONTHS_PER_UNIT = {'year': 12, 'month': 1, 'week': 12 / 52}
+LAKH = 100000
+
+
+def read_loose_csv(path):
+    """Read one of the dataset CSVs into a list of dicts keyed by the header.
+
+    Fields are split on commas not followed by a space; a piece that is just the next three
+    digits of a number ("₹20" + "000-50" + "000") is glued back on, and any fields beyond
+    the header go to the last column, which therefore holds a comma-separated list.
+    """
+    with open(path, encoding='utf-8') as f:
+        header = f.readline().strip().split(',')
+        rows = []
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            fields = []
+            for piece in _FIELD_SEPARATOR.split(line):
+                if fields and fields[-1][-1:].isdigit() and _THOUSANDS.match(piece):
+                    fields[-1] += ',' + piece
+                else:
+                    fields.append(piece)
+            if len(fields) < len(header):
+                fields += [''] * (len(header) - len(fields))
+            fields[len(header) - 1:] = [','.join(fields[len(header) - 1:])]
+            rows.append(dict(zip(header, (field.strip() for field in fields))))
+    return rows
+
+
+def parse_duration_months(text):
+    """Lower end of a duration such as '4 years', '4-6 years' or '6 months', in months (NaN if unknown)"""
+    match = _DURATION.search(text or '')
+    if not match:
+        return np.nan
+    return float(match.group(1)) * MONTHS_PER_UNIT[match.group(3).lower()]
+
+
+def parse_fees(text):
+    """Lower end of a fee range such as '₹2-8 LPA' or '₹20,000-50,000', in rupees (NaN if unknown)"""
+    match = _FEES.search((text or '').replace('₹', ''))
+    if not match:
+        return np.nan
+    try:
+        low = float(match.group(1).replace(',', ''))
+    except ValueError:
+        return np.nan
+    return low * LAKH if match.group(3) else low
+
+
+def parse_number(text):
+    try:
+        return float(text)
+    except (TypeError, ValueError):
+        return np.nan
+
+
+class ColumnStore:
+    """Rows of a dataset held as NumPy columns, queried with vectorized filters.
+
+    categorical: fields filterable by exact (case-insensitive) value
+    numeric: {column: parser} numbers filterable with min_<column>/max_<column>
+    """
+
+    def __init__(self, records, categorical=(), numeric=None):
+        self.records = list(records)
+        self.categorical = tuple(categorical)
+        self.numeric = tuple(numeric or ())
+        self.columns = {}
+        self.labels = {}
+        self._label_codes = {}
+        self._sort_keys = {}
+        self._orders = {}
+
+        names = np.array([record.get('name', '') for record in self.records], dtype=object)
+        # Rank of each row by name: the name sort key and the tie-breaker for every other sort
+        self._name_rank = np.empty(len(names), dtype=np.int32)
+        self._name_rank[np.argsort(names, kind='stable')] = np.arange(len(names), dtype=np.int32)
+        self._sort_keys['name'] = self._name_rank
+        for column in self.categorical:
+            values = np.array([record.get(column, '') for record in self.records], dtype=object)
+            labels, codes = np.unique(values.astype(str), return_inverse=True)
+            self.labels[column] = labels
+            self._label_codes[column] = {label.casefold(): code for code, label in enumerate(labels)}
+            # np.unique sorts the labels, so the codes are already a sort key
+            self.columns[column] = self._sort_keys[column] = codes.astype(np.int32)
+        for column, parse in (numeric or {}).items():
+            values = np.array([parse(record.get(column)) for record in self.records], dtype=np.float64)
+            # Rows without a value (NaN) sort last in both directions
+            self.columns[column] = self._sort_keys[column] = values
+
+    def __len__(self):
+        return len(self.records)
+
+    def mask(self, filters=None, bounds=None):
+        """Boolean mask of rows matching every filter.
+
+        filters: {categorical column: [values]}; a row matches if its value is any of them
+        bounds: {column: (low, high)}; either end may be None, rows without a value never match
+        """
+        mask = np.ones(len(self.records), dtype=bool)
+        for column, values in (filters or {}).items():
+            if not values:
+                continue
+            allowed = np.zeros(len(self.labels[column]) + 1, dtype=bool)
+            lookup = self._label_codes[column]
+            for value in values:
+                allowed[lookup.get(str(value).casefold(), -1)] = True
+            allowed[-1] = False  # the slot unknown values were written to
+            mask &= allowed[self.columns[column]]
+        for column, (low, high) in (bounds or {}).items():
+            values = self.columns[column]
+            if low is not None:
+                mask &= values >= low
+            if high is not None:
+                mask &= values <= high
+        return mask
+
+    def order(self, sort='name'):
+        """All row indices sorted by a field; a leading '-' sorts descending, ties go by name.
+
+        Each order is computed once and cached, so a query only has to filter it.
+        """
+        ordered = self._orders.get(sort)
+        if ordered is None:
+            descending = sort.startswith('-')
+            field = sort.lstrip('-')
+            if field not in self._sort_keys:
+                raise ValueError(f'cannot sort by {field!r}')
+            key = self._sort_keys[field]
+            if key.dtype.kind == 'f':
+                key = np.where(np.isnan(key), -np.inf if descending else np.inf, key)
+            ordered = np.lexsort((self._name_rank, -key if descending else key))
+            self._orders[sort] = ordered
+        return ordered
+
+    def query(self, filters=None, bounds=None, sort='name', page=1, per_page=DEFAULT_PAGE_SIZE):
+        """One page of matching records.
+
+        Returns a dict with items (the records on the page), total (matching rows), page,
+        per_page and pages.
+        """
+        mask = self.mask(filters, bounds)
+        total = int(mask.sum())
+        pages = max(1, -(-total // per_page))
+        page = min(max(page, 1), pages)
+        start = (page - 1) * per_page
+        ordered = self.order(sort)
+        ordered = ordered[mask[ordered]]
+        items = [self.records[i] for i in ordered[start:start + per_page]]
+        return {'items': items, 'total': total, 'page': page, 'per_page': per_page, 'pages': pages}
+
+    def query_args(self, args):
+        """Run query() from request arguments (a MultiDict or plain dict).
+
+        <categorical column>=<value> (repeatable), min_<column>=/max_<column>= for numeric
+        columns, sort=[-]<field>, page= and per_page=. Raises ValueError on bad values.
+        """
+        getlist = getattr(args, 'getlist', lambda key: [args[key]] if key in args else [])
+        filters = {column: [value for value in getlist(column) if value]
+                   for column in self.categorical}
+        bounds = {}
+        for column in self.numeric:
+            low, high = (_float_arg(args, f'{prefix}_{column}') for prefix in ('min', 'max'))
+            if low is not None or high is not None:
+                bounds[column] = (low, high)
+        sort = args.get('sort') or 'name'
+        if sort.lstrip('-') not in self._sort_keys:
+            raise ValueError(f"sort must be one of {', '.join(self._sort_keys)}")
+        page = _int_arg(args, 'page', 1)
+        per_page = min(max(_int_arg(args, 'per_page', DEFAULT_PAGE_SIZE), 1), MAX_PAGE_SIZE)
+        return self.query(filters, bounds, sort, page, per_page)
+
+
+def _float_arg(args, key):
+    value = args.get(key)
+    if value in (None, ''):
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        raise ValueError(f'{key} must be a number') from None
+
+
+def _int_arg(args, key, default):
+    value = args.get(key)
+    if value in (None, ''):
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        raise ValueError(f'{key} must be an integer') from None
+
+
+def _split_list(text):
+    return [item.strip() for item in (text or '').split(',') if item.strip()]
+
+
+def load_course_store(path=COURSES_CSV):
+    """ColumnStore over courses_dataset.csv; an empty store if the file cannot be read"""
+    try:
+        rows = read_loose_csv(path)
+    except OSError as e:
+        print('Could not load courses:', e)
+        rows = []
+    for row in rows:
+        row['careers'] = COURSE_CAREERS.get(row['name'], [])
+    return ColumnStore(rows, categorical=('category', 'eligibility'),
+                       numeric={'min_percentage': parse_number,
+                                'duration': parse_duration_months,
+                                'fees': parse_fees})
+
+
+def load_skill_store(path=SKILLS_CSV):
+    """ColumnStore over skills_dataset.csv; an empty store if the file cannot be read"""
+    try:
+        rows = read_loose_csv(path)
+    except OSError as e:
+        print('Could not load skills:', e)
+        rows = []
+    for row in rows:
+        row['careers'] = _split_list(row.get('related_careers'))
+    return ColumnStore(rows, categorical=('category', 'difficulty'),
+                       numeric={'learning_time': parse_duration_months})
@@ -0,0 +1,460 @@
+"""SQLite data access for Pathfinder.
+
+Connections are opened once and kept in a small pool instead of calling sqlite3.connect for
+every query. Each connection runs in WAL mode with tuned pragmas, so readers never block
+the writer and concurrent writers wait on busy_timeout instead of failing with
+"database is locked". All SQL lives in module-level constants and goes through the
+per-connection statement cache, so each statement is prepared once per connection and
+reused afterwards.
+
+Schema changes are numbered MIGRATIONS applied by init_schema() and tracked in
+PRAGMA user_version.
+"""
+import ast
+import json
+import queue
+import sqlite3
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+
+PRAGMAS = (
+    ('journal_mode', 'WAL'),
+    # Durable at checkpoints; with WAL a crash can only lose the last transactions, never corrupt
+    ('synchronous', 'NORMAL'),
+    ('cache_size', -16000),         # KiB, negative means size instead of pages
+    ('mmap_size', 64 * 1024 * 1024),
+    ('temp_store', 'MEMORY'),
+    ('busy_timeout', 5000),         # ms to wait for a competing writer
+)
+POOL_SIZE = 8
+STATEMENT_CACHE_SIZE = 64
+RESULTS_PAGE_SIZE = 10
+# Profiles are stored as JSON without the default separator whitespace
+JSON_SEPARATORS = (',', ':')
+# career_stats percentage bands: (lowest percentage, label), highest first
+PERCENTAGE_BANDS = ((90, '90-100'), (75, '75-89'), (60, '60-74'), (45, '45-59'), (0, 'below 45'))
+UNKNOWN = 'unknown'
+
+SCHEMA = (
+    '''
+    CREATE TABLE IF NOT EXISTS users (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        first_name TEXT NOT NULL,
+        last_name TEXT NOT NULL,
+        email TEXT UNIQUE NOT NULL,
+        password TEXT NOT NULL,
+        age INTEGER,
+        education_level TEXT,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    )
+    ''',
+    '''
+    CREATE TABLE IF NOT EXISTS user_results (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        user_id INTEGER,
+        predicted_career TEXT,
+        profile_data TEXT,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (user_id) REFERENCES users (id)
+    )
+    ''',
+)
+
+SELECT_USER_BY_EMAIL = 'SELECT * FROM users WHERE email = ?'
+INSERT_USER = '''
+    INSERT INTO users (first_name, last_name, email, password, age, education_level)
+    VALUES (?, ?, ?, ?, ?, ?)
+'''
+INSERT_RESULT = '''
+    INSERT INTO user_results (user_id, predicted_career, profile_data, top_careers, bundle)
+    VALUES (?, ?, ?, ?, ?)
+'''
+SELECT_USER_RESULT = '''
+    SELECT user_id, predicted_career, profile_data, top_careers, bundle, created_at
+    FROM user_results
+    WHERE id = ?
+'''
+# Keyset pagination over idx_user_results_user_created: newest first, (created_at, id)
+# breaks ties, and the next page starts strictly after the last row of the previous one
+SELECT_USER_RESULTS_FIRST_PAGE = '''
+    SELECT id, predicted_career, profile_data, top_careers, bundle, created_at
+    FROM user_results
+    WHERE user_id = ?
+    ORDER BY created_at DESC, id DESC
+    LIMIT ?
+'''
+SELECT_USER_RESULTS_PAGE = '''
+    SELECT id, predicted_career, profile_data, top_careers, bundle, created_at
+    FROM user_results
+    WHERE user_id = ? AND (created_at, id) < (?, ?)
+    ORDER BY created_at DESC, id DESC
+    LIMIT ?
+'''
+# Results per (week, career, education level, percentage band), kept up to date by
+# save_user_results so analytics never scan user_results. week is the Monday (UTC) it starts on.
+UPSERT_CAREER_STATS = '''
+    INSERT INTO career_stats (week, career, education_level, percentage_band, results)
+    VALUES (?, ?, ?, ?, ?)
+    ON CONFLICT (week, career, education_level, percentage_band)
+    DO UPDATE SET results = results + excluded.results
+'''
+SELECT_CAREER_STATS = '''
+    SELECT week, career, education_level, percentage_band, results
+    FROM career_stats
+    WHERE week BETWEEN ? AND ?
+    ORDER BY week, career, education_level, percentage_band
+'''
+DELETE_CAREER_STATS = 'DELETE FROM career_stats'
+SELECT_RESULTS_FOR_STATS = 'SELECT predicted_career, profile_data, created_at FROM user_results'
+# Server-side sessions (session_store.SQLiteSessionStore): data is the compact encoded session
+SELECT_SESSION = 'SELECT data, expires FROM sessions WHERE id = ? AND expires > ?'
+UPSERT_SESSION = '''
+    INSERT INTO sessions (id, data, expires) VALUES (?, ?, ?)
+    ON CONFLICT (id) DO UPDATE SET data = excluded.data, expires = excluded.expires
+'''
+TOUCH_SESSION = 'UPDATE sessions SET expires = ? WHERE id = ?'
+DELETE_SESSION = 'DELETE FROM sessions WHERE id = ?'
+DELETE_EXPIRED_SESSIONS = 'DELETE FROM sessions WHERE expires <= ?'
+
+
+def encode_profile(profile_data):
+    return json.dumps(profile_data, separators=JSON_SEPARATORS, default=str)
+
+
+def decode_profile(text):
+    """Parse a stored profile or ranking; None for NULL or rows not migrated from str(dict)"""
+    try:
+        return json.loads(text)
+    except (TypeError, ValueError):
+        return None
+
+
+def _result_params(user_id, predicted_career, profile_data, top_careers=None, bundle=None):
+    """INSERT_RESULT parameters; the profile, ranking and bundle are stored as JSON"""
+    return (user_id, predicted_career, encode_profile(profile_data),
+            None if top_careers is None else encode_profile(top_careers),
+            None if bundle is None else encode_profile(bundle))
+
+
+def _literal_profile(text):
+    """A profile saved as str(dict), or None"""
+    try:
+        return ast.literal_eval(text)
+    except (ValueError, SyntaxError, TypeError, MemoryError, RecursionError):
+        return None
+
+
+def week_start(day):
+    """ISO date of the Monday of day's week"""
+    return (day - timedelta(days=day.weekday())).isoformat()
+
+
+def percentage_band(percentage):
+    try:
+        percentage = float(percentage)
+    except (TypeError, ValueError):
+        return UNKNOWN
+    for lowest, label in PERCENTAGE_BANDS:
+        if percentage >= lowest:
+            return label
+    return UNKNOWN
+
+
+def career_stats_key(week, predicted_career, profile):
+    """The career_stats row a result counts towards"""
+    if not isinstance(profile, dict):
+        profile = {}
+    return (week, predicted_career or UNKNOWN, profile.get('education_level') or UNKNOWN,
+            percentage_band(profile.get('percentage')))
+
+
+def _count_results(conn):
+    """Recount career_stats from every row of user_results"""
+    counts = Counter()
+    for predicted_career, profile_data, created_at in conn.execute(SELECT_RESULTS_FOR_STATS):
+        try:
+            day = datetime.fromisoformat(created_at).date()
+        except (TypeError, ValueError):
+            continue
+        profile = decode_profile(profile_data)
+        if profile is None:  # written as str(dict) by something other than this module
+            profile = _literal_profile(profile_data)
+        counts[career_stats_key(week_start(day), predicted_career, profile)] += 1
+    conn.execute(DELETE_CAREER_STATS)
+    conn.executemany(UPSERT_CAREER_STATS, [key + (n,) for key, n in counts.items()])
+    return sum(counts.values())
+
+
+def _career_stats_table(conn):
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS career_stats (
+            week TEXT NOT NULL,
+            career TEXT NOT NULL,
+            education_level TEXT NOT NULL,
+            percentage_band TEXT NOT NULL,
+            results INTEGER NOT NULL,
+            PRIMARY KEY (week, career, education_level, percentage_band)
+        ) WITHOUT ROWID
+    ''')
+    _count_results(conn)
+
+
+def _json_profiles(conn):
+    """Rewrite profile_data saved as str(dict) into compact JSON"""
+    updates = []
+    for result_id, profile_data in conn.execute('SELECT id, profile_data FROM user_results'):
+        if profile_data is None or decode_profile(profile_data) is not None:
+            continue
+        profile = _literal_profile(profile_data)
+        if profile is not None:  # leave rows that are not a Python literal untouched
+            updates.append((encode_profile(profile), result_id))
+    conn.executemany('UPDATE user_results SET profile_data = ? WHERE id = ?', updates)
+
+
+def _sessions_table(conn):
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS sessions (
+            id TEXT PRIMARY KEY,
+            data BLOB NOT NULL,
+            expires REAL NOT NULL
+        ) WITHOUT ROWID
+    ''')
+    conn.execute('CREATE INDEX IF NOT EXISTS idx_sessions_expires ON sessions (expires)')
+
+
+# Applied in order by init_schema(); PRAGMA user_version counts how many have run
+MIGRATIONS = (
+    # 1: composite index for /my-results (keyset pagination by user, newest first)
+    lambda conn: conn.execute('''
+        CREATE INDEX IF NOT EXISTS idx_user_results_user_created
+        ON user_results (user_id, created_at, id)
+    '''),
+    # 2: profile_data saved as str(dict) rewritten as compact JSON
+    _json_profiles,
+    # 3: ranked careers with probabilities, JSON [{"career": ..., "probability": ...}, ...]
+    lambda conn: conn.execute('ALTER TABLE user_results ADD COLUMN top_careers TEXT'),
+    # 4: server-side sessions keyed by the opaque id in the session cookie
+    _sessions_table,
+    # 5: the results page computed at submission time, JSON (see build_result_bundle in the app)
+    lambda conn: conn.execute('ALTER TABLE user_results ADD COLUMN bundle TEXT'),
+    # 6: career_stats summary for analytics, counted from the existing results
+    _career_stats_table,
+)
+
+
+class Database:
+    """A pool of WAL-mode SQLite connections plus the queries the app runs"""
+
+    def __init__(self, path, pool_size=POOL_SIZE, pragmas=PRAGMAS, on_wait=None):
+        self.path = path
+        self.pragmas = pragmas
+        self._pool = queue.LifoQueue(maxsize=pool_size)
+        self._opened = 0
+        self._lock = threading.Lock()
+        # Called as on_wait(kind, seconds) with the time spent waiting for a pooled
+        # connection ('connection') or for the write lock in transaction() ('write_lock')
+        self.on_wait = on_wait
+
+    def _connect(self):
+        # isolation_level=None: statements autocommit unless transaction() opens one
+        conn = sqlite3.connect(self.path, timeout=30, isolation_level=None,
+                               check_same_thread=False, cached_statements=STATEMENT_CACHE_SIZE)
+        for name, value in self.pragmas:
+            conn.execute(f'PRAGMA {name} = {value}')
+        return conn
+
+    @contextmanager
+    def connection(self):
+        """Borrow a pooled connection, opening a new one while the pool is below its size"""
+        try:
+            conn = self._pool.get_nowait()
+        except queue.Empty:
+            with self._lock:
+                can_open = self._opened < self._pool.maxsize
+                if can_open:
+                    self._opened += 1
+            if can_open:
+                try:
+                    conn = self._connect()
+                except Exception:
+                    with self._lock:
+                        self._opened -= 1
+                    raise
+            else:
+                start = time.perf_counter()
+                conn = self._pool.get()
+                if self.on_wait:
+                    self.on_wait('connection', time.perf_counter() - start)
+        try:
+            yield conn
+        finally:
+            if conn.in_transaction:
+                conn.rollback()
+            self._pool.put(conn)
+
+    @contextmanager
+    def transaction(self):
+        """A pooled connection inside BEGIN IMMEDIATE ... COMMIT (rolled back on error).
+
+        IMMEDIATE takes the write lock up front, so two writers queue on busy_timeout instead
+        of deadlocking when both try to upgrade a read transaction.
+        """
+        with self.connection() as conn:
+            start = time.perf_counter()
+            conn.execute('BEGIN IMMEDIATE')
+            if self.on_wait:
+                self.on_wait('write_lock', time.perf_counter() - start)
+            try:
+                yield conn
+            except BaseException:
+                conn.rollback()
+                raise
+            conn.commit()
+
+    def close(self):
+        """Close the connections currently in the pool"""
+        while True:
+            try:
+                conn = self._pool.get_nowait()
+            except queue.Empty:
+                break
+            conn.close()
+            with self._lock:
+                self._opened -= 1
+
+    def init_schema(self):
+        """Create missing tables and apply pending MIGRATIONS"""
+        with self.transaction() as conn:
+            for statement in SCHEMA:
+                conn.execute(statement)
+            version = conn.execute('PRAGMA user_version').fetchone()[0]
+            for migration in MIGRATIONS[version:]:
+                migration(conn)
+            conn.execute(f'PRAGMA user_version = {len(MIGRATIONS)}')
+
+    def get_user_by_email(self, email):
+        with self.connection() as conn:
+            return conn.execute(SELECT_USER_BY_EMAIL, (email,)).fetchone()
+
+    def create_user(self, first_name, last_name, email, password_hash, age, education_level):
+        """Insert a user and return its id, or None if the email is already registered"""
+        try:
+            with self.transaction() as conn:
+                cursor = conn.execute(INSERT_USER, (first_name, last_name, email, password_hash,
+                                                    age, education_level))
+                return cursor.lastrowid
+        except sqlite3.IntegrityError:
+            return None
+
+    def save_user_result(self, user_id, predicted_career, profile_data, top_careers=None, bundle=None):
+        """Insert one result and return its id"""
+        with self.transaction() as conn:
+            result_id = conn.execute(INSERT_RESULT, _result_params(
+                user_id, predicted_career, profile_data, top_careers, bundle)).lastrowid
+            self._count_in_stats(conn, [(predicted_career, profile_data)])
+            return result_id
+
+    def save_user_results(self, rows):
+        """Insert (user_id, predicted_career, profile_data, top_careers, bundle) rows in one transaction.
+
+        top_careers is the ranked list shown on the results page, or None for fallback results;
+        bundle is the results page content computed at submission time, or None. The rows are
+        counted in career_stats in the same transaction.
+        """
+        rows = list(rows)
+        with self.transaction() as conn:
+            conn.executemany(INSERT_RESULT, [_result_params(*row) for row in rows])
+            self._count_in_stats(conn, [(row[1], row[2]) for row in rows])
+
+    @staticmethod
+    def _count_in_stats(conn, results):
+        """Add (predicted_career, profile) results, saved now, to career_stats"""
+        # created_at defaults to CURRENT_TIMESTAMP, which is UTC
+        week = week_start(datetime.now(timezone.utc).date())
+        counts = Counter(career_stats_key(week, career, profile if isinstance(profile, dict)
+                                          else decode_profile(profile))
+                         for career, profile in results)
+        conn.executemany(UPSERT_CAREER_STATS, [key + (n,) for key, n in counts.items()])
+
+    def get_career_stats(self, first_week, last_week):
+        """career_stats rows with first_week <= week <= last_week (ISO dates of Mondays)"""
+        with self.connection() as conn:
+            return conn.execute(SELECT_CAREER_STATS, (first_week, last_week)).fetchall()
+
+    def rebuild_career_stats(self):
+        """Recount career_stats from user_results; returns the number of results counted"""
+        with self.transaction() as conn:
+            return _count_results(conn)
+
+    def get_user_result(self, result_id):
+        """One result by id as a dict (see get_user_results) with its user_id, or None"""
+        with self.connection() as conn:
+            row = conn.execute(SELECT_USER_RESULT, (result_id,)).fetchone()
+        if row is None:
+            return None
+        user_id, predicted_career, profile_data, top_careers, bundle, created_at = row
+        return {
+            'id': result_id,
+            'user_id': user_id,
+            'predicted_career': predicted_career,
+            'profile': decode_profile(profile_data),
+            'profile_data': profile_data,
+            'top_careers': decode_profile(top_careers),
+            'bundle': decode_profile(bundle),
+            'created_at': created_at,
+        }
+
+    def load_session(self, session_id, now):
+        """(data, expires) of an unexpired session, or None"""
+        with self.connection() as conn:
+            return conn.execute(SELECT_SESSION, (session_id, now)).fetchone()
+
+    def save_session(self, session_id, data, expires):
+        with self.transaction() as conn:
+            conn.execute(UPSERT_SESSION, (session_id, data, expires))
+
+    def touch_session(self, session_id, expires):
+        with self.transaction() as conn:
+            conn.execute(TOUCH_SESSION, (expires, session_id))
+
+    def delete_session(self, session_id):
+        with self.transaction() as conn:
+            conn.execute(DELETE_SESSION, (session_id,))
+
+    def delete_expired_sessions(self, now):
+        """Delete expired sessions; returns how many were deleted"""
+        with self.transaction() as conn:
+            return conn.execute(DELETE_EXPIRED_SESSIONS, (now,)).rowcount
+
+    def get_user_results(self, user_id, limit=RESULTS_PAGE_SIZE, cursor=None):
+        """One page of a user's results, newest first.
+
+        Returns (results, next_cursor); pass next_cursor back to get the following page, it is
+        None on the last page. Each result is a dict with id, predicted_career, profile (the
+        decoded profile dict, or None), profile_data (the stored text), top_careers (the
+        ranked list, or None), bundle (the stored results page content, or None) and
+        created_at.
+        """
+        with self.connection() as conn:
+            if cursor is None:
+                rows = conn.execute(SELECT_USER_RESULTS_FIRST_PAGE, (user_id, limit + 1)).fetchall()
+            else:
+                created_at, result_id = cursor
+                rows = conn.execute(SELECT_USER_RESULTS_PAGE,
+                                    (user_id, created_at, result_id, limit + 1)).fetchall()
+        results = [{
+            'id': result_id,
+            'predicted_career': predicted_career,
+            'profile': decode_profile(profile_data),
+            'profile_data': profile_data,
+            'top_careers': decode_profile(top_careers),
+            'bundle': decode_profile(bundle),
+            'created_at': created_at,
+        } for result_id, predicted_career, profile_data, top_careers, bundle, created_at in rows[:limit]]
+        next_cursor = None
+        if len(rows) > limit:
+            next_cursor = (results[-1]['created_at'], results[-1]['id'])
+        return results, next_cursor
@@ -0,0 +1,179 @@
+"""Distilled fast-path model with confidence-gated escalation to the full forest.
+
+Most profiles fall into a few clear clusters where the 200-tree forest's answer is easy to
+predict. DistilledModel.fit trains one shallow regression tree on the forest's own class
+probabilities (any profiles will do, no labels needed). Each leaf then holds the forest's
+mean probabilities for the profiles that reach it. It also gets a confidence: the share of
+those profiles whose forest top career is the leaf's top career.
+
+CascadePredictor answers from the tree when a row lands on a leaf whose confidence reaches
+the threshold, and sends the other rows to the full forest. It has the forest's
+predict_proba/predict/classes_ interface, so ModelHandle serves it unchanged:
+
+    cascade = CascadePredictor(distilled, clf)
+    proba = cascade.predict_proba(X)          # forest probabilities only for escalated rows
+    evaluate(distilled, clf, X)               # escalation rate, agreement and latency
+"""
+import threading
+import time
+
+import numpy as np
+from sklearn.tree import DecisionTreeRegressor
+
+from forest_engine import FlatForest, flatten_tree
+
+DEFAULT_MAX_DEPTH = 10
+# Leaves need enough profiles for their confidence to mean something
+DEFAULT_MIN_SAMPLES_LEAF = 20
+DEFAULT_CONFIDENCE = 0.95
+# Rows timed one at a time by evaluate()
+LATENCY_ROWS = 200
+
+
+class DistilledModel:
+    """A shallow tree over the forest's class probabilities, with a confidence per node"""
+
+    def __init__(self, tree, confidence, threshold=DEFAULT_CONFIDENCE):
+        self.tree = tree
+        self.confidence = confidence
+        self.threshold = threshold
+
+    @classmethod
+    def fit(cls, forest, X, max_depth=DEFAULT_MAX_DEPTH, min_samples_leaf=DEFAULT_MIN_SAMPLES_LEAF,
+            threshold=DEFAULT_CONFIDENCE):
+        """Distill a fitted forest (sklearn or FlatForest) on the feature rows X"""
+        proba = forest.predict_proba(X)
+        regressor = DecisionTreeRegressor(max_depth=max_depth, min_samples_leaf=min_samples_leaf,
+                                          random_state=42).fit(X, proba)
+        t = regressor.tree_
+        feature, thresholds, left, right = flatten_tree(t)
+        # Multi-output regression: value has shape (n_nodes, n_classes, 1)
+        value = t.value[:, :, 0]
+        tree = FlatForest(feature, thresholds, left, right, value, roots=np.zeros(1, dtype=np.intp),
+                          classes=np.asarray(forest.classes_), max_depth=max(t.max_depth, 1))
+
+        leaves = tree.apply(X)[:, 0]
+        agrees = value[leaves].argmax(axis=1) == proba.argmax(axis=1)
+        reached = np.bincount(leaves, minlength=t.node_count)
+        confidence = np.bincount(leaves, weights=agrees, minlength=t.node_count) / np.maximum(reached, 1)
+        return cls(tree, confidence, threshold)
+
+    @property
+    def classes_(self):
+        return self.tree.classes_
+
+    @property
+    def n_leaves(self):
+        return int(np.count_nonzero(self.tree.left == np.arange(len(self.tree.left))))
+
+    def leaves(self, X):
+        return self.tree.apply(X)[:, 0]
+
+    def predict_proba(self, X):
+        """(probabilities, confidence) of each row"""
+        leaves = self.leaves(X)
+        return self.tree.value[leaves], self.confidence[leaves]
+
+
+class CascadePredictor:
+    """The distilled tree for confident rows, the full forest for the rest"""
+
+    def __init__(self, distilled, full, threshold=None):
+        self.distilled = distilled
+        self.full = full
+        self.threshold = distilled.threshold if threshold is None else threshold
+        self.rows = self.escalated = 0
+        self._lock = threading.Lock()
+
+    @property
+    def classes_(self):
+        return self.full.classes_
+
+    def predict_proba(self, X):
+        proba, confidence = self.distilled.predict_proba(X)
+        escalate = confidence < self.threshold
+        escalated = int(np.count_nonzero(escalate))
+        if escalated:
+            proba[escalate] = self.full.predict_proba(X[escalate])
+        with self._lock:
+            self.rows += len(proba)
+            self.escalated += escalated
+        return proba
+
+    def predict(self, X):
+        return self.classes_[np.argmax(self.predict_proba(X), axis=1)]
+
+    def stats(self):
+        return {
+            'threshold': self.threshold,
+            'rows': self.rows,
+            'escalated': self.escalated,
+            'escalation_rate': self.escalated / self.rows if self.rows else 0.0,
+        }
+
+
+def random_features(encoder, n, rng):
+    """n feature rows spread over the whole input space of a FeatureEncoder.
+
+    Every numeric field is uniform over its form range and each label is set with a chance
+    that gives about two labels per field, so the tree also learns (and measures its
+    confidence on) profiles far from the training rows.
+    """
+    X = np.zeros((n, encoder.n_features), dtype=np.float32)
+    X[:, 0] = rng.integers(14, 26, n)
+    X[:, 1] = rng.integers(35, 101, n)
+    for columns in (encoder.interest_columns, encoder.skill_columns, encoder.hobby_columns):
+        if columns:
+            block = sorted(columns.values())
+            X[:, block] = rng.random((n, len(block))) < min(0.5, 2 / len(block))
+    X[:, encoder.personality_column] = rng.integers(0, max(len(encoder.personality_codes), 1), n)
+    X[:, encoder.work_style_column] = rng.integers(0, max(len(encoder.work_style_codes), 1), n)
+    X[:, encoder.quiz_start:] = rng.integers(1, 6, (n, encoder.n_features - encoder.quiz_start))
+    return X
+
+
+def _row_latencies(predict_proba, X):
+    samples = []
+    for i in range(len(X)):
+        row = X[i:i + 1]
+        start = time.perf_counter()
+        predict_proba(row)
+        samples.append(time.perf_counter() - start)
+    return np.array(samples) * 1e3
+
+
+def evaluate(distilled, forest, X, threshold=None, latency_rows=LATENCY_ROWS):
+    """Escalation rate, agreement with the forest's top career and single-row latency on X"""
+    cascade = CascadePredictor(distilled, forest, threshold)
+    forest_top = forest.predict_proba(X).argmax(axis=1)
+    cascade_top = cascade.predict_proba(X).argmax(axis=1)
+    fast = distilled.predict_proba(X)[1] >= cascade.threshold
+    agrees = cascade_top == forest_top
+
+    # Rows spread over X, which may be made of blocks of different kinds of profiles
+    timed = X[np.unique(np.linspace(0, len(X) - 1, min(latency_rows, len(X))).astype(int))]
+    forest_ms = _row_latencies(forest.predict_proba, timed)
+    cascade_ms = _row_latencies(cascade.predict_proba, timed)
+    return {
+        'rows': len(X),
+        'threshold': cascade.threshold,
+        'leaves': distilled.n_leaves,
+        'escalation_rate': round(1 - float(fast.mean()), 4),
+        'agreement': round(float(agrees.mean()), 4),
+        'fast_path_agreement': round(float(agrees[fast].mean()), 4) if fast.any() else None,
+        'forest_row_ms_p50': round(float(np.percentile(forest_ms, 50)), 4),
+        'cascade_row_ms_p50': round(float(np.percentile(cascade_ms, 50)), 4),
+        'forest_row_ms_mean': round(float(forest_ms.mean()), 4),
+        'cascade_row_ms_mean': round(float(cascade_ms.mean()), 4),
+        'latency_saving': round(1 - float(cascade_ms.mean() / forest_ms.mean()), 4),
+    }
+
+
+def print_report(report):
+    print(f'Distilled tree: {report["leaves"]} leaves, confidence threshold {report["threshold"]}')
+    print(f'  escalated to the forest: {report["escalation_rate"]:.1%} of {report["rows"]} rows')
+    print(f'  agreement with the forest: {report["agreement"]:.2%} '
+          f'(fast path alone: {report["fast_path_agreement"] or 0:.2%})')
+    print(f'  single-row ms, mean (p50): forest {report["forest_row_ms_mean"]:.3f} '
+          f'({report["forest_row_ms_p50"]:.3f}), cascade {report["cascade_row_ms_mean"]:.3f} '
+          f'({report["cascade_row_ms_p50"]:.3f}), {report["latency_saving"]:.0%} saved')
@@ -0,0 +1,230 @@
+"""Feature encoding for the career prediction model.
+
+The column layout matches the one built in train_model.py:
+
+    age, percentage, interests..., skills..., hobbies..., personality, work_style, quiz_q1..quiz_q10
+
+Instead of calling the five sklearn transformers and np.hstack for every request, the
+encoder keeps a label -> column (or code) map per field and writes straight into a
+preallocated NumPy row or matrix. encode_frame() does the same column-wise for a pandas
+DataFrame in the careers_dataset.csv layout (comma-separated label fields).
+"""
+import threading
+
+import numpy as np
+import pandas as pd
+
+QUIZ_FIELDS = [f'quiz_q{i}' for i in range(1, 11)]
+
+# Values used when a field is missing from the profile (same defaults as /predict)
+DEFAULTS = {
+    'age': 16,
+    'percentage': 70,
+    'interests': [],
+    'skills': [],
+    'hobbies': [],
+    'personality': 'Introvert',
+    'work_style': 'Analytical',
+}
+QUIZ_DEFAULT = 3
+
+# How to treat personality/work_style values the model has never seen
+UNKNOWN_POLICIES = ('default', 'error')
+
+
+def parse_labels(text):
+    """The labels in a comma-separated cell ('Technology, Science'); [] for blank cells"""
+    if not isinstance(text, str):
+        return []
+    return [label.strip() for label in text.split(',') if label.strip()]
+
+
+class UnknownCategoryError(ValueError):
+    """Raised for an unseen personality/work_style when the policy is 'error'"""
+
+
+class FeatureEncoder:
+    """Encode profile dicts into model feature rows.
+
+    Unknown labels in the multi-valued fields (interests, skills, hobbies) are ignored, which
+    is what MultiLabelBinarizer.transform does. For personality and work_style the policy is:
+
+    - 'default': use the code of the DEFAULTS value, or of the first class if the model does
+      not know the default either
+    - 'error': raise UnknownCategoryError
+    """
+
+    def __init__(self, interests, skills, hobbies, personalities, work_styles, unknown='default'):
+        if unknown not in UNKNOWN_POLICIES:
+            raise ValueError(f'unknown must be one of {UNKNOWN_POLICIES}, got {unknown!r}')
+        self.unknown = unknown
+
+        # Columns 0 and 1 are age and percentage, the label blocks follow
+        offset = 2
+        self.interest_columns, offset = self._column_map(interests, offset)
+        self.skill_columns, offset = self._column_map(skills, offset)
+        self.hobby_columns, offset = self._column_map(hobbies, offset)
+        self.personality_column = offset
+        self.work_style_column = offset + 1
+        self.quiz_start = offset + 2
+        self.n_features = self.quiz_start + len(QUIZ_FIELDS)
+
+        # LabelEncoder codes are the positions in its sorted classes_
+        self.personality_codes = {label: code for code, label in enumerate(personalities)}
+        self.work_style_codes = {label: code for code, label in enumerate(work_styles)}
+        self.personality_default = self.personality_codes.get(DEFAULTS['personality'], 0)
+        self.work_style_default = self.work_style_codes.get(DEFAULTS['work_style'], 0)
+
+        self._local = threading.local()
+
+    @classmethod
+    def from_bundle(cls, bundle, unknown='default'):
+        """Build an encoder from a loaded career_predictor.pkl bundle"""
+        return cls(
+            bundle['mlb_interests'].classes_,
+            bundle['mlb_skills'].classes_,
+            bundle['mlb_hobbies'].classes_,
+            bundle['le_personality'].classes_,
+            bundle['le_work_style'].classes_,
+            unknown=unknown,
+        )
+
+    @staticmethod
+    def _column_map(labels, offset):
+        columns = {label: offset + i for i, label in enumerate(labels)}
+        return columns, offset + len(columns)
+
+    def _code(self, codes, value, default, field):
+        # None is a missing form field and takes the default like an unknown value
+        if value is not None and not isinstance(value, str):
+            raise ValueError(f'{field} must be a string')
+        code = codes.get(value)
+        if code is None:
+            if self.unknown == 'error':
+                raise UnknownCategoryError(f'unknown {field}: {value}')
+            code = default
+        return code
+
+    def encode_into(self, row, data):
+        """Write the features of one profile into a 1-D row of length n_features.
+
+        Raises ValueError if data is not a dict, a numeric field cannot be converted, a
+        multi-valued field is not a list of strings or personality/work_style is not a string.
+        """
+        if not isinstance(data, dict):
+            raise ValueError('profile must be a JSON object')
+        row[:] = 0
+        try:
+            row[0] = float(data.get('age', DEFAULTS['age']))
+            row[1] = float(data.get('percentage', DEFAULTS['percentage']))
+            for i, field in enumerate(QUIZ_FIELDS):
+                row[self.quiz_start + i] = float(data.get(field, QUIZ_DEFAULT))
+        except (TypeError, ValueError):
+            raise ValueError('age, percentage and quiz answers must be numeric')
+
+        for field, columns in (('interests', self.interest_columns),
+                               ('skills', self.skill_columns),
+                               ('hobbies', self.hobby_columns)):
+            labels = data.get(field, DEFAULTS[field])
+            if not isinstance(labels, (list, tuple)):
+                raise ValueError(f'{field} must be a list')
+            for label in labels:
+                if not isinstance(label, str):
+                    raise ValueError(f'{field} must be a list of strings')
+                column = columns.get(label)
+                if column is not None:
+                    row[column] = 1
+
+        row[self.personality_column] = self._code(
+            self.personality_codes, data.get('personality', DEFAULTS['personality']),
+            self.personality_default, 'personality')
+        row[self.work_style_column] = self._code(
+            self.work_style_codes, data.get('work_style', DEFAULTS['work_style']),
+            self.work_style_default, 'work_style')
+        return row
+
+    def encode(self, data):
+        """Encode one profile into a (1, n_features) array.
+
+        The array is a per-thread buffer that is overwritten by the next call on the same
+        thread, so copy it if it has to outlive the prediction.
+        """
+        row = getattr(self._local, 'row', None)
+        if row is None:
+            row = self._local.row = np.zeros((1, self.n_features))
+        self.encode_into(row[0], data)
+        return row
+
+    def encode_many(self, profiles):
+        """Encode a list of profiles into one (n, n_features) matrix.
+
+        Returns (X, errors) where errors[i] is None for rows that were encoded and an error
+        message for rows that were not (those rows are left as zeros).
+        """
+        X = np.zeros((len(profiles), self.n_features))
+        errors = [None] * len(profiles)
+        for i, data in enumerate(profiles):
+            try:
+                self.encode_into(X[i], data)
+            except ValueError as e:
+                X[i] = 0
+                errors[i] = str(e)
+        return X, errors
+
+    def encode_frame(self, df):
+        """Encode a DataFrame in the careers_dataset.csv layout into an (n, n_features) matrix.
+
+        Label fields hold comma-separated labels. Missing columns and blank cells take the
+        DEFAULTS, like missing keys in encode(). Returns (X, valid): rows with a non-numeric
+        age, percentage or quiz answer (or, under the 'error' policy, an unknown personality
+        or work_style) are False in valid and left as zeros in X.
+
+        Each column is factorized first, so every distinct cell value is parsed once and the
+        rows are filled with a single take from a small per-value table.
+        """
+        n = len(df)
+        X = np.zeros((n, self.n_features))
+        valid = np.ones(n, dtype=bool)
+
+        numeric = [(0, 'age', DEFAULTS['age']), (1, 'percentage', DEFAULTS['percentage'])]
+        numeric += [(self.quiz_start + i, field, QUIZ_DEFAULT) for i, field in enumerate(QUIZ_FIELDS)]
+        for column, field, default in numeric:
+            if field not in df:
+                X[:, column] = default
+                continue
+            # Blank cells factorize to -1, which picks the default appended at the end
+            codes, uniques = pd.factorize(df[field])
+            values = pd.to_numeric(pd.Series(uniques, dtype=object), errors='coerce').to_numpy(dtype=np.float64)
+            X[:, column] = np.append(np.nan_to_num(values, nan=0.0), default)[codes]
+            valid &= ~np.append(np.isnan(values), False)[codes]
+
+        for field, columns in (('interests', self.interest_columns),
+                               ('skills', self.skill_columns),
+                               ('hobbies', self.hobby_columns)):
+            if field not in df or not columns:
+                continue
+            start = min(columns.values())
+            codes, uniques = pd.factorize(df[field])
+            table = np.zeros((len(uniques) + 1, len(columns)))
+            for i, text in enumerate(uniques):
+                for label in parse_labels(text):
+                    if label in columns:
+                        table[i, columns[label] - start] = 1
+            X[:, start:start + len(columns)] = table[codes]
+
+        for field, column, label_codes, default in (
+                ('personality', self.personality_column, self.personality_codes, self.personality_default),
+                ('work_style', self.work_style_column, self.work_style_codes, self.work_style_default)):
+            if field not in df:
+                X[:, column] = label_codes.get(DEFAULTS[field], default)
+                continue
+            codes, uniques = pd.factorize(df[field])
+            mapped = [label_codes.get(str(value).strip()) for value in uniques]
+            mapped.append(label_codes.get(DEFAULTS[field]))
+            known = np.array([code is not None for code in mapped])
+            X[:, column] = np.array([default if code is None else code for code in mapped], dtype=np.float64)[codes]
+            if self.unknown == 'error':
+                valid &= known[codes]
+
+        X[~valid] = 0
+        return X, valid
@@ -0,0 +1,108 @@
+"""Array-based inference for the career RandomForestClassifier.
+
+sklearn's predict on a single row goes through input validation and dispatches every tree
+separately. FlatForest packs all trees of a fitted forest (or a single decision tree) into
+contiguous NumPy arrays and walks every tree for every row at once, one tree level per step:
+
+    feature[i], threshold[i]    split of node i (leaves use feature 0, threshold +inf)
+    left[i], right[i]           global index of the children (leaves point to themselves)
+    value[i]                    class distribution of node i, normalized to probabilities
+    roots[t]                    global index of the root of tree t
+
+Rows go left when X[row, feature] <= threshold, with X cast to float32 like sklearn does, so
+predictions match clf.predict / clf.predict_proba.
+"""
+import numpy as np
+
+# Names of the arrays that make up a FlatForest, used to save and load it
+ARRAY_NAMES = ('feature', 'threshold', 'left', 'right', 'value', 'roots', 'classes')
+
+
+def flatten_tree(tree, offset=0):
+    """(feature, threshold, left, right) arrays of a fitted sklearn Tree whose nodes start at offset"""
+    is_leaf = tree.children_left == -1
+    own_index = np.arange(tree.node_count, dtype=np.intp) + offset
+    return (np.where(is_leaf, 0, tree.feature).astype(np.intp),
+            np.where(is_leaf, np.inf, tree.threshold),
+            np.where(is_leaf, own_index, tree.children_left + offset).astype(np.intp),
+            np.where(is_leaf, own_index, tree.children_right + offset).astype(np.intp))
+
+
+class FlatForest:
+    """A forest of decision trees flattened into NumPy arrays"""
+
+    def __init__(self, feature, threshold, left, right, value, roots, classes, max_depth):
+        self.feature = feature
+        self.threshold = threshold
+        self.left = left
+        self.right = right
+        self.value = value
+        self.roots = roots
+        self.classes = classes
+        self.max_depth = int(max_depth)
+        self.n_trees = len(roots)
+
+    @classmethod
+    def from_sklearn(cls, model):
+        """Flatten a fitted RandomForestClassifier or DecisionTreeClassifier"""
+        trees = [est.tree_ for est in getattr(model, 'estimators_', [model])]
+        sizes = [tree.node_count for tree in trees]
+        offsets = np.concatenate([[0], np.cumsum(sizes)[:-1]]).astype(np.intp)
+
+        feature, threshold, left, right, value = [], [], [], [], []
+        for tree, offset in zip(trees, offsets):
+            for arrays, array in zip((feature, threshold, left, right), flatten_tree(tree, offset)):
+                arrays.append(array)
+            # Single-output classifiers: value has shape (n_nodes, 1, n_classes)
+            counts = tree.value[:, 0, :]
+            totals = counts.sum(axis=1, keepdims=True)
+            totals[totals == 0] = 1.0
+            value.append(counts / totals)
+
+        return cls(
+            feature=np.concatenate(feature),
+            threshold=np.concatenate(threshold),
+            left=np.concatenate(left),
+            right=np.concatenate(right),
+            value=np.concatenate(value),
+            roots=offsets,
+            classes=np.asarray(model.classes_),
+            max_depth=max(tree.max_depth for tree in trees),
+        )
+
+    @classmethod
+    def from_arrays(cls, arrays, max_depth):
+        """Rebuild a FlatForest from the arrays returned by to_arrays()"""
+        return cls(max_depth=max_depth, **{name: arrays[name] for name in ARRAY_NAMES})
+
+    def to_arrays(self):
+        return {name: getattr(self, name) for name in ARRAY_NAMES}
+
+    @property
+    def classes_(self):
+        """Class labels in predict_proba column order, named as on sklearn estimators"""
+        return self.classes
+
+    @property
+    def nbytes(self):
+        return sum(array.nbytes for array in self.to_arrays().values())
+
+    def apply(self, X):
+        """Return the global leaf index reached by each row in each tree, shape (n, n_trees)"""
+        X = np.asarray(X, dtype=np.float32)
+        if X.ndim == 1:
+            X = X.reshape(1, -1)
+        rows = np.arange(X.shape[0])[:, None]
+        nodes = np.broadcast_to(self.roots, (X.shape[0], self.n_trees))
+        # Leaves point to themselves, so walking max_depth levels lands every row on a leaf
+        for _ in range(self.max_depth):
+            go_left = X[rows, self.feature[nodes]] <= self.threshold[nodes]
+            nodes = np.where(go_left, self.left[nodes], self.right[nodes])
+        return nodes
+
+    def predict_proba(self, X):
+        leaves = self.apply(X)
+        return self.value[leaves].sum(axis=1) / self.n_trees
+
+    def predict(self, X):
+        return self.classes[np.argmax(self.predict_proba(X), axis=1)]
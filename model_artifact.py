@@ -0,0 +1,142 @@
+"""Memory-mappable model artifact layout.
+
+career_predictor.pkl is one pickle that every worker process unpickles into its own memory.
+The artifact layout splits it into a directory:
+
+    manifest.json       format version, model version hash, tree depth and array shapes
+    <name>.npy          FlatForest arrays (see forest_engine.ARRAY_NAMES), loaded with
+                        mmap_mode='r' so workers share them read-only through the page cache
+    encoders.joblib     the small MultiLabelBinarizer/LabelEncoder sidecar
+    distilled.joblib    the distilled fast-path tree and its report, when the bundle has one
+
+Write one with train_model.py --artifact-dir, or convert an existing bundle with
+
+    python model_artifact.py ml_model/career_predictor.pkl ml_model/career_predictor
+"""
+import argparse
+import hashlib
+import json
+import os
+import time
+
+import joblib
+import numpy as np
+
+from forest_engine import ARRAY_NAMES, FlatForest
+
+ARTIFACT_FORMAT = 'pathfinder-flat-forest'
+ARTIFACT_VERSION = 1
+MANIFEST_FILE = 'manifest.json'
+ENCODERS_FILE = 'encoders.joblib'
+DISTILLED_FILE = 'distilled.joblib'
+DISTILLED_KEYS = ('distilled', 'distilled_report')
+ENCODER_KEYS = ('mlb_interests', 'mlb_skills', 'mlb_hobbies', 'le_personality', 'le_work_style', 'le_career')
+
+
+def save_model_artifact(bundle, out_dir):
+    """Write a trained bundle (as saved by train_model.py) in the artifact layout"""
+    forest = FlatForest.from_sklearn(bundle['model'])
+    os.makedirs(out_dir, exist_ok=True)
+
+    digest = hashlib.sha256()
+    arrays = {}
+    for name, array in forest.to_arrays().items():
+        array = np.ascontiguousarray(array)
+        np.save(os.path.join(out_dir, f'{name}.npy'), array, allow_pickle=False)
+        digest.update(name.encode())
+        digest.update(array.tobytes())
+        arrays[name] = {'dtype': array.dtype.str, 'shape': list(array.shape)}
+
+    encoders = {key: bundle[key] for key in ENCODER_KEYS}
+    joblib.dump(encoders, os.path.join(out_dir, ENCODERS_FILE))
+    with open(os.path.join(out_dir, ENCODERS_FILE), 'rb') as f:
+        digest.update(f.read())
+    distilled = bundle.get('distilled') is not None
+    if distilled:
+        joblib.dump({key: bundle.get(key) for key in DISTILLED_KEYS}, os.path.join(out_dir, DISTILLED_FILE))
+        with open(os.path.join(out_dir, DISTILLED_FILE), 'rb') as f:
+            digest.update(f.read())
+
+    manifest = {
+        'format': ARTIFACT_FORMAT,
+        'version': ARTIFACT_VERSION,
+        'model_version': digest.hexdigest(),
+        'max_depth': forest.max_depth,
+        'n_trees': forest.n_trees,
+        'distilled': distilled,
+        'arrays': arrays,
+    }
+    # The manifest is written last, so a directory without one is an incomplete artifact
+    with open(os.path.join(out_dir, MANIFEST_FILE), 'w') as f:
+        json.dump(manifest, f, indent=2)
+    return manifest
+
+
+def read_manifest(path):
+    with open(os.path.join(path, MANIFEST_FILE)) as f:
+        manifest = json.load(f)
+    if manifest.get('format') != ARTIFACT_FORMAT or manifest.get('version') != ARTIFACT_VERSION:
+        raise ValueError(f'{path} is not a version {ARTIFACT_VERSION} {ARTIFACT_FORMAT} artifact')
+    return manifest
+
+
+def load_model_artifact(path, mmap=True):
+    """Load an artifact directory into a bundle dict.
+
+    The returned dict has the same encoder keys as career_predictor.pkl, 'model' holds a
+    FlatForest over the (memory-mapped) arrays, and 'model_version' the manifest hash.
+    """
+    manifest = read_manifest(path)
+    arrays = {}
+    for name in ARRAY_NAMES:
+        array = np.load(os.path.join(path, f'{name}.npy'), mmap_mode='r' if mmap else None,
+                        allow_pickle=False)
+        expected = manifest['arrays'][name]
+        if array.dtype.str != expected['dtype'] or list(array.shape) != expected['shape']:
+            raise ValueError(f'{name}.npy does not match the manifest')
+        arrays[name] = array
+    bundle = joblib.load(os.path.join(path, ENCODERS_FILE))
+    if manifest.get('distilled'):
+        bundle.update(joblib.load(os.path.join(path, DISTILLED_FILE)))
+    bundle['model'] = FlatForest.from_arrays(arrays, manifest['max_depth'])
+    bundle['model_version'] = manifest['model_version']
+    return bundle
+
+
+def resident_memory_bytes():
+    """Current resident set size of this process (peak RSS where /proc is unavailable)"""
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, IndexError):
+        import resource
+        # ru_maxrss is in kilobytes on Linux
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+def timed_load(loader, *args, **kwargs):
+    """Call loader and return (result, stats) with load time and resident size"""
+    rss_before = resident_memory_bytes()
+    start = time.perf_counter()
+    result = loader(*args, **kwargs)
+    load_seconds = time.perf_counter() - start
+    rss_after = resident_memory_bytes()
+    stats = {
+        'load_seconds': round(load_seconds, 6),
+        'rss_bytes': rss_after,
+        'rss_delta_bytes': rss_after - rss_before,
+    }
+    return result, stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Convert a career_predictor.pkl bundle to the artifact layout')
+    parser.add_argument('bundle', help='path to career_predictor.pkl')
+    parser.add_argument('out_dir', help='artifact directory to write')
+    args = parser.parse_args()
+    manifest = save_model_artifact(joblib.load(args.bundle), args.out_dir)
+    print(f"Wrote {args.out_dir} (model version {manifest['model_version'][:12]})")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,210 @@
+"""Versioned model registry with atomic hot swap and rollback.
+
+Everything a prediction needs (estimator, encoder, label decoder) lives in one immutable
+ModelHandle. Requests read registry.active once and use that handle to the end, so a
+reload that swaps in a new handle never pairs a new model with old encoders, and requests
+already running finish on the model they started with.
+"""
+import hashlib
+import os
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime
+from functools import cached_property
+
+import joblib
+import numpy as np
+
+from distilled_model import CascadePredictor
+from feature_encoder import FeatureEncoder
+from forest_engine import FlatForest
+from model_artifact import load_model_artifact, timed_load
+
+# Profile used to check a freshly loaded model before it is swapped in
+VALIDATION_PROFILE = {'interests': ['Technology'], 'skills': ['Programming'], 'percentage': 80}
+
+
+def top_k_indices(scores, k):
+    """Column indices of the k highest scores in each row, highest first.
+
+    np.argpartition selects the k columns without sorting the rest; only those k are then
+    ordered (ties by column index).
+    """
+    k = min(k, scores.shape[1])
+    if k < scores.shape[1]:
+        top = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+    else:
+        top = np.broadcast_to(np.arange(k), scores.shape)
+    order = np.lexsort((top, -np.take_along_axis(scores, top, axis=1)), axis=1)
+    return np.take_along_axis(top, order, axis=1)
+
+
+@dataclass(frozen=True, eq=False)
+class ModelHandle:
+    """One loaded model version and everything needed to serve predictions with it"""
+    version: str
+    source: str
+    predictor: object
+    encoder: FeatureEncoder
+    le_career: object
+    bundle: dict = field(repr=False)
+    loaded_at: str = ''
+    load_stats: dict = field(default_factory=dict)
+
+    @property
+    def classes(self):
+        return self.le_career.classes_
+
+    @cached_property
+    def columns(self):
+        """Career name of each predict_proba column"""
+        return self.le_career.inverse_transform(self.predictor.classes_)
+
+    def predict(self, X):
+        """Predicted career names for the rows of an encoded feature matrix"""
+        return self.le_career.inverse_transform(self.predictor.predict(X))
+
+    def top_k(self, X, k):
+        """The k most probable careers for each row as [(career, probability), ...], best first.
+
+        One predict_proba call covers every row; probabilities are the forest's mean leaf
+        class frequencies, rounded to 4 places.
+        """
+        proba = self.predictor.predict_proba(X)
+        top = top_k_indices(proba, k)
+        scores = np.take_along_axis(proba, top, axis=1)
+        return [[(self.columns[i], round(float(p), 4)) for i, p in zip(row, row_scores)]
+                for row, row_scores in zip(top, scores)]
+
+    def info(self):
+        info = {
+            'version': self.version,
+            'source': self.source,
+            'engine': type(self.predictor).__name__,
+            'loaded_at': self.loaded_at,
+            **self.load_stats
+        }
+        if isinstance(self.predictor, CascadePredictor):
+            info['distilled'] = {**self.predictor.stats(), 'report': self.bundle.get('distilled_report')}
+        return info
+
+
+def read_model_bundle(source):
+    """Load a career_predictor.pkl bundle or an artifact directory, tagged with a version hash"""
+    if os.path.isdir(source):
+        return load_model_artifact(source)
+    with open(source, 'rb') as f:
+        model_version = hashlib.sha256(f.read()).hexdigest()
+    bundle = joblib.load(source)
+    bundle['model_version'] = model_version
+    return bundle
+
+
+def load_model_handle(source, flat_forest=False, distilled=False, confidence=None):
+    """Build a ModelHandle from a bundle file or artifact directory.
+
+    Artifacts always serve from their FlatForest; a pickled bundle serves from the sklearn
+    estimator unless flat_forest is set. With distilled, a bundle that has a distilled tree
+    serves from a CascadePredictor that escalates to the forest below its confidence
+    threshold (the one saved with the tree unless confidence is given).
+    """
+    bundle, load_stats = timed_load(read_model_bundle, source)
+    predictor = bundle['model']
+    if flat_forest and not isinstance(predictor, FlatForest):
+        predictor = FlatForest.from_sklearn(predictor)
+    if distilled and bundle.get('distilled') is not None:
+        predictor = CascadePredictor(bundle['distilled'], predictor, confidence)
+    return ModelHandle(
+        version=bundle['model_version'],
+        source=source,
+        predictor=predictor,
+        encoder=FeatureEncoder.from_bundle(bundle),
+        le_career=bundle['le_career'],
+        bundle=bundle,
+        loaded_at=datetime.now().isoformat(timespec='seconds'),
+        load_stats=load_stats,
+    )
+
+
+def validate_model_handle(handle):
+    """Run a test prediction; raises if the handle cannot serve"""
+    career = handle.predict(handle.encoder.encode(VALIDATION_PROFILE))[0]
+    if career not in handle.classes:
+        raise ValueError(f'test prediction returned unknown career {career!r}')
+
+
+class ModelRegistry:
+    """Holds the active ModelHandle plus a short history for rollback"""
+
+    def __init__(self, loader=load_model_handle, history_size=3):
+        self.loader = loader
+        self.history_size = history_size
+        self.active = None
+        self.history = []
+        self.listeners = []
+        self.reloading = False
+        self.last_error = None
+        self._lock = threading.Lock()
+
+    def on_swap(self, callback):
+        """Call callback(handle) every time a different handle becomes active"""
+        self.listeners.append(callback)
+
+    def _swap(self, handle, keep_previous=True):
+        with self._lock:
+            previous = self.active
+            if keep_previous and previous is not None:
+                self.history = ([previous] + self.history)[:self.history_size]
+            # A single reference assignment: readers see either the old or the new handle
+            self.active = handle
+        for callback in self.listeners:
+            callback(handle)
+        return previous
+
+    def load(self, source, **kwargs):
+        """Load, validate and activate a model. Raises on failure, leaving the active model as is"""
+        try:
+            handle = self.loader(source, **kwargs)
+            validate_model_handle(handle)
+        except Exception as e:
+            self.last_error = f'{source}: {e}'
+            raise
+        self.last_error = None
+        self._swap(handle)
+        return handle
+
+    def load_in_background(self, source, **kwargs):
+        """Start loading a model on a background thread; returns False if a reload is running"""
+        with self._lock:
+            if self.reloading:
+                return False
+            self.reloading = True
+
+        def run():
+            try:
+                self.load(source, **kwargs)
+                print(f'Model {self.active.version[:12]} loaded from {source}')
+            except Exception as e:
+                print('Model reload failed:', e)
+            finally:
+                self.reloading = False
+
+        threading.Thread(target=run, name='model-reload', daemon=True).start()
+        return True
+
+    def rollback(self):
+        """Reactivate the previous model version; returns it, or None if there is none"""
+        with self._lock:
+            if not self.history:
+                return None
+            handle = self.history.pop(0)
+        self._swap(handle, keep_previous=False)
+        return handle
+
+    def status(self):
+        return {
+            'active': self.active.info() if self.active else None,
+            'history': [handle.info() for handle in self.history],
+            'reloading': self.reloading,
+            'last_error': self.last_error,
+        }
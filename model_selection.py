@@ -0,0 +1,234 @@
+"""Latency-aware model selection for the notebook's career prediction dataset.
+
+CareerPredictor.train_model in quiz_mini5.ipynb compares Random Forest, Gradient Boosting,
+Logistic Regression and SVM pipelines. Here each candidate is cross-validated and fitted in
+its own worker process, then timed in this process one at a time (so the candidates do not
+compete for the CPU while they are measured):
+
+- cv_accuracy: mean 5-fold accuracy on the training split
+- single_row_ms: p50/p95 latency of predict() on one row, as in predict_career
+- batch_row_us: per-row latency of predict() on a batch of held-out rows
+- model_bytes: pickled size of the fitted pipeline
+
+The winner is the most accurate candidate on the accuracy/latency Pareto front whose
+single-row p50 latency fits the latency budget. The model is saved in the notebook's
+save_model format with a JSON comparison report next to it:
+
+    python model_selection.py career_prediction_dataset.csv --output career_prediction_model.pkl \\
+        --latency-budget-ms 5
+"""
+import argparse
+import json
+import os
+import pickle
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import joblib
+import numpy as np
+import pandas as pd
+from sklearn.compose import ColumnTransformer
+from sklearn.ensemble import GradientBoostingClassifier, RandomForestClassifier
+from sklearn.linear_model import LogisticRegression
+from sklearn.metrics import accuracy_score
+from sklearn.model_selection import cross_val_score, train_test_split
+from sklearn.pipeline import Pipeline
+from sklearn.preprocessing import LabelEncoder, OneHotEncoder, StandardScaler
+from sklearn.svm import SVC
+
+NUMERICAL_FEATURES = [
+    'problem_solving', 'creativity', 'people_interaction', 'leadership',
+    'technical_skills', 'analytical_thinking', 'communication_skills',
+    'attention_to_detail', 'stress_tolerance', 'innovation',
+    'income_importance', 'job_security', 'work_life_balance',
+    'career_growth', 'autonomy', 'age', 'years_experience',
+    'programming_skills', 'design_skills', 'mathematical_skills',
+    'writing_skills', 'public_speaking', 'foreign_languages',
+    'certifications', 'volunteer_experience', 'internship_experience',
+    'interest_technology', 'interest_healthcare', 'interest_education',
+    'interest_arts', 'interest_business', 'interest_science',
+    'interest_law', 'interest_sports', 'interest_travel', 'interest_writing',
+]
+CATEGORICAL_FEATURES = ['education_level', 'work_environment', 'work_style', 'personality_type']
+TARGET = 'career'
+
+CV_FOLDS = 5
+LATENCY_REPEATS = 50
+BATCH_ROWS = 1000
+
+
+def make_candidates(random_state=42):
+    """The classifiers compared by CareerPredictor.train_model"""
+    return {
+        'Random Forest': RandomForestClassifier(n_estimators=100, random_state=random_state),
+        'Gradient Boosting': GradientBoostingClassifier(n_estimators=100, random_state=random_state),
+        'Logistic Regression': LogisticRegression(max_iter=1000, random_state=random_state),
+        'SVM': SVC(kernel='rbf', random_state=random_state),
+    }
+
+
+def make_preprocessor():
+    return ColumnTransformer(transformers=[
+        ('num', StandardScaler(), NUMERICAL_FEATURES),
+        ('cat', OneHotEncoder(drop='first', handle_unknown='ignore'), CATEGORICAL_FEATURES),
+    ])
+
+
+def _fit_candidate(name, classifier, X_train, y_train, cv):
+    """Cross-validate and fit one candidate (runs in a worker process)"""
+    pipeline = Pipeline([('preprocessor', make_preprocessor()), ('classifier', classifier)])
+    start = time.perf_counter()
+    scores = cross_val_score(pipeline, X_train, y_train, cv=cv, scoring='accuracy')
+    pipeline.fit(X_train, y_train)
+    return name, pipeline, scores, time.perf_counter() - start
+
+
+def measure_latency(pipeline, X, repeats=LATENCY_REPEATS, batch_rows=BATCH_ROWS):
+    """(single-row p50 ms, single-row p95 ms, per-row us on a batch of up to batch_rows)"""
+    row = X.iloc[:1]
+    pipeline.predict(row)  # warm up
+    samples = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        pipeline.predict(row)
+        samples.append(time.perf_counter() - start)
+    batch = X.iloc[:batch_rows]
+    best = min(_timed(pipeline.predict, batch) for _ in range(3))
+    samples = np.array(samples) * 1e3
+    return float(np.percentile(samples, 50)), float(np.percentile(samples, 95)), best / len(batch) * 1e6
+
+
+def _timed(function, *args):
+    start = time.perf_counter()
+    function(*args)
+    return time.perf_counter() - start
+
+
+def pareto_front(results):
+    """Names of the candidates no other candidate beats on both accuracy and latency"""
+    front = []
+    for r in results:
+        dominated = any(
+            o['cv_accuracy'] >= r['cv_accuracy'] and o['single_row_ms'] <= r['single_row_ms']
+            and (o['cv_accuracy'] > r['cv_accuracy'] or o['single_row_ms'] < r['single_row_ms'])
+            for o in results)
+        if not dominated:
+            front.append(r['name'])
+    return front
+
+
+def choose(results, latency_budget_ms=None):
+    """(name, reason): the most accurate Pareto candidate within the latency budget.
+
+    Without a budget this is the most accurate candidate overall. If no candidate fits the
+    budget, the fastest one is chosen.
+    """
+    front = [r for r in results if r['pareto']]
+    within = [r for r in front if latency_budget_ms is None or r['single_row_ms'] <= latency_budget_ms]
+    if within:
+        best = max(within, key=lambda r: (r['cv_accuracy'], -r['single_row_ms']))
+        if latency_budget_ms is None:
+            return best['name'], 'highest cross-validated accuracy'
+        return best['name'], f'most accurate Pareto candidate within {latency_budget_ms} ms'
+    best = min(front, key=lambda r: r['single_row_ms'])
+    return best['name'], f'no candidate within {latency_budget_ms} ms; chose the fastest'
+
+
+def select_model(X, y, latency_budget_ms=None, test_size=0.2, random_state=42, cv=CV_FOLDS,
+                 workers=None, candidates=None):
+    """Compare the candidates on (X, y); returns (fitted winning pipeline, report dict)"""
+    X_train, X_test, y_train, y_test = train_test_split(
+        X, y, test_size=test_size, random_state=random_state, stratify=y)
+    candidates = candidates or make_candidates(random_state)
+
+    start = time.perf_counter()
+    with ProcessPoolExecutor(workers or min(len(candidates), os.cpu_count() or 1)) as pool:
+        futures = [pool.submit(_fit_candidate, name, classifier, X_train, y_train, cv)
+                   for name, classifier in candidates.items()]
+        fitted = [future.result() for future in futures]
+    training_seconds = time.perf_counter() - start
+
+    results, pipelines = [], {}
+    for name, pipeline, scores, fit_seconds in fitted:
+        p50, p95, batch_us = measure_latency(pipeline, X_test)
+        pipelines[name] = pipeline
+        results.append({
+            'name': name,
+            'cv_accuracy': round(float(scores.mean()), 4),
+            'cv_std': round(float(scores.std()), 4),
+            'test_accuracy': round(float(accuracy_score(y_test, pipeline.predict(X_test))), 4),
+            'single_row_ms': round(p50, 3),
+            'single_row_p95_ms': round(p95, 3),
+            'batch_row_us': round(batch_us, 2),
+            'model_bytes': len(pickle.dumps(pipeline)),
+            'fit_seconds': round(fit_seconds, 2),
+        })
+    front = pareto_front(results)
+    for r in results:
+        r['pareto'] = r['name'] in front
+    selected, reason = choose(results, latency_budget_ms)
+
+    report = {
+        'rows': len(X),
+        'train_rows': len(X_train),
+        'cv_folds': cv,
+        'latency_budget_ms': latency_budget_ms,
+        'training_seconds': round(training_seconds, 2),
+        'selected': selected,
+        'reason': reason,
+        'candidates': results,
+    }
+    return pipelines[selected], report
+
+
+def report_path(model_path):
+    return f'{os.path.splitext(model_path)[0]}.report.json'
+
+
+def export(pipeline, label_encoder, feature_names, report, model_path):
+    """Save in the notebook's save_model format, with the report alongside"""
+    if os.path.dirname(model_path):
+        os.makedirs(os.path.dirname(model_path), exist_ok=True)
+    joblib.dump({
+        'model': pipeline,
+        'label_encoder': label_encoder,
+        'career_categories': list(label_encoder.classes_),
+        'feature_names': feature_names,
+    }, model_path)
+    with open(report_path(model_path), 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+
+
+def print_report(report):
+    print(f'{"candidate":<20} {"cv acc":>7} {"test acc":>8} {"row p50 ms":>10} {"batch us/row":>12} '
+          f'{"size KB":>9} {"pareto":>6}')
+    for r in report['candidates']:
+        print(f'{r["name"]:<20} {r["cv_accuracy"]:>7.4f} {r["test_accuracy"]:>8.4f} '
+              f'{r["single_row_ms"]:>10.3f} {r["batch_row_us"]:>12.2f} {r["model_bytes"] / 1024:>9.1f} '
+              f'{"yes" if r["pareto"] else "":>6}')
+    print(f'Selected {report["selected"]}: {report["reason"]}')
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Select the career model on accuracy and latency')
+    parser.add_argument('data', help='CSV in the notebook schema (career_prediction_dataset.csv)')
+    parser.add_argument('--output', default='career_prediction_model.pkl')
+    parser.add_argument('--latency-budget-ms', type=float,
+                        help='maximum single-row p50 predict latency (default: no budget)')
+    parser.add_argument('--workers', type=int, help='processes for cross-validation (default: one per candidate)')
+    parser.add_argument('--cv', type=int, default=CV_FOLDS)
+    args = parser.parse_args()
+
+    df = pd.read_csv(args.data)
+    label_encoder = LabelEncoder()
+    y = label_encoder.fit_transform(df[TARGET])
+    X = df.drop(TARGET, axis=1)
+    pipeline, report = select_model(X, y, latency_budget_ms=args.latency_budget_ms, cv=args.cv,
+                                    workers=args.workers)
+    export(pipeline, label_encoder, NUMERICAL_FEATURES + CATEGORICAL_FEATURES, report, args.output)
+    print_report(report)
+    print(f'Model saved as {args.output}, report as {report_path(args.output)}')
+
+
+if __name__ == '__main__':
+    main()
@@ -1,12 +1,26 @@
-from flask import Flask, render_template, request, redirect, url_for, flash, session
+from flask import Flask, render_template, request, redirect, url_for, flash, session, g, abort
 import pandas as pd
 import numpy as np
 import os
+import atexit
 from datetime import datetime
 import joblib
 import hashlib
-import sqlite3
+import hmac
+import threading
+import time
 from functools import wraps
+from prediction_cache import PredictionCache, canonical_profile
+from model_registry import ModelRegistry
+from db import Database
+from result_writer import ResultWriter
+from career_catalog import catalog as career_catalog
+from dataset_store import load_course_store, load_skill_store
+from response_cache import ResponseCache, content_version
+from rule_engine import DEFAULT_RULES_PATH, RuleEngine
+from session_store import BACKENDS as SESSION_BACKENDS, MemorySessionStore, SQLiteSessionStore, ServerSessionInterface
+from analytics import DEFAULT_WEEKS as ANALYTICS_WEEKS, MAX_WEEKS as ANALYTICS_MAX_WEEKS, career_distribution
+from metrics import CONTENT_TYPE as METRICS_CONTENT_TYPE, Registry, STAGE_BUCKETS, Stopwatch
 
 app = Flask(__name__)
 app.secret_key = 'pathfinder_secret_key_2024'
@@ -14,76 +28,181 @@ app.secret_key = 'pathfinder_secret_key_2024'
 # Load datasets
 def load_datasets():
     careers_df = pd.read_csv('datasets/careers_dataset.csv')
-    skills_df = pd.read_csv('datasets/skills_dataset.csv')
-    courses_df = pd.read_csv('datasets/courses_dataset.csv')
-    return careers_df, skills_df, courses_df
+    return careers_df
 
 # Initialize datasets
 try:
-    careers_df, skills_df, courses_df = load_datasets()
+    careers_df = load_datasets()
 except:
     careers_df = pd.DataFrame()
-    skills_df = pd.DataFrame()
-    courses_df = pd.DataFrame()
+
+# Columnar stores behind /courses and /skills, filtered and paginated from query parameters
+course_store = load_course_store()
+skill_store = load_skill_store()
+
+# Rendered catalog/static pages, invalidated when anything under datasets/ or templates/
+# changes. PATHFINDER_RESPONSE_CACHE_SIZE=0 keeps ETags but stores nothing.
+RESPONSE_CACHE_SIZE = int(os.environ.get('PATHFINDER_RESPONSE_CACHE_SIZE', 512))
+RESPONSE_MAX_AGE = 300  # seconds anonymous pages may be reused without revalidating
+response_cache = ResponseCache(content_version(['datasets', 'templates']),
+                               maxsize=RESPONSE_CACHE_SIZE, max_age=RESPONSE_MAX_AGE)
+
+# Decision tables behind get_fallback_career_recommendation; POST /fallback/reload re-reads them
+FALLBACK_RULES_PATH = os.environ.get('PATHFINDER_FALLBACK_RULES', DEFAULT_RULES_PATH)
+fallback_rules = RuleEngine.from_file(FALLBACK_RULES_PATH)
 
 # Load ML model and encoders
 MODEL_PATH = 'ml_model/career_predictor.pkl'
-clf = None
-mlb_interests = mlb_skills = mlb_hobbies = le_personality = le_work_style = le_career = None
+# Directory written by `train_model.py --artifact-dir`. When set, the model is loaded from
+# memory-mapped arrays on the first prediction instead of unpickling MODEL_PATH at import.
+MODEL_ARTIFACT_DIR = os.environ.get('PATHFINDER_MODEL_ARTIFACT')
+USE_FLAT_FOREST = os.environ.get('PATHFINDER_FLAT_FOREST', '0') == '1'
+# With PATHFINDER_DISTILLED=1, models trained with a distilled fast-path tree answer from it
+# when it is confident and escalate to the forest otherwise. Its answers and match scores are
+# approximations of the forest's, so it is off unless opted into.
+# PATHFINDER_DISTILLED_CONFIDENCE overrides the threshold saved with the tree
+USE_DISTILLED = os.environ.get('PATHFINDER_DISTILLED', '0') == '1'
+DISTILLED_CONFIDENCE = os.environ.get('PATHFINDER_DISTILLED_CONFIDENCE')
+MODEL_OPTIONS = {
+    'flat_forest': USE_FLAT_FOREST,
+    'distilled': USE_DISTILLED,
+    'confidence': float(DISTILLED_CONFIDENCE) if DISTILLED_CONFIDENCE else None,
+}
+
+# Cache of predictions keyed on the model version and canonical profile
+PREDICTION_CACHE_SIZE = 4096
+PREDICTION_CACHE_TTL = 3600  # seconds
+prediction_cache = PredictionCache(maxsize=PREDICTION_CACHE_SIZE, ttl=PREDICTION_CACHE_TTL)
+
+# The active model (estimator, encoder and label decoder) is one immutable handle that
+# reloads and rollbacks swap atomically; the prediction cache is cleared on every swap
+model_registry = ModelRegistry()
+model_registry.on_swap(lambda handle: prediction_cache.set_model_version(handle.version))
+model_load_attempted = False
+model_load_lock = threading.Lock()
 
 def load_ml_model():
-    global clf, mlb_interests, mlb_skills, mlb_hobbies, le_personality, le_work_style, le_career
+    global model_load_attempted
+    model_load_attempted = True
     try:
-        ml_bundle = joblib.load(MODEL_PATH)
-        clf = ml_bundle['model']
-        mlb_interests = ml_bundle['mlb_interests']
-        mlb_skills = ml_bundle['mlb_skills']
-        mlb_hobbies = ml_bundle['mlb_hobbies']
-        le_personality = ml_bundle['le_personality']
-        le_work_style = ml_bundle['le_work_style']
-        le_career = ml_bundle['le_career']
-        print('ML model loaded successfully!')
+        handle = model_registry.load(MODEL_ARTIFACT_DIR or MODEL_PATH, **MODEL_OPTIONS)
+        print(f"ML model loaded successfully in {handle.load_stats['load_seconds']:.3f}s!")
         return True
     except Exception as e:
         print('ML model not loaded:', e)
         return False
 
-# Load the model
-load_ml_model()
+def get_model():
+    """Return the active ModelHandle, loading the model on first use; None if unavailable"""
+    if model_registry.active is None and not model_load_attempted:
+        with model_load_lock:
+            if not model_load_attempted:
+                load_ml_model()
+    return model_registry.active
+
+# Load the model now, unless it comes from an artifact that is loaded lazily
+if not MODEL_ARTIFACT_DIR:
+    load_ml_model()
+
+# Metrics served at /metrics in the Prometheus text format (values are per process)
+metrics = Registry()
+request_duration = metrics.histogram('pathfinder_http_request_duration_seconds',
+                                     'Time to handle a request, by route', ('route', 'method'))
+requests_total = metrics.counter('pathfinder_http_requests_total', 'Requests handled, by route and status',
+                                 ('route', 'method', 'status'))
+stage_duration = metrics.histogram('pathfinder_stage_duration_seconds',
+                                   'Time spent in each stage of the prediction and result pipelines',
+                                   ('pipeline', 'stage'), buckets=STAGE_BUCKETS)
+recommendations_total = metrics.counter('pathfinder_recommendations_total',
+                                        'Assessment results, by source (model or fallback rules)', ('source',))
+model_errors_total = metrics.counter('pathfinder_model_errors_total',
+                                     'Model predictions that raised and fell back to the rules')
+db_wait = metrics.histogram('pathfinder_db_wait_seconds',
+                            'Time blocked waiting for a pooled connection or the write lock', ('kind',),
+                            buckets=STAGE_BUCKETS)
+for name, documentation, read in (
+        ('pathfinder_prediction_cache_hits_total', 'Prediction cache hits', lambda: prediction_cache.hits),
+        ('pathfinder_prediction_cache_misses_total', 'Prediction cache misses', lambda: prediction_cache.misses),
+        ('pathfinder_page_cache_hits_total', 'Rendered page cache hits', lambda: response_cache.hits),
+        ('pathfinder_page_cache_misses_total', 'Rendered page cache misses', lambda: response_cache.misses),
+        ('pathfinder_page_not_modified_total', 'Cached pages answered with 304 Not Modified',
+         lambda: response_cache.not_modified)):
+    metrics.callback(name, documentation, read, kind='counter')
+
+def cascade_stat(name):
+    """Read a CascadePredictor counter of the active model; None (not reported) without one"""
+    predictor = getattr(model_registry.active, 'predictor', None)
+    return getattr(predictor, name, None)
+
+metrics.callback('pathfinder_distilled_rows_total', 'Rows predicted by the distilled model cascade',
+                 lambda: cascade_stat('rows'), kind='counter')
+metrics.callback('pathfinder_distilled_escalations_total',
+                 'Rows the distilled tree was not confident about and sent to the full forest',
+                 lambda: cascade_stat('escalated'), kind='counter')
+
+def stopwatch(pipeline):
+    return Stopwatch(stage_duration, pipeline)
+
+@app.before_request
+def start_request_timer():
+    g.request_start = time.perf_counter()
+
+@app.after_request
+def record_request_metrics(response):
+    start = g.pop('request_start', None)
+    if start is not None:
+        # The URL rule, not the path, so /career/<name> is one series however many careers exist
+        route = request.url_rule.rule if request.url_rule else 'unmatched'
+        request_duration.observe(time.perf_counter() - start, route, request.method)
+        requests_total.inc(route, request.method, str(response.status_code))
+    return response
 
 # Database initialization
+DATABASE_PATH = os.environ.get('PATHFINDER_DB', 'pathfinder.db')
+db = Database(DATABASE_PATH, on_wait=lambda kind, seconds: db_wait.observe(seconds, kind))
+
 def init_db():
-    conn = sqlite3.connect('pathfinder.db')
-    cursor = conn.cursor()
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS users (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            first_name TEXT NOT NULL,
-            last_name TEXT NOT NULL,
-            email TEXT UNIQUE NOT NULL,
-            password TEXT NOT NULL,
-            age INTEGER,
-            education_level TEXT,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        )
-    ''')
-    
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS user_results (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            user_id INTEGER,
-            predicted_career TEXT,
-            profile_data TEXT,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            FOREIGN KEY (user_id) REFERENCES users (id)
-        )
-    ''')
-    conn.commit()
-    conn.close()
+    db.init_schema()
 
 # Initialize database
 init_db()
 
+# PATHFINDER_SESSION_BACKEND=memory|sqlite keeps sessions on the server with only an opaque
+# id in the cookie: memory for a single worker process, sqlite (the app database) for several.
+# The default, cookie, is Flask's signed cookie holding the whole session.
+SESSION_BACKEND = os.environ.get('PATHFINDER_SESSION_BACKEND', 'cookie')
+if SESSION_BACKEND not in SESSION_BACKENDS:
+    raise ValueError(f'PATHFINDER_SESSION_BACKEND must be one of {SESSION_BACKENDS}, got {SESSION_BACKEND!r}')
+if SESSION_BACKEND == 'memory':
+    app.session_interface = ServerSessionInterface(MemorySessionStore())
+elif SESSION_BACKEND == 'sqlite':
+    app.session_interface = ServerSessionInterface(SQLiteSessionStore(db))
+
+# With PATHFINDER_WRITE_BEHIND=1, results are queued and inserted in batches by a background
+# thread instead of on the request; anything still queued is written at exit
+WRITE_BEHIND = os.environ.get('PATHFINDER_WRITE_BEHIND', '0') == '1'
+result_writer = None
+
+def start_result_writer():
+    """Start the write-behind thread. Threads do not survive fork(), so a server that forks
+    workers after importing the app (serve.py) calls this again in every worker."""
+    global result_writer
+    result_writer = ResultWriter(db).start()
+    atexit.register(result_writer.close)
+
+# serve.py imports the app in the gunicorn master with PATHFINDER_PRELOAD=1 and starts the
+# writer in each worker from post_fork, so the master runs no writer of its own
+if WRITE_BEHIND:
+    if os.environ.get('PATHFINDER_PRELOAD') != '1':
+        start_result_writer()
+    metrics.callback('pathfinder_result_queue_depth', 'Results waiting for the write-behind thread',
+                     lambda: result_writer.queue.qsize())
+    metrics.callback('pathfinder_results_written_total', 'Results inserted by the write-behind thread',
+                     lambda: result_writer.written, kind='counter')
+    metrics.callback('pathfinder_results_sync_writes_total',
+                     'Results written on the request because the write-behind queue was full or closed',
+                     lambda: result_writer.sync_writes, kind='counter')
+
 # Authentication decorator
 def login_required(f):
     @wraps(f)
@@ -94,44 +213,38 @@ def login_required(f):
         return f(*args, **kwargs)
     return decorated_function
 
+# Admin API (model reloads, stats and metrics) is only enabled when PATHFINDER_ADMIN_TOKEN is
+# set. The token goes in X-Admin-Token, or as a bearer token for scrapers such as Prometheus.
+ADMIN_TOKEN = os.environ.get('PATHFINDER_ADMIN_TOKEN')
+
+def admin_required(f):
+    @wraps(f)
+    def decorated_function(*args, **kwargs):
+        token = request.headers.get('X-Admin-Token', '')
+        if not token and request.authorization and request.authorization.type == 'bearer':
+            token = request.authorization.token or ''
+        if not ADMIN_TOKEN or not hmac.compare_digest(token.encode(), ADMIN_TOKEN.encode()):
+            return {'error': 'Admin token required'}, 403
+        return f(*args, **kwargs)
+    return decorated_function
+
 # Password hashing
 def hash_password(password):
     return hashlib.sha256(password.encode()).hexdigest()
 
 # User authentication functions
 def get_user_by_email(email):
-    conn = sqlite3.connect('pathfinder.db')
-    cursor = conn.cursor()
-    cursor.execute('SELECT * FROM users WHERE email = ?', (email,))
-    user = cursor.fetchone()
-    conn.close()
-    return user
+    return db.get_user_by_email(email)
 
 def create_user(first_name, last_name, email, password, age, education_level):
-    conn = sqlite3.connect('pathfinder.db')
-    cursor = conn.cursor()
-    try:
-        cursor.execute('''
-            INSERT INTO users (first_name, last_name, email, password, age, education_level)
-            VALUES (?, ?, ?, ?, ?, ?)
-        ''', (first_name, last_name, email, hash_password(password), age, education_level))
-        conn.commit()
-        user_id = cursor.lastrowid
-        conn.close()
-        return user_id
-    except sqlite3.IntegrityError:
-        conn.close()
-        return None
+    return db.create_user(first_name, last_name, email, hash_password(password), age, education_level)
 
-def save_user_result(user_id, predicted_career, profile_data):
-    conn = sqlite3.connect('pathfinder.db')
-    cursor = conn.cursor()
-    cursor.execute('''
-        INSERT INTO user_results (user_id, predicted_career, profile_data)
-        VALUES (?, ?, ?)
-    ''', (user_id, predicted_career, str(profile_data)))
-    conn.commit()
-    conn.close()
+def save_user_result(user_id, predicted_career, profile_data, top_careers=None, bundle=None):
+    """The new result's id, or None when it was queued for the write-behind thread"""
+    if result_writer:
+        result_writer.submit(user_id, predicted_career, profile_data, top_careers, bundle)
+        return None
+    return db.save_user_result(user_id, predicted_career, profile_data, top_careers, bundle)
 
 @app.route('/login', methods=['GET', 'POST'])
 def login():
@@ -210,21 +323,20 @@ def dashboard():
 @app.route('/my-results')
 @login_required
 def my_results():
-    # Get user's previous results from database
-    conn = sqlite3.connect('pathfinder.db')
-    cursor = conn.cursor()
-    cursor.execute('''
-        SELECT predicted_career, profile_data, created_at 
-        FROM user_results 
-        WHERE user_id = ? 
-        ORDER BY created_at DESC
-    ''', (session['user_id'],))
-    results = cursor.fetchall()
-    conn.close()
-    
-    return render_template('my_results.html', results=results)
+    # Get one page of the user's previous results; ?before=<created_at>|<id> continues
+    # after the last result of the previous page
+    cursor = None
+    before = request.args.get('before', '')
+    created_at, _, result_id = before.rpartition('|')
+    if created_at and result_id.isdigit():
+        cursor = (created_at, int(result_id))
+    results, next_cursor = db.get_user_results(session['user_id'], cursor=cursor)
+    next_page = f'{next_cursor[0]}|{next_cursor[1]}' if next_cursor else None
+    
+    return render_template('my_results.html', results=results, next_page=next_page)
 
 @app.route('/')
+@response_cache.cached(flash_free=True)
 def home():
     return render_template('home.html')
 
@@ -248,12 +360,15 @@ def profile():
             'personality': request.form.get('personality'),
             'work_style': request.form.get('work_style')
         }
+        # /results now shows this profile rather than the last stored result
+        session.pop('result_id', None)
         return redirect(url_for('results'))
     return render_template('profile.html')
 
 @app.route('/submit_profile', methods=['POST'])
 @login_required
 def submit_profile():
+    clock = stopwatch('submit_profile')
     profile = {
         'name': request.form.get('name'),
         'age': int(request.form.get('age', 16)),
@@ -280,57 +395,118 @@ def submit_profile():
     }
     for i in range(1, 11):
         data[f'quiz_q{i}'] = profile[f'quiz_q{i}']
-    if clf and all([mlb_interests, mlb_skills, mlb_hobbies, le_personality, le_work_style, le_career]):
+    clock.lap('parse_form')
+    model = get_model()
+    top_careers = None
+    if model:
         try:
-            X_interests = mlb_interests.transform([data['interests']])
-            X_skills = mlb_skills.transform([data['skills']])
-            X_hobbies = mlb_hobbies.transform([data['hobbies']])
-            X_personality = le_personality.transform([data['personality']])
-            X_work_style = le_work_style.transform([data['work_style']])
-            X_all = np.hstack([
-                [[data['age'], data['percentage']]],
-                X_interests,
-                X_skills,
-                X_hobbies,
-                X_personality.reshape(1, -1),
-                X_work_style.reshape(1, -1),
-                [[data[f'quiz_q{i}'] for i in range(1, 11)]]
-            ])
-            pred = clf.predict(X_all)[0]
-            career = le_career.inverse_transform([pred])[0]
+            top_careers = top_careers_json(rank_careers(model, data, clock), DEFAULT_TOP_K)
         except Exception as e:
             print(f"ML prediction failed: {e}")
-            career = get_fallback_career_recommendation(data)
+            model_errors_total.inc()
+            clock.lap('predict')
+    if top_careers:
+        career = top_careers[0]['career']
+        recommendations_total.inc('model')
     else:
         career = get_fallback_career_recommendation(data)
+        recommendations_total.inc('fallback')
+        clock.lap('fallback')
+    bundle = build_result_bundle(profile, career, top_careers)
+    clock.lap('bundle')
     session['user_profile'] = profile
     session['predicted_career'] = career
+    session['top_careers'] = top_careers
     
-    # Save result to database
-    save_user_result(session['user_id'], career, profile)
+    # Save result to database, with the results page content so it is never rebuilt
+    session['result_id'] = save_user_result(session['user_id'], career, profile, top_careers, bundle)
+    clock.lap('save_result')
     
-    return redirect(url_for('results'))
+    if session['result_id']:
+        response = redirect(url_for('result_detail', result_id=session['result_id']))
+    else:
+        response = redirect(url_for('results'))
+    clock.lap('redirect')
+    return response
 
 @app.route('/results')
 @login_required
 def results():
+    # The latest submission is stored with its bundle; show that copy
+    if session.get('result_id'):
+        return redirect(url_for('result_detail', result_id=session['result_id']))
+    # Results not stored yet (write-behind) or a profile from /profile: build from the session
+    clock = stopwatch('results')
     profile = session.get('user_profile')
     predicted_career = session.get('predicted_career')
+    bundle = build_result_bundle(profile, predicted_career, session.get('top_careers'))
+    clock.lap('recommendations')
+    page = render_template('results.html', profile=profile, predicted_career=predicted_career, **bundle)
+    clock.lap('render')
+    return page
+
+@app.route('/results/<int:result_id>')
+@login_required
+@response_cache.cached(flash_free=True)
+def result_detail(result_id):
+    """A stored result, rendered from the bundle saved with it.
+
+    Stored results never change, so the page is cached per user like the catalog pages and
+    revalidated by ETag; only the owner's successful renders are ever cached.
+    """
+    clock = stopwatch('result_detail')
+    result = db.get_user_result(result_id)
+    if result is None or result['user_id'] != session['user_id']:
+        abort(404)
+    # Results saved before bundles were stored are built from their profile and ranking
+    bundle = result['bundle'] or build_result_bundle(result['profile'], result['predicted_career'],
+                                                     result['top_careers'])
+    clock.lap('load')
+    page = render_template('results.html', profile=result['profile'],
+                           predicted_career=result['predicted_career'], **bundle)
+    clock.lap('render')
+    return page
+
+# Shown instead of engineering alternatives to students below 60%
+GENERAL_ALTERNATIVE_PATHS = [
+    {
+        'name': 'Vocational Training',
+        'description': 'Short-term skill development programs',
+        'duration': '6-12 months',
+        'cost': '₹10,000-50,000',
+        'job_prospects': 'Good'
+    },
+    {
+        'name': 'IT Certification',
+        'description': 'Professional IT certifications',
+        'duration': '3-6 months',
+        'cost': '₹5,000-25,000',
+        'job_prospects': 'Excellent'
+    },
+    {
+        'name': 'Entrepreneurship',
+        'description': 'Start your own business',
+        'duration': 'Ongoing',
+        'cost': 'Varies',
+        'job_prospects': 'High potential'
+    }
+]
+
+def build_result_bundle(profile, predicted_career, top_careers=None):
+    """Everything the results page shows besides the profile, as JSON-serializable data.
+
+    Returns a dict with recommendations (one card per ranked career), alternative_paths and
+    engineering_alternatives; it is computed once on submission and stored with the result.
+    """
     recommendations = []
     alternative_paths = []
     engineering_alternatives = None
     
     if predicted_career and predicted_career != "Unknown":
-        # Get career details for the predicted career
-        career_details = get_career_details(predicted_career)
-        
-        recommendations = [{
-            'name': predicted_career,
-            'match_score': 95,
-            'description': career_details.get('description', 'This is your best-fit career path based on your profile and quiz.'),
-            'salary_range': career_details.get('salary_range', '₹3-15 LPA'),
-            'requirements': career_details.get('education', 'See details')
-        }]
+        # Model results are ranked with probabilities; fallback results are a single career
+        ranked = top_careers or [{'career': predicted_career, 'probability': None}]
+        recommendations = [career_recommendation(entry['career'], entry['probability'])
+                           for entry in ranked]
         
         # Check if student wants engineering with lower percentage
         if (profile and 
@@ -344,109 +520,254 @@ def results():
         
         # Add general alternative paths for lower percentages
         elif profile and profile.get('percentage', 0) < 60:
-            alternative_paths = [
-                {
-                    'name': 'Vocational Training',
-                    'description': 'Short-term skill development programs',
-                    'duration': '6-12 months',
-                    'cost': '₹10,000-50,000',
-                    'job_prospects': 'Good'
-                },
-                {
-                    'name': 'IT Certification',
-                    'description': 'Professional IT certifications',
-                    'duration': '3-6 months',
-                    'cost': '₹5,000-25,000',
-                    'job_prospects': 'Excellent'
-                },
-                {
-                    'name': 'Entrepreneurship',
-                    'description': 'Start your own business',
-                    'duration': 'Ongoing',
-                    'cost': 'Varies',
-                    'job_prospects': 'High potential'
-                }
-            ]
-    
-    return render_template('results.html', 
-                         profile=profile, 
-                         predicted_career=predicted_career, 
-                         recommendations=recommendations, 
-                         alternative_paths=alternative_paths,
-                         engineering_alternatives=engineering_alternatives)
-
-@app.route('/career/<career_name>')
+            alternative_paths = GENERAL_ALTERNATIVE_PATHS
+    return {
+        'recommendations': recommendations,
+        'alternative_paths': alternative_paths,
+        'engineering_alternatives': engineering_alternatives,
+    }
+
+def career_recommendation(career, probability=None):
+    """A results-page card for a career; match_score is the model probability in percent"""
+    career_details = get_career_details(career)
+    return {
+        'name': career,
+        'match_score': None if probability is None else round(probability * 100),
+        'description': career_details.get('description', 'This is your best-fit career path based on your profile and quiz.'),
+        'salary_range': career_details.get('salary_range', '₹3-15 LPA'),
+        'requirements': career_details.get('education', 'See details')
+    }
+
+@app.route('/career/<path:career_name>')
+@response_cache.cached(flash_free=True)
 def career_detail(career_name):
     career_info = get_career_details(career_name)
     return render_template('career_detail.html', career=career_info)
 
+# Largest number of suggestions /api/careers/search returns
+MAX_SEARCH_RESULTS = 50
+
+@app.route('/api/careers/search')
+def career_search():
+    """Typeahead search over the career catalog: ?q=<prefix>&limit=<n>"""
+    query = request.args.get('q', '')
+    limit = max(1, min(request.args.get('limit', 10, type=int), MAX_SEARCH_RESULTS))
+    results = []
+    for name in career_catalog.search(query, limit):
+        details = career_catalog.lookup(name)
+        results.append({
+            'name': name,
+            'salary_range': details['salary_range'],
+            'job_outlook': details['job_outlook'],
+            'url': url_for('career_detail', career_name=name)
+        })
+    return {'query': query, 'results': results}
+
+def query_store(store):
+    """(page, error) for the current request's filters; all rows and the error on bad input"""
+    try:
+        return store.query_args(request.args), None
+    except ValueError as e:
+        return store.query(), str(e)
+
+def page_url(page_number):
+    """The current URL with only the page number changed"""
+    args = request.args.to_dict(flat=False)
+    args['page'] = page_number
+    return url_for(request.endpoint, **args)
+
 @app.route('/courses')
+@response_cache.cached(flash_free=True)
 def courses():
-    all_courses = get_all_courses()
-    return render_template('courses.html', courses=all_courses)
+    page, error = query_store(course_store)
+    return render_template('courses.html', courses=page['items'], page=page, error=error,
+                           page_url=page_url, categories=course_store.labels['category'],
+                           eligibilities=course_store.labels['eligibility'])
 
 @app.route('/skills')
+@response_cache.cached(flash_free=True)
 def skills():
-    all_skills = get_all_skills()
-    return render_template('skills.html', skills=all_skills)
+    page, error = query_store(skill_store)
+    return render_template('skills.html', skills=page['items'], page=page, error=error,
+                           page_url=page_url, categories=skill_store.labels['category'],
+                           difficulties=skill_store.labels['difficulty'])
 
 @app.route('/about')
+@response_cache.cached(flash_free=True)
 def about():
     return render_template('about.html')
 
 @app.route('/contact')
+@response_cache.cached(flash_free=True)
 def contact():
     return render_template('contact.html')
 
+@app.route('/pages/cache')
+@admin_required
+def page_cache_stats():
+    return response_cache.stats()
+
+# Largest number of profiles accepted by /predict/batch in one request
+MAX_BATCH_SIZE = 1000
+
+# Careers returned per prediction: ?top_k= on /predict and /predict/batch, up to MAX_TOP_K
+DEFAULT_TOP_K = 3
+MAX_TOP_K = 5
+
+def rank_careers(model, data, clock=None):
+    """The MAX_TOP_K most probable (career, probability) pairs for one profile, best first.
+
+    Rankings are cached per model version and canonical profile. With a Stopwatch, the
+    'encode' and 'predict' stages (the cache lookup included) are recorded on it.
+    """
+    X_all = model.encoder.encode(data)
+    if clock:
+        clock.lap('encode')
+    key = (model.version,) + canonical_profile(data)
+    ranking = prediction_cache.get(key)
+    if ranking is None:
+        ranking = tuple(model.top_k(X_all, MAX_TOP_K)[0])
+        prediction_cache.put(key, ranking)
+    if clock:
+        clock.lap('predict')
+    return ranking
+
+def top_careers_json(ranking, k):
+    return [{'career': career, 'probability': probability} for career, probability in ranking[:k]]
+
+def top_k_arg():
+    return max(1, min(request.args.get('top_k', DEFAULT_TOP_K, type=int), MAX_TOP_K))
+
 @app.route('/predict', methods=['POST'])
 def predict():
+    clock = stopwatch('predict')
     data = request.json
-    # Extract and preprocess input
-    age = data.get('age', 16)
-    percentage = data.get('percentage', 70)
-    interests = data.get('interests', [])
-    skills = data.get('skills', [])
-    hobbies = data.get('hobbies', [])
-    personality = data.get('personality', 'Introvert')
-    work_style = data.get('work_style', 'Analytical')
-    quiz = [data.get(f'quiz_q{i}', 3) for i in range(1, 11)]
-    # Transform input
-    X_interests = mlb_interests.transform([interests])
-    X_skills = mlb_skills.transform([skills])
-    X_hobbies = mlb_hobbies.transform([hobbies])
-    X_personality = le_personality.transform([personality])
-    X_work_style = le_work_style.transform([work_style])
-    X_all = np.hstack([
-        [[age, percentage]],
-        X_interests,
-        X_skills,
-        X_hobbies,
-        X_personality.reshape(1, -1),
-        X_work_style.reshape(1, -1),
-        [quiz]
-    ])
-    # Predict
-    pred = clf.predict(X_all)[0]
-    career = le_career.inverse_transform([pred])[0]
-    return {'career_path': career}
+    model = get_model()
+    if not model:
+        return {'error': 'ML model not loaded'}, 503
+    # Missing fields take the encoder defaults
+    try:
+        ranking = rank_careers(model, data, clock)
+    except ValueError as e:
+        return {'error': str(e)}, 400
+    return {'career_path': ranking[0][0], 'top_careers': top_careers_json(ranking, top_k_arg())}
+
+@app.route('/predict/batch', methods=['POST'])
+def predict_batch():
+    """Score a list of profiles with a single model call, keeping input order"""
+    data = request.get_json(silent=True)
+    profiles = data.get('profiles') if isinstance(data, dict) else data
+    if not isinstance(profiles, list):
+        return {'error': 'Expected a JSON list of profiles or {"profiles": [...]}'}, 400
+    if len(profiles) > MAX_BATCH_SIZE:
+        return {'error': f'At most {MAX_BATCH_SIZE} profiles per batch'}, 413
+    model = get_model()
+    if not model:
+        return {'error': 'ML model not loaded'}, 503
+    k = top_k_arg()
+    clock = stopwatch('predict_batch')
+
+    # Build one feature matrix for every row, in the same column order as /predict
+    X_all, errors = model.encoder.encode_many(profiles)
+    clock.lap('encode')
+    results = [{'index': i, 'error': error} for i, error in enumerate(errors)]
+    rankings = {}
+    misses = []
+    for i, error in enumerate(errors):
+        if error is None:
+            key = (model.version,) + canonical_profile(profiles[i])
+            ranking = prediction_cache.get(key)
+            if ranking is None:
+                misses.append((i, key))
+            else:
+                rankings[i] = ranking
+    if misses:
+        rows = [i for i, _ in misses]
+        for (i, key), ranking in zip(misses, model.top_k(X_all[rows], MAX_TOP_K)):
+            rankings[i] = tuple(ranking)
+            prediction_cache.put(key, rankings[i])
+    clock.lap('predict')
+    for i, ranking in rankings.items():
+        results[i] = {'index': i, 'career_path': ranking[0][0],
+                      'top_careers': top_careers_json(ranking, k)}
+
+    return {'results': results}
+
+@app.route('/predict/cache')
+@admin_required
+def predict_cache_stats():
+    return prediction_cache.stats()
+
+@app.route('/metrics')
+@admin_required
+def metrics_endpoint():
+    """Request, pipeline stage, cache and database metrics for Prometheus to scrape"""
+    return metrics.render(), 200, {'Content-Type': METRICS_CONTENT_TYPE}
+
+@app.route('/model/info')
+@admin_required
+def model_info():
+    """Active model version, load time and resident size, plus the rollback history"""
+    return {'lazy': bool(MODEL_ARTIFACT_DIR), **model_registry.status()}
+
+@app.route('/ready')
+def ready():
+    """Readiness probe: 200 once the model is loaded, 503 while it loads or if it failed.
+
+    The first probe starts loading a lazily loaded model in the background.
+    """
+    model = model_registry.active
+    if model is not None:
+        return {'status': 'ready', 'model_version': model.version}
+    if not model_load_attempted:
+        threading.Thread(target=get_model, name='model-loader', daemon=True).start()
+        return {'status': 'loading'}, 503
+    return {'status': 'loading' if model_load_lock.locked() else 'model unavailable'}, 503
+
+@app.route('/model/reload', methods=['POST'])
+@admin_required
+def model_reload():
+    """Load the model files again in the background and swap them in once validated"""
+    source = MODEL_ARTIFACT_DIR or MODEL_PATH
+    if not model_registry.load_in_background(source, **MODEL_OPTIONS):
+        return {'error': 'A reload is already running'}, 409
+    return {'reloading': source}, 202
+
+@app.route('/model/rollback', methods=['POST'])
+@admin_required
+def model_rollback():
+    handle = model_registry.rollback()
+    if handle is None:
+        return {'error': 'No previous model version to roll back to'}, 409
+    return {'active': handle.info()}
+
+@app.route('/fallback/reload', methods=['POST'])
+@admin_required
+def fallback_reload():
+    """Re-read the fallback rules file; the current rules stay active if it is invalid"""
+    global fallback_rules
+    try:
+        engine = RuleEngine.from_file(FALLBACK_RULES_PATH)
+    except Exception as e:
+        return {'error': f'{FALLBACK_RULES_PATH}: {e}'}, 400
+    fallback_rules = engine
+    return {'path': engine.path, 'rules': {name: len(rules) for name, rules in engine.tables.items()}}
+
+@app.route('/analytics/careers')
+@admin_required
+def career_analytics():
+    """Predicted careers overall and by education level, percentage band and week.
+
+    Reads the career_stats summary, so the cost depends on ?weeks= (default 12), not on the
+    number of stored results. ?education_level=, ?percentage_band= and ?career= filter it.
+    """
+    weeks = max(1, min(request.args.get('weeks', ANALYTICS_WEEKS, type=int), ANALYTICS_MAX_WEEKS))
+    return career_distribution(db, weeks, request.args.get('education_level'),
+                               request.args.get('percentage_band'), request.args.get('career'))
 
 def get_fallback_career_recommendation(data):
     """Get fallback career recommendation when ML model fails"""
-    interests = data.get('interests', [])
-    skills = data.get('skills', [])
-    percentage = data.get('percentage', 70)
-    education_level = data.get('education_level', '10th')
-    personality = data.get('personality', 'Introvert')
-    work_style = data.get('work_style', 'Analytical')
-    
-    # Different career paths based on education level
-    if education_level == '10th':
-        return get_10th_grade_career_recommendation(interests, skills, percentage)
-    elif education_level == '12th':
-        return get_12th_grade_career_recommendation(interests, skills, percentage)
-    else:
-        # Default for other levels
-        return get_general_career_recommendation(interests, skills, percentage)
+    return fallback_rules.recommend(data)
 
 def get_engineering_alternative_paths(percentage):
     """Get detailed alternative engineering paths for students with lower percentages"""
@@ -574,171 +895,6 @@ def get_engineering_alternative_paths(percentage):
             ]
         }
 
-def get_10th_grade_career_recommendation(interests, skills, percentage):
-    """Get career recommendations for 10th grade students"""
-    if 'Technology' in interests or 'Programming' in skills or 'Engineering' in interests:
-        if percentage >= 85:
-            return 'Computer Science (PCM) - Engineering Path'
-        elif percentage >= 75:
-            return 'IT/Computer Applications - Diploma'
-        elif percentage >= 60:
-            return 'Web Development - Certificate Course'
-        elif percentage >= 45:
-            return 'Engineering - Alternative Paths Available'
-        else:
-            return 'Computer Operator - Vocational Training'
-    
-    elif 'Science' in interests:
-        if percentage >= 90:
-            return 'Medical (PCB) - Pre-Medical Path'
-        elif percentage >= 80:
-            return 'Engineering (PCM) - Technical Path'
-        elif percentage >= 70:
-            return 'Pharmacy - Diploma Course'
-        elif percentage >= 45:
-            return 'Engineering - Alternative Paths Available'
-        else:
-            return 'Lab Assistant - Vocational Training'
-    
-    elif 'Commerce' in interests or 'Business' in interests:
-        if percentage >= 80:
-            return 'Commerce (PCM/PCB) - Business Path'
-        elif percentage >= 70:
-            return 'Business Administration - Diploma'
-        elif percentage >= 60:
-            return 'Accounting - Certificate Course'
-        else:
-            return 'Retail Management - Vocational Training'
-    
-    elif 'Arts' in interests or 'Creativity' in skills:
-        if percentage >= 75:
-            return 'Design (Any Stream) - Creative Path'
-        elif percentage >= 65:
-            return 'Fashion Design - Diploma'
-        elif percentage >= 55:
-            return 'Graphic Design - Certificate Course'
-        else:
-            return 'Craft & Design - Vocational Training'
-    
-    else:
-        # Default recommendations based on percentage
-        if percentage >= 85:
-            return 'Science (PCM) - Engineering Path'
-        elif percentage >= 75:
-            return 'Commerce - Business Path'
-        elif percentage >= 65:
-            return 'Arts - Creative Path'
-        elif percentage >= 45:
-            return 'Engineering - Alternative Paths Available'
-        else:
-            return 'Vocational Training - Skill Development'
-
-def get_12th_grade_career_recommendation(interests, skills, percentage):
-    """Get career recommendations for 12th grade students"""
-    if 'Technology' in interests or 'Programming' in skills:
-        if percentage >= 85:
-            return 'B.Tech Computer Science'
-        elif percentage >= 75:
-            return 'BCA (Bachelor of Computer Applications)'
-        elif percentage >= 65:
-            return 'Diploma in Computer Engineering'
-        else:
-            return 'IT Certification Courses'
-    
-    elif 'Science' in interests:
-        if percentage >= 90:
-            return 'MBBS (Medical)'
-        elif percentage >= 80:
-            return 'B.Tech Engineering'
-        elif percentage >= 70:
-            return 'BSc (Bachelor of Science)'
-        else:
-            return 'Diploma in Science/Technology'
-    
-    elif 'Commerce' in interests or 'Business' in interests:
-        if percentage >= 80:
-            return 'BBA (Bachelor of Business Administration)'
-        elif percentage >= 70:
-            return 'B.Com (Bachelor of Commerce)'
-        elif percentage >= 60:
-            return 'Diploma in Business Management'
-        else:
-            return 'Certificate in Business Skills'
-    
-    elif 'Arts' in interests or 'Creativity' in skills:
-        if percentage >= 75:
-            return 'B.Des (Bachelor of Design)'
-        elif percentage >= 65:
-            return 'BA (Bachelor of Arts)'
-        elif percentage >= 55:
-            return 'Diploma in Design/Arts'
-        else:
-            return 'Certificate in Creative Arts'
-    
-    else:
-        # Default recommendations based on percentage
-        if percentage >= 85:
-            return 'B.Tech Engineering'
-        elif percentage >= 75:
-            return 'BBA/B.Com'
-        elif percentage >= 65:
-            return 'BA/BSc'
-        else:
-            return 'Diploma/Certificate Courses'
-
-def get_general_career_recommendation(interests, skills, percentage):
-    """Get general career recommendations for other education levels"""
-    if 'Technology' in interests or 'Programming' in skills:
-        if percentage >= 80:
-            return 'Software Engineer'
-        elif percentage >= 60:
-            return 'Web Developer'
-        else:
-            return 'IT Support Specialist'
-    
-    elif 'Science' in interests:
-        if percentage >= 85:
-            return 'Medical Doctor'
-        elif percentage >= 70:
-            return 'Pharmacist'
-        else:
-            return 'Lab Technician'
-    
-    elif 'Engineering' in interests or 'Technical Skills' in skills:
-        if percentage >= 75:
-            return 'Mechanical Engineer'
-        elif percentage >= 60:
-            return 'Civil Engineer'
-        else:
-            return 'Technician'
-    
-    elif 'Business' in interests or 'Leadership' in skills:
-        if percentage >= 70:
-            return 'Business Manager'
-        elif percentage >= 60:
-            return 'Sales Executive'
-        else:
-            return 'Customer Service Representative'
-    
-    elif 'Arts' in interests or 'Creativity' in skills:
-        if percentage >= 65:
-            return 'Graphic Designer'
-        elif percentage >= 50:
-            return 'UI/UX Designer'
-        else:
-            return 'Content Creator'
-    
-    else:
-        # Default recommendations based on percentage
-        if percentage >= 80:
-            return 'Software Engineer'
-        elif percentage >= 70:
-            return 'Business Manager'
-        elif percentage >= 60:
-            return 'Web Developer'
-        else:
-            return 'Customer Service Representative'
-
 def get_career_recommendations(profile):
     """Get career recommendations based on user profile"""
     recommendations = []
@@ -843,252 +999,7 @@ def get_alternative_paths(profile):
 
 def get_career_details(career_name):
     """Get detailed information about a specific career"""
-    career_details = {
-        # 10th Grade Career Paths
-        'Computer Science (PCM) - Engineering Path': {
-            'description': 'Choose PCM (Physics, Chemistry, Mathematics) in 12th to pursue engineering careers.',
-            'skills_required': ['Mathematics', 'Physics', 'Chemistry', 'Problem Solving'],
-            'education': '12th with PCM, then B.Tech',
-            'salary_range': '₹4-20 LPA',
-            'job_outlook': 'Excellent - High demand',
-            'companies': ['Engineering Colleges', 'Universities'],
-            'courses': ['B.Tech Computer Science', 'B.Tech IT', 'BCA']
-        },
-        'Medical (PCB) - Pre-Medical Path': {
-            'description': 'Choose PCB (Physics, Chemistry, Biology) in 12th to pursue medical careers.',
-            'skills_required': ['Biology', 'Chemistry', 'Physics', 'Patient Care'],
-            'education': '12th with PCB, then MBBS/BDS',
-            'salary_range': '₹8-30 LPA',
-            'job_outlook': 'Excellent - Always in demand',
-            'companies': ['Medical Colleges', 'Hospitals'],
-            'courses': ['MBBS', 'BDS', 'BAMS', 'BHMS']
-        },
-        'Commerce (PCM/PCB) - Business Path': {
-            'description': 'Choose Commerce stream in 12th to pursue business and management careers.',
-            'skills_required': ['Mathematics', 'Business Studies', 'Economics', 'Leadership'],
-            'education': '12th Commerce, then BBA/B.Com',
-            'salary_range': '₹3-15 LPA',
-            'job_outlook': 'Good - Growing demand',
-            'companies': ['Business Schools', 'Universities'],
-            'courses': ['BBA', 'B.Com', 'BMS', 'CA Foundation']
-        },
-        'Design (Any Stream) - Creative Path': {
-            'description': 'Choose any stream in 12th to pursue creative and design careers.',
-            'skills_required': ['Creativity', 'Art', 'Design Thinking', 'Communication'],
-            'education': '12th any stream, then B.Des/BA',
-            'salary_range': '₹3-12 LPA',
-            'job_outlook': 'Good - Creative industry growth',
-            'companies': ['Design Institutes', 'Art Colleges'],
-            'courses': ['B.Des', 'BA Fine Arts', 'BA Design', 'Diploma in Design']
-        },
-        'Engineering - Alternative Paths Available': {
-            'description': 'With your percentage, you can still pursue engineering through alternative paths like diploma courses, ITI, or certificate programs.',
-            'skills_required': ['Mathematics', 'Physics', 'Problem Solving', 'Technical Aptitude'],
-            'education': '10th pass with 45%+, then diploma/ITI/certificate courses',
-            'salary_range': '₹2-8 LPA (after diploma/certificate)',
-            'job_outlook': 'Good - Technical skills in high demand',
-            'companies': ['Manufacturing Companies', 'Construction Firms', 'IT Companies', 'Government Departments'],
-            'courses': ['Diploma in Engineering', 'ITI Courses', 'Technical Certificates', 'Distance Learning']
-        },
-        
-        # 12th Grade Career Paths
-        'B.Tech Computer Science': {
-            'description': 'Bachelor of Technology in Computer Science - 4-year engineering degree.',
-            'skills_required': ['Programming', 'Mathematics', 'Problem Solving', 'Logic'],
-            'education': '12th PCM with good percentage',
-            'salary_range': '₹4-20 LPA',
-            'job_outlook': 'Excellent - High demand',
-            'companies': ['TCS', 'Infosys', 'Wipro', 'Google', 'Microsoft'],
-            'courses': ['B.Tech CS', 'B.Tech IT', 'BCA']
-        },
-        'MBBS (Medical)': {
-            'description': 'Bachelor of Medicine and Bachelor of Surgery - 5.5-year medical degree.',
-            'skills_required': ['Biology', 'Chemistry', 'Patient Care', 'Critical Thinking'],
-            'education': '12th PCB with NEET qualification',
-            'salary_range': '₹8-30 LPA',
-            'job_outlook': 'Excellent - Always in demand',
-            'companies': ['Hospitals', 'Medical Colleges', 'Research Institutes'],
-            'courses': ['MBBS', 'BDS', 'BAMS', 'BHMS']
-        },
-        'BBA (Bachelor of Business Administration)': {
-            'description': 'Bachelor of Business Administration - 3-year business management degree.',
-            'skills_required': ['Leadership', 'Communication', 'Business Acumen', 'Analytics'],
-            'education': '12th any stream with good percentage',
-            'salary_range': '₹3-12 LPA',
-            'job_outlook': 'Good - Growing demand',
-            'companies': ['Corporate Companies', 'Startups', 'Consulting Firms'],
-            'courses': ['BBA', 'BMS', 'B.Com', 'CA Foundation']
-        },
-        'B.Des (Bachelor of Design)': {
-            'description': 'Bachelor of Design - 4-year design degree for creative careers.',
-            'skills_required': ['Creativity', 'Design Thinking', 'Visual Communication', 'Art'],
-            'education': '12th any stream with portfolio',
-            'salary_range': '₹3-15 LPA',
-            'job_outlook': 'Good - Creative industry growth',
-            'companies': ['Design Studios', 'Advertising Agencies', 'Tech Companies'],
-            'courses': ['B.Des', 'BA Design', 'Diploma in Design']
-        },
-        
-        # General Career Paths
-        'Software Engineer': {
-            'description': 'Software engineers design, develop, and maintain software applications and systems.',
-            'skills_required': ['Programming', 'Problem Solving', 'Teamwork', 'Communication'],
-            'education': 'B.Tech in Computer Science or related field',
-            'salary_range': '₹4-15 LPA',
-            'job_outlook': 'Excellent - High demand',
-            'companies': ['TCS', 'Infosys', 'Wipro', 'Google', 'Microsoft'],
-            'courses': ['B.Tech Computer Science', 'BCA', 'MCA', 'Diploma in IT']
-        },
-        'Medical Doctor': {
-            'description': 'Medical doctors diagnose and treat patients, providing healthcare services.',
-            'skills_required': ['Medical Knowledge', 'Patient Care', 'Communication', 'Critical Thinking'],
-            'education': 'MBBS degree from recognized medical college',
-            'salary_range': '₹8-25 LPA',
-            'job_outlook': 'Excellent - Always in demand',
-            'companies': ['Hospitals', 'Clinics', 'Research Institutes', 'Private Practice'],
-            'courses': ['MBBS', 'BDS', 'BAMS', 'BHMS']
-        },
-        'Business Manager': {
-            'description': 'Business managers oversee operations and lead teams in organizations.',
-            'skills_required': ['Leadership', 'Communication', 'Strategic Thinking', 'Problem Solving'],
-            'education': 'MBA or Business Administration degree',
-            'salary_range': '₹6-20 LPA',
-            'job_outlook': 'Good - Growing demand',
-            'companies': ['Corporate Companies', 'Startups', 'Consulting Firms'],
-            'courses': ['MBA', 'BBA', 'B.Com', 'PGDM']
-        }
-    }
-    
-    return career_details.get(career_name, {
-        'description': 'Career information not available.',
-        'skills_required': [],
-        'education': 'Varies',
-        'salary_range': '₹3-10 LPA',
-        'job_outlook': 'Good',
-        'companies': [],
-        'courses': []
-    })
-
-def get_all_courses():
-    """Get all available courses"""
-    return [
-        # 12th Grade Courses
-        {
-            'name': 'B.Tech Computer Science',
-            'duration': '4 years',
-            'eligibility': '12th with PCM',
-            'fees': '₹2-8 LPA',
-            'careers': ['Software Engineer', 'Data Scientist', 'Web Developer']
-        },
-        {
-            'name': 'MBBS',
-            'duration': '5.5 years',
-            'eligibility': '12th with PCB, NEET qualified',
-            'fees': '₹10-50 LPA',
-            'careers': ['Medical Doctor', 'Surgeon', 'Researcher']
-        },
-        {
-            'name': 'BBA',
-            'duration': '3 years',
-            'eligibility': '12th in any stream',
-            'fees': '₹2-8 LPA',
-            'careers': ['Business Manager', 'Consultant', 'Entrepreneur']
-        },
-        {
-            'name': 'B.Des (Design)',
-            'duration': '4 years',
-            'eligibility': '12th in any stream',
-            'fees': '₹3-12 LPA',
-            'careers': ['Graphic Designer', 'UI/UX Designer', 'Fashion Designer']
-        },
-        {
-            'name': 'BCA',
-            'duration': '3 years',
-            'eligibility': '12th in any stream',
-            'fees': '₹2-6 LPA',
-            'careers': ['Software Developer', 'IT Professional', 'System Analyst']
-        },
-        {
-            'name': 'B.Com',
-            'duration': '3 years',
-            'eligibility': '12th in any stream',
-            'fees': '₹1-5 LPA',
-            'careers': ['Accountant', 'Financial Analyst', 'Business Executive']
-        },
-        
-        # 10th Grade Courses
-        {
-            'name': 'Diploma in Computer Engineering',
-            'duration': '3 years',
-            'eligibility': '10th pass',
-            'fees': '₹1-3 LPA',
-            'careers': ['Computer Technician', 'IT Support', 'Network Administrator']
-        },
-        {
-            'name': 'Diploma in Business Management',
-            'duration': '2 years',
-            'eligibility': '10th pass',
-            'fees': '₹1-2 LPA',
-            'careers': ['Office Manager', 'Sales Executive', 'Administrative Assistant']
-        },
-        {
-            'name': 'Certificate in Web Development',
-            'duration': '6 months',
-            'eligibility': '10th pass',
-            'fees': '₹20,000-50,000',
-            'careers': ['Web Developer', 'Frontend Developer', 'Freelancer']
-        },
-        {
-            'name': 'Certificate in Graphic Design',
-            'duration': '6 months',
-            'eligibility': '10th pass',
-            'fees': '₹15,000-40,000',
-            'careers': ['Graphic Designer', 'Digital Artist', 'Content Creator']
-        },
-        {
-            'name': 'Vocational Training - Electrician',
-            'duration': '1 year',
-            'eligibility': '10th pass',
-            'fees': '₹10,000-30,000',
-            'careers': ['Electrician', 'Maintenance Technician', 'Industrial Worker']
-        },
-        {
-            'name': 'Vocational Training - Plumber',
-            'duration': '1 year',
-            'eligibility': '10th pass',
-            'fees': '₹8,000-25,000',
-            'careers': ['Plumber', 'Pipe Fitter', 'Maintenance Worker']
-        }
-    ]
-
-def get_all_skills():
-    """Get all available skills"""
-    return [
-        {
-            'name': 'Programming',
-            'category': 'Technical',
-            'description': 'Ability to write and understand code',
-            'careers': ['Software Engineer', 'Data Scientist', 'Web Developer']
-        },
-        {
-            'name': 'Communication',
-            'category': 'Soft Skills',
-            'description': 'Effective verbal and written communication',
-            'careers': ['Manager', 'Teacher', 'Sales Executive']
-        },
-        {
-            'name': 'Leadership',
-            'category': 'Management',
-            'description': 'Ability to lead and motivate teams',
-            'careers': ['Business Manager', 'Project Manager', 'Team Lead']
-        },
-        {
-            'name': 'Creativity',
-            'category': 'Artistic',
-            'description': 'Ability to think creatively and innovatively',
-            'careers': ['Designer', 'Artist', 'Content Creator']
-        }
-    ]
+    return career_catalog.get(career_name)
 
 if __name__ == '__main__':
     app.run(debug=True, port=5000) 
\ No newline at end of file
@@ -0,0 +1,105 @@
+"""Bounded, thread-safe LRU cache for model predictions.
+
+Many students submit near-identical answers, so predictions are cached under a canonical
+form of the profile. Entries expire after a TTL, the least recently used entry is evicted
+when the cache is full, and the whole cache is dropped when a different model is loaded.
+"""
+import threading
+import time
+from collections import OrderedDict
+
+from feature_encoder import DEFAULTS, QUIZ_DEFAULT, QUIZ_FIELDS
+
+
+def canonical_profile(data):
+    """Return a hashable key for the model inputs of a profile.
+
+    Label lists are de-duplicated and sorted, numbers are converted to float and missing
+    fields take the encoder defaults, so profiles that encode to the same feature row
+    share a key. Raises ValueError for the profiles FeatureEncoder.encode_into rejects, so
+    only validated values end up in the key.
+    """
+    if not isinstance(data, dict):
+        raise ValueError('profile must be a JSON object')
+    try:
+        numbers = (float(data.get('age', DEFAULTS['age'])),
+                   float(data.get('percentage', DEFAULTS['percentage'])))
+        quiz = tuple(float(data.get(field, QUIZ_DEFAULT)) for field in QUIZ_FIELDS)
+    except (TypeError, ValueError):
+        raise ValueError('age, percentage and quiz answers must be numeric')
+    labels = []
+    for field in ('interests', 'skills', 'hobbies'):
+        values = data.get(field, DEFAULTS[field])
+        if not isinstance(values, (list, tuple)) or not all(isinstance(v, str) for v in values):
+            raise ValueError(f'{field} must be a list of strings')
+        labels.append(tuple(sorted(set(values))))
+    categories = (data.get('personality', DEFAULTS['personality']),
+                  data.get('work_style', DEFAULTS['work_style']))
+    for field, value in zip(('personality', 'work_style'), categories):
+        if value is not None and not isinstance(value, str):
+            raise ValueError(f'{field} must be a string')
+    return tuple(labels) + categories + numbers + quiz
+
+
+class PredictionCache:
+    """LRU cache with size and TTL based eviction plus hit/miss counters"""
+
+    def __init__(self, maxsize=4096, ttl=3600, clock=time.monotonic):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.clock = clock
+        self.model_version = None
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = self.misses = self.evictions = self.expirations = 0
+
+    def get(self, key):
+        """Return the cached value for key, or None on a miss"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            value, expires_at = entry
+            if expires_at <= self.clock():
+                del self._entries[key]
+                self.expirations += 1
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value):
+        with self._lock:
+            self._entries[key] = (value, self.clock() + self.ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def set_model_version(self, version):
+        """Record the version of the loaded model, clearing the cache if it changed"""
+        with self._lock:
+            if version != self.model_version:
+                self._entries.clear()
+                self.model_version = version
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'size': len(self._entries),
+                'maxsize': self.maxsize,
+                'ttl': self.ttl,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+                'evictions': self.evictions,
+                'expirations': self.expirations,
+                'model_version': self.model_version,
+            }
@@ -0,0 +1,125 @@
+"""Rendered-response cache with strong ETags for the catalog and static pages.
+
+Pages such as /courses or /career/<name> only change when the datasets or templates do, so
+their rendered bodies are kept in an LRU keyed by endpoint, view arguments, query string,
+content version and the logged-in user (the navbar shows the user's name). Every cached
+response carries a strong ETag, so a browser revalidating with If-None-Match gets a 304 with
+no body. Pages for logged-in users are marked private so shared caches never store them, and
+all responses vary on Cookie.
+"""
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from functools import wraps
+
+from flask import make_response, request, session
+
+
+def content_version(paths):
+    """Hash of every file under the given files/directories: changes when any of them does"""
+    digest = hashlib.sha256()
+    for path in paths:
+        files = [path]
+        if os.path.isdir(path):
+            files = sorted(os.path.join(root, name)
+                           for root, _, names in os.walk(path) for name in names)
+        for name in files:
+            digest.update(name.encode())
+            with open(name, 'rb') as f:
+                digest.update(f.read())
+    return digest.hexdigest()
+
+
+class ResponseCache:
+    """LRU of rendered page bodies served with ETag / 304 handling"""
+
+    def __init__(self, version, maxsize=512, max_age=300):
+        self.version = version
+        self.maxsize = maxsize
+        self.max_age = max_age
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = self.misses = self.not_modified = self.evictions = 0
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def _key(self, view_args):
+        user = (session['user_id'], session.get('user_name')) if session.get('user_id') else None
+        return (request.endpoint, tuple(sorted(view_args.items())),
+                tuple(sorted(request.args.items(multi=True))), self.version, user)
+
+    def _get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+            else:
+                self._entries.move_to_end(key)
+                self.hits += 1
+            return entry
+
+    def _put(self, key, entry):
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def cached(self, view=None, *, flash_free=False):
+        """Decorator for GET views whose output depends only on their arguments and the user.
+
+        Pending flash messages stay in the session until a page shows them, so while there
+        are any the view is rendered uncached, unless it is declared with flash_free=True:
+        its templates never show flash messages and it is cached regardless.
+        """
+        if view is None:
+            return lambda view: self.cached(view, flash_free=flash_free)
+
+        @wraps(view)
+        def wrapper(**view_args):
+            if request.method not in ('GET', 'HEAD') or ('_flashes' in session and not flash_free):
+                return view(**view_args)
+            key = self._key(view_args)
+            entry = self._get(key)
+            if entry is None:
+                response = make_response(view(**view_args))
+                if response.status_code != 200 or response.is_streamed:
+                    return response
+                body = response.get_data()
+                entry = (body, response.content_type, hashlib.sha256(body).hexdigest()[:32])
+                self._put(key, entry)
+            body, content_type, etag = entry
+            response = make_response(body)
+            response.content_type = content_type
+            response.set_etag(etag)
+            if key[-1] is None:
+                response.cache_control.public = True
+                response.cache_control.max_age = self.max_age
+            else:
+                response.cache_control.private = True
+                response.cache_control.no_cache = True
+            response.vary.add('Cookie')
+            response = response.make_conditional(request)
+            if response.status_code == 304:
+                with self._lock:
+                    self.not_modified += 1
+            return response
+        return wrapper
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'size': len(self._entries),
+                'maxsize': self.maxsize,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+                'not_modified': self.not_modified,
+                'evictions': self.evictions,
+                'version': self.version,
+            }
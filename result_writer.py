@@ -0,0 +1,175 @@
+"""Write-behind queue for assessment results.
+
+With write-behind enabled, /submit_profile hands its user_results row to a bounded in-process
+queue and returns without waiting for the INSERT and fsync. A background thread drains the
+queue and inserts rows with executemany in one transaction, every batch_size rows or every
+flush_interval seconds, whichever comes first.
+
+When the queue is full, submit() blocks for up to put_timeout seconds (backpressure on the
+request threads) and then writes the row synchronously, so rows are never dropped. A batch
+that still fails after its retries is written row by row; rows that fail on their own are kept
+and retried with the next batch. close() drains everything still queued (the app registers
+it with atexit for clean shutdowns), and rows submitted after close() are written on the
+calling thread.
+"""
+import logging
+import queue
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+# Put on the queue by close() to stop the writer thread
+_STOP = object()
+
+
+class ResultWriter:
+    """Batches Database.save_user_results calls on a background thread"""
+
+    def __init__(self, database, batch_size=100, flush_interval=0.05, max_queue=10000,
+                 put_timeout=5.0):
+        self.database = database
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.put_timeout = put_timeout
+        self.queue = queue.Queue(maxsize=max_queue)
+        self.thread = None
+        self.closed = False
+        # Rows that failed on their own, retried ahead of the next batch
+        self.unwritten = []
+        self._lock = threading.Lock()
+        # failed counts rows that could not be saved on their own (each time they failed)
+        self.written = self.batches = self.sync_writes = self.failed = 0
+
+    def start(self):
+        self.thread = threading.Thread(target=self._run, name='result-writer', daemon=True)
+        self.thread.start()
+        return self
+
+    def _count(self, **counts):
+        with self._lock:
+            for name, n in counts.items():
+                setattr(self, name, getattr(self, name) + n)
+
+    def submit(self, user_id, predicted_career, profile_data, top_careers=None, bundle=None):
+        row = (user_id, predicted_career, profile_data, top_careers, bundle)
+        if self.thread is None or self.closed:
+            self._write_now([row])
+            return
+        try:
+            self.queue.put(row, timeout=self.put_timeout)
+        except queue.Full:
+            # The writer cannot keep up: pay for the write on this request instead of losing it
+            self._write_now([row])
+            return
+        if self.closed:
+            # close() ran between the check above and the put; don't leave the row queued
+            self._drain()
+
+    def _write_now(self, rows):
+        self.database.save_user_results(rows)
+        self._count(sync_writes=len(rows))
+
+    def _run(self):
+        stopping = False
+        while not stopping:
+            item = self.queue.get()
+            if item is _STOP:
+                break
+            batch = [item]
+            deadline = time.monotonic() + self.flush_interval
+            while len(batch) < self.batch_size:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    item = self.queue.get(timeout=timeout)
+                except queue.Empty:
+                    break
+                if item is _STOP:
+                    stopping = True
+                    break
+                batch.append(item)
+            self._write(batch)
+            # Mark the batch (and the stop marker, if seen) done only after the insert
+            for _ in range(len(batch) + stopping):
+                self.queue.task_done()
+        if not stopping:
+            self.queue.task_done()
+
+    def _write(self, batch, attempts=3):
+        with self._lock:
+            batch, self.unwritten = self.unwritten + batch, []
+        for attempt in range(1, attempts + 1):
+            try:
+                self.database.save_user_results(batch)
+                self._count(written=len(batch), batches=1)
+                return
+            except Exception:
+                logger.warning('Saving %d results failed (attempt %d/%d)', len(batch), attempt,
+                               attempts, exc_info=True)
+                time.sleep(0.1 * attempt)
+        # One bad row must not take the rest of the batch with it
+        failed = []
+        for row in batch:
+            try:
+                self.database.save_user_results([row])
+                self._count(written=1)
+            except Exception:
+                failed.append(row)
+        if failed:
+            logger.error('Keeping %d results that could not be saved for the next batch', len(failed))
+            with self._lock:
+                self.unwritten = failed + self.unwritten
+                self.failed += len(failed)
+
+    def _drain(self):
+        """Write whatever is left on the queue, on the calling thread"""
+        rows = []
+        while True:
+            try:
+                item = self.queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is not _STOP:
+                rows.append(item)
+            self.queue.task_done()
+        if rows:
+            self._write_now(rows)
+
+    def flush(self):
+        """Block until every submitted row has been written"""
+        self.queue.join()
+
+    def close(self):
+        """Write out everything queued and stop the writer thread.
+
+        Rows submitted afterwards are written synchronously. Rows that could not be saved
+        even one at a time are tried once more here and logged if they still fail.
+        """
+        if self.closed:
+            return
+        self.closed = True
+        if self.thread is not None and self.thread.is_alive():
+            self.queue.put(_STOP)
+            self.thread.join()
+        self._drain()
+        with self._lock:
+            unwritten, self.unwritten = self.unwritten, []
+        for row in unwritten:
+            try:
+                self.database.save_user_results([row])
+                self._count(written=1)
+            except Exception:
+                logger.exception('Result for user %s (%s) was not saved', row[0], row[1])
+
+    def stats(self):
+        with self._lock:
+            return {
+                'queued': self.queue.qsize(),
+                'written': self.written,
+                'batches': self.batches,
+                'sync_writes': self.sync_writes,
+                'failed': self.failed,
+                'unwritten': len(self.unwritten),
+            }
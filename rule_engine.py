@@ -0,0 +1,164 @@
+"""Decision-table engine for the rule-based career fallback.
+
+The fallback used when the model is unavailable is a table per education level, loaded from
+a JSON rules file (datasets/fallback_rules.json by default). Each table is an ordered list of
+rules; the first rule whose predicate matches picks the career, and a rule's sorted
+percentage breakpoints are resolved with a binary search:
+
+    {"interests": ["Science"], "skills": [],
+     "breakpoints": [70, 80, 90],
+     "careers": ["< 70", "70 to < 80", "80 to < 90", ">= 90"]}
+
+A rule matches when the profile has any of its interests or any of its skills; a rule with
+neither always matches, and every table must end with one. A percentage equal to a
+breakpoint takes the career above it.
+
+recommend() answers one profile; score() evaluates whole NumPy arrays of profiles with a
+matrix product per table for the predicates and np.searchsorted for the breakpoints.
+"""
+import json
+import math
+import os
+from bisect import bisect_right
+
+import numpy as np
+
+RULES_FORMAT = 'pathfinder-fallback-rules'
+RULES_VERSION = 1
+DEFAULT_RULES_PATH = 'datasets/fallback_rules.json'
+
+
+class RuleError(ValueError):
+    """The rules file is malformed"""
+
+
+def _percentage(value):
+    """Percentage as a float; missing or NaN percentages fall below every breakpoint"""
+    value = float(value)
+    return -math.inf if math.isnan(value) else value
+
+
+class RuleEngine:
+    """Compiled fallback decision tables"""
+
+    def __init__(self, rules):
+        if rules.get('format') != RULES_FORMAT or rules.get('version') != RULES_VERSION:
+            raise RuleError(f'not a version {RULES_VERSION} {RULES_FORMAT} file')
+        self.path = None
+        tables = rules.get('tables') or {}
+        self.default_level = rules.get('default_level')
+        self.levels = dict(rules.get('levels', {}))
+        for table in list(self.levels.values()) + [self.default_level]:
+            if table not in tables:
+                raise RuleError(f'unknown table {table!r}')
+
+        self.tables = {}
+        for name, table in tables.items():
+            compiled = []
+            for i, rule in enumerate(table):
+                breakpoints = [float(b) for b in rule.get('breakpoints', [])]
+                careers = list(rule.get('careers', []))
+                if breakpoints != sorted(breakpoints):
+                    raise RuleError(f'{name} rule {i}: breakpoints must be sorted')
+                if len(careers) != len(breakpoints) + 1:
+                    raise RuleError(f'{name} rule {i}: needs one career more than breakpoints')
+                compiled.append((frozenset(rule.get('interests', ())), frozenset(rule.get('skills', ())),
+                                 breakpoints, careers))
+            if not compiled or compiled[-1][0] or compiled[-1][1]:
+                raise RuleError(f'table {name!r} must end with a rule without interests or skills')
+            self.tables[name] = compiled
+        self._compile_arrays()
+
+    @classmethod
+    def from_file(cls, path=DEFAULT_RULES_PATH):
+        with open(path, encoding='utf-8') as f:
+            engine = cls(json.load(f))
+        engine.path = os.path.abspath(path)
+        return engine
+
+    def _compile_arrays(self):
+        """Per-table predicate matrices and breakpoint arrays for score()"""
+        rules = [rule for table in self.tables.values() for rule in table]
+        self.interest_labels = sorted(set().union(*(rule[0] for rule in rules)))
+        self.skill_labels = sorted(set().union(*(rule[1] for rule in rules)))
+        self.table_names = list(self.tables)
+        self.careers = sorted({career for rule in rules for career in rule[3]})
+        career_codes = {career: code for code, career in enumerate(self.careers)}
+        labels = len(self.interest_labels) + len(self.skill_labels)
+
+        self._compiled = []
+        for table in self.tables.values():
+            # Column r is 1 for the labels rule r tests: interests first, then skills
+            predicates = np.zeros((labels, len(table)), dtype=np.float32)
+            always = np.zeros(len(table), dtype=bool)
+            for r, (interests, skills, _, _) in enumerate(table):
+                for label in interests:
+                    predicates[self.interest_labels.index(label), r] = 1
+                for label in skills:
+                    predicates[len(self.interest_labels) + self.skill_labels.index(label), r] = 1
+                always[r] = not interests and not skills
+            breakpoints = [np.array(rule[2], dtype=np.float64) for rule in table]
+            careers = [np.array([career_codes[c] for c in rule[3]], dtype=np.int32) for rule in table]
+            self._compiled.append((predicates, always, breakpoints, careers))
+
+    def table_for(self, education_level):
+        return self.levels.get(education_level, self.default_level)
+
+    def recommend(self, data):
+        """Fallback career for one profile dict (interests, skills, percentage, education_level)"""
+        interests = set(data.get('interests', []))
+        skills = set(data.get('skills', []))
+        percentage = _percentage(data.get('percentage', 70))
+        for rule_interests, rule_skills, breakpoints, careers in self.tables[
+                self.table_for(data.get('education_level', '10th'))]:
+            if (not rule_interests and not rule_skills) or interests & rule_interests or skills & rule_skills:
+                return careers[bisect_right(breakpoints, percentage)]
+
+    def encode(self, profiles):
+        """Arrays for score() from a list of profile dicts"""
+        interest_index = {label: i for i, label in enumerate(self.interest_labels)}
+        skill_index = {label: i for i, label in enumerate(self.skill_labels)}
+        table_index = {name: i for i, name in enumerate(self.table_names)}
+        interests = np.zeros((len(profiles), len(self.interest_labels)), dtype=bool)
+        skills = np.zeros((len(profiles), len(self.skill_labels)), dtype=bool)
+        percentage = np.empty(len(profiles), dtype=np.float64)
+        tables = np.empty(len(profiles), dtype=np.int32)
+        for row, data in enumerate(profiles):
+            for label in data.get('interests', []):
+                if label in interest_index:
+                    interests[row, interest_index[label]] = True
+            for label in data.get('skills', []):
+                if label in skill_index:
+                    skills[row, skill_index[label]] = True
+            percentage[row] = data.get('percentage', 70)
+            tables[row] = table_index[self.table_for(data.get('education_level', '10th'))]
+        return interests, skills, percentage, tables
+
+    def score(self, interests, skills, percentage, tables):
+        """Career codes (indices into self.careers) for arrays of profiles.
+
+        interests: (n, len(interest_labels)) bool, skills: (n, len(skill_labels)) bool,
+        percentage: (n,) float, tables: (n,) indices into self.table_names
+        """
+        percentage = np.where(np.isnan(percentage), -np.inf, percentage)
+        # Predicates are "any of these labels", i.e. a positive dot product with the rule column
+        labels = np.concatenate([interests, skills], axis=1).astype(np.float32)
+        tables = np.asarray(tables)
+        codes = np.empty(len(percentage), dtype=np.int32)
+        for t, (predicates, always, breakpoints, careers) in enumerate(self._compiled):
+            rows = np.flatnonzero(tables == t)
+            if not len(rows):
+                continue
+            matches = (labels[rows] @ predicates > 0) | always
+            # Every table ends in an always-matching rule, so each row has a first match
+            first = matches.argmax(axis=1)
+            for r in range(len(breakpoints)):
+                selected = rows[first == r]
+                bucket = np.searchsorted(breakpoints[r], percentage[selected], side='right')
+                codes[selected] = careers[r][bucket]
+        return codes
+
+    def score_profiles(self, profiles):
+        """Fallback careers for a list of profile dicts, evaluated in bulk"""
+        codes = self.score(*self.encode(profiles))
+        return [self.careers[code] for code in codes]
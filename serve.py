@@ -0,0 +1,111 @@
+"""Production entry point: Pathfinder under gunicorn with preloaded, forked workers.
+
+`python pathfinder_app.py` runs Flask's debug server, one process that reloads code and is
+not meant for traffic. This runs the same app under gunicorn instead. The master imports the
+app once, which loads the datasets, catalogs and model and warms them with one prediction.
+Then it forks the workers, so they share those pages copy-on-write instead of each loading
+its own copy. gc.freeze() moves everything loaded so far out of the garbage collector's
+reach, so collections in the workers do not write to (and un-share) those pages.
+
+    python serve.py --workers 4 --threads 2 --bind 0.0.0.0:8000
+
+Every option also reads a PATHFINDER_ environment variable (see the defaults below).
+Workers with more than one thread use gunicorn's gthread worker. Graceful restarts are
+gunicorn's: SIGHUP replaces the workers and SIGTERM stops them. Either way, requests in
+flight get up to --graceful-timeout seconds to finish, and each worker writes out its
+write-behind queue before it exits. Because the app is preloaded, SIGHUP does not pick up
+code changes; restart the master for that. --max-requests recycles each worker after that many
+requests (with jitter so they do not all restart at once).
+
+Load balancers should route to a worker only once GET /ready returns 200, which is when the
+model is loaded.
+"""
+import argparse
+import gc
+import os
+
+from gunicorn.app.base import BaseApplication
+
+DEFAULT_BIND = os.environ.get('PATHFINDER_BIND', '0.0.0.0:8000')
+DEFAULT_WORKERS = int(os.environ.get('PATHFINDER_WORKERS', os.cpu_count() or 1))
+DEFAULT_THREADS = int(os.environ.get('PATHFINDER_THREADS', 1))
+DEFAULT_TIMEOUT = int(os.environ.get('PATHFINDER_TIMEOUT', 30))  # seconds before a hung worker is killed
+DEFAULT_GRACEFUL_TIMEOUT = int(os.environ.get('PATHFINDER_GRACEFUL_TIMEOUT', 30))
+DEFAULT_MAX_REQUESTS = int(os.environ.get('PATHFINDER_MAX_REQUESTS', 0))  # 0 never recycles workers
+
+
+def load_app():
+    """Import the app in the master and get it ready to fork"""
+    # Per-process threads (the write-behind writer) are started by post_fork, not at import
+    os.environ['PATHFINDER_PRELOAD'] = '1'
+    import pathfinder_app
+    from model_registry import VALIDATION_PROFILE
+
+    if pathfinder_app.SESSION_BACKEND == 'memory':
+        print('Warning: PATHFINDER_SESSION_BACKEND=memory keeps sessions in each worker; '
+              'use sqlite with more than one worker')
+    model = pathfinder_app.get_model()  # also loads a lazily loaded artifact
+    if model is not None:
+        model.top_k(model.encoder.encode(VALIDATION_PROFILE), 1)
+    # SQLite connections must not cross fork(); each worker opens its own pool
+    pathfinder_app.db.close()
+    gc.collect()
+    gc.freeze()
+    return pathfinder_app.app
+
+
+def post_fork(server, worker):
+    import pathfinder_app
+
+    if pathfinder_app.WRITE_BEHIND:
+        pathfinder_app.start_result_writer()
+
+
+def worker_exit(server, worker):
+    import pathfinder_app
+
+    if pathfinder_app.result_writer:
+        pathfinder_app.result_writer.close()
+
+
+class PathfinderServer(BaseApplication):
+    def __init__(self, options):
+        self.options = options
+        super().__init__()
+
+    def load_config(self):
+        for name, value in self.options.items():
+            self.cfg.set(name, value)
+
+    def load(self):
+        return load_app()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Run Pathfinder under gunicorn')
+    parser.add_argument('--bind', default=DEFAULT_BIND, help='address:port (PATHFINDER_BIND)')
+    parser.add_argument('--workers', type=int, default=DEFAULT_WORKERS,
+                        help='worker processes (PATHFINDER_WORKERS, default: one per CPU)')
+    parser.add_argument('--threads', type=int, default=DEFAULT_THREADS,
+                        help='request threads per worker (PATHFINDER_THREADS)')
+    parser.add_argument('--timeout', type=int, default=DEFAULT_TIMEOUT)
+    parser.add_argument('--graceful-timeout', type=int, default=DEFAULT_GRACEFUL_TIMEOUT)
+    parser.add_argument('--max-requests', type=int, default=DEFAULT_MAX_REQUESTS)
+    args = parser.parse_args()
+
+    PathfinderServer({
+        'bind': args.bind,
+        'workers': args.workers,
+        'threads': args.threads,
+        'timeout': args.timeout,
+        'graceful_timeout': args.graceful_timeout,
+        'max_requests': args.max_requests,
+        'max_requests_jitter': args.max_requests // 10,
+        'preload_app': True,
+        'post_fork': post_fork,
+        'worker_exit': worker_exit,
+    }).run()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,223 @@
+"""Server-side sessions: the cookie carries only an opaque session id.
+
+Flask's default session serializes, signs and sends the whole session (the assessment
+profile, its ranked careers, ...) in a cookie on every request and verifies it on the way
+back. ServerSessionInterface keeps the data on the server instead, under a random 32-byte id
+that is the only thing in the cookie. Two stores are available:
+
+- MemorySessionStore: an LRU in this process, for a single worker
+- SQLiteSessionStore: the sessions table of the app database, shared by every worker
+
+Sessions are stored in a compact encoding (encode_session): JSON without whitespace, with the
+assessment profile and ranked careers packed as positional lists instead of repeating their
+keys. A session is only written when it changed (SQLite sessions are also re-written when
+half their lifetime is used up, to extend it). The id is replaced whenever the logged-in user
+changes, so an id issued before login cannot be used to reach the account.
+"""
+import json
+import secrets
+import threading
+import time
+from collections import OrderedDict
+
+from flask.sessions import SessionInterface, SessionMixin
+from werkzeug.datastructures import CallbackDict
+
+from feature_encoder import QUIZ_FIELDS
+
+BACKENDS = ('cookie', 'memory', 'sqlite')
+SESSION_LIFETIME = 7 * 24 * 3600  # seconds of inactivity before a session expires
+MEMORY_MAX_SESSIONS = 10000
+# SQLite sessions are only re-written to extend their expiry once this much of it is used up
+TOUCH_AFTER = SESSION_LIFETIME // 2
+# Expired SQLite sessions are deleted on one save in PURGE_EVERY
+PURGE_EVERY = 1000
+
+PROFILE_FIELDS = ('name', 'age', 'education_level', 'percentage', 'interests', 'skills', 'hobbies',
+                  'personality', 'work_style') + tuple(QUIZ_FIELDS)
+TOP_CAREER_FIELDS = ('career', 'probability')
+
+
+def _pack_record(record, fields):
+    """record's values in fields order, or None if its keys are not a prefix of fields"""
+    if not isinstance(record, dict) or list(record) != list(fields[:len(record)]):
+        return None
+    return list(record.values())
+
+
+def encode_session(data):
+    """Compact bytes for a session dict.
+
+    user_profile becomes the list of its values in PROFILE_FIELDS order (a profile saved from
+    /profile stops before the quiz answers) and top_careers a list of [career, probability]
+    pairs. Values that do not have that shape are stored as they are.
+    """
+    packed = {}
+    plain = dict(data)
+    profile = _pack_record(plain.get('user_profile'), PROFILE_FIELDS)
+    if profile is not None:
+        packed['user_profile'] = profile
+        del plain['user_profile']
+    top = plain.get('top_careers')
+    if isinstance(top, list):
+        pairs = [_pack_record(entry, TOP_CAREER_FIELDS) for entry in top]
+        if all(pair is not None and len(pair) == 2 for pair in pairs):
+            packed['top_careers'] = pairs
+            del plain['top_careers']
+    return json.dumps([plain, packed], separators=(',', ':'), default=str).encode()
+
+
+def decode_session(blob):
+    plain, packed = json.loads(blob)
+    if 'user_profile' in packed:
+        plain['user_profile'] = dict(zip(PROFILE_FIELDS, packed['user_profile']))
+    if 'top_careers' in packed:
+        plain['top_careers'] = [dict(zip(TOP_CAREER_FIELDS, pair)) for pair in packed['top_careers']]
+    return plain
+
+
+class ServerSession(CallbackDict, SessionMixin):
+    """Session dict that remembers its id and whether it was changed"""
+
+    def __init__(self, initial=None, sid=None, expires=None):
+        def on_update(self):
+            self.modified = True
+            self.accessed = True
+
+        super().__init__(initial, on_update)
+        self.sid = sid
+        self.expires = expires
+        self.user_id = (initial or {}).get('user_id')
+        self.modified = False
+        self.accessed = False
+
+    def __getitem__(self, key):
+        self.accessed = True
+        return super().__getitem__(key)
+
+    def get(self, key, default=None):
+        self.accessed = True
+        return super().get(key, default)
+
+    def __contains__(self, key):
+        self.accessed = True
+        return super().__contains__(key)
+
+
+class MemorySessionStore:
+    """LRU of encoded sessions in this process; the oldest are dropped past maxsize"""
+
+    def __init__(self, maxsize=MEMORY_MAX_SESSIONS, clock=time.time):
+        self.maxsize = maxsize
+        self.clock = clock
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def load(self, sid):
+        """(blob, expires) or None; a hit is moved to the end and its expiry extended"""
+        with self._lock:
+            entry = self._entries.get(sid)
+            if entry is None:
+                return None
+            if entry[1] <= self.clock():
+                del self._entries[sid]
+                return None
+            self._entries.move_to_end(sid)
+            expires = self._entries[sid][1] = self.clock() + SESSION_LIFETIME
+            return entry[0], expires
+
+    def save(self, sid, blob, expires):
+        with self._lock:
+            self._entries[sid] = [blob, expires]
+            self._entries.move_to_end(sid)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def touch(self, sid, expires):
+        pass  # load() already extended the expiry
+
+    def delete(self, sid):
+        with self._lock:
+            self._entries.pop(sid, None)
+
+    def __len__(self):
+        return len(self._entries)
+
+
+class SQLiteSessionStore:
+    """Sessions in the sessions table of a db.Database, shared by every worker process"""
+
+    def __init__(self, database, clock=time.time):
+        self.database = database
+        self.clock = clock
+        self._saves = 0
+
+    def load(self, sid):
+        row = self.database.load_session(sid, self.clock())
+        return None if row is None else (bytes(row[0]), row[1])
+
+    def save(self, sid, blob, expires):
+        self.database.save_session(sid, blob, expires)
+        self._saves += 1
+        if self._saves % PURGE_EVERY == 0:
+            self.database.delete_expired_sessions(self.clock())
+
+    def touch(self, sid, expires):
+        self.database.touch_session(sid, expires)
+
+    def delete(self, sid):
+        self.database.delete_session(sid)
+
+
+class ServerSessionInterface(SessionInterface):
+    """Flask session interface keeping sessions in a MemorySessionStore or SQLiteSessionStore"""
+
+    def __init__(self, store, lifetime=SESSION_LIFETIME, clock=time.time):
+        self.store = store
+        self.lifetime = lifetime
+        self.clock = clock
+
+    def open_session(self, app, request):
+        sid = request.cookies.get(self.get_cookie_name(app))
+        if sid:
+            entry = self.store.load(sid)
+            if entry is not None:
+                blob, expires = entry
+                try:
+                    return ServerSession(decode_session(blob), sid=sid, expires=expires)
+                except (ValueError, TypeError):
+                    self.store.delete(sid)
+        return ServerSession()
+
+    def save_session(self, app, session, response):
+        name = self.get_cookie_name(app)
+        domain = self.get_cookie_domain(app)
+        path = self.get_cookie_path(app)
+        if session.accessed:
+            response.vary.add('Cookie')
+
+        if not session:
+            if session.sid:
+                self.store.delete(session.sid)
+                response.delete_cookie(name, domain=domain, path=path,
+                                       secure=self.get_cookie_secure(app),
+                                       samesite=self.get_cookie_samesite(app),
+                                       httponly=self.get_cookie_httponly(app))
+            return
+
+        now = self.clock()
+        new_id = session.sid is None or session.get('user_id') != session.user_id
+        if new_id:
+            if session.sid:
+                self.store.delete(session.sid)
+            session.sid = secrets.token_urlsafe(32)
+        if new_id or session.modified:
+            self.store.save(session.sid, encode_session(dict(session)), now + self.lifetime)
+        elif session.expires is not None and session.expires - now < self.lifetime - TOUCH_AFTER:
+            self.store.touch(session.sid, now + self.lifetime)
+
+        if new_id:
+            response.set_cookie(name, session.sid, expires=self.get_expiration_time(app, session),
+                                httponly=self.get_cookie_httponly(app), domain=domain, path=path,
+                                secure=self.get_cookie_secure(app),
+                                samesite=self.get_cookie_samesite(app))
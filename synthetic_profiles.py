@@ -0,0 +1,256 @@
+"""Seeded synthetic student profiles for load and scale testing.
+
+Two schemas are supported:
+
+- careers: the datasets/careers_dataset.csv layout used by train_model.py, bulk_score.py and
+  the app. Every row starts from one of the dataset's rows (an archetype): its labels, with
+  sometimes an extra label, personality and work style, quiz answers within one point, and
+  a percentage spread around it. The career is the archetype of the same interests and
+  skills whose percentage is closest, so the score bands in the dataset
+  (e.g. Software Engineer / Web Developer) are kept.
+- notebook: the 40-feature career_prediction_dataset.csv of quiz_mini5.ipynb, with the
+  distributions of generate_career_profile() and the rules of
+  assign_career_based_on_profile() applied to whole blocks of rows with np.select.
+
+Rows are generated in blocks of NumPy arrays and appended to the output CSV, so memory is
+bounded by the block size. The same seed, row count and block size always give the same file:
+
+    python synthetic_profiles.py careers students.csv --rows 1000000 --seed 42
+    python synthetic_profiles.py notebook career_prediction_dataset.csv --rows 100000
+"""
+import argparse
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from feature_encoder import QUIZ_FIELDS, parse_labels
+
+CAREERS_DATASET = 'datasets/careers_dataset.csv'
+DEFAULT_BLOCK_SIZE = 100000
+SCHEMAS = ('careers', 'notebook')
+
+# careers schema: chance of a second interest/skill/hobby, of a personality other than the
+# archetype's, and the spread of the percentage around the archetype's
+EXTRA_LABEL_RATE = 0.3
+PERSONALITY_SWAP_RATE = 0.2
+PERCENTAGE_SPREAD = 8
+
+NOTEBOOK_WORK_ENVIRONMENTS = ['Office', 'Remote', 'Outdoors', 'Laboratory', 'Hospital', 'School',
+                              'Client Sites', 'Studio']
+NOTEBOOK_EDUCATION_LEVELS = ['High School', 'Associate Degree', 'Bachelor Degree', 'Master Degree',
+                             'PhD', 'Professional Degree']
+NOTEBOOK_WORK_STYLES = ['Independent', 'Team-based', 'Project-based', 'Routine', 'Varied',
+                        'Leadership-focused']
+NOTEBOOK_PERSONALITY_TYPES = ['Introverted', 'Extroverted', 'Ambivert']
+NOTEBOOK_INTERESTS = ['Technology', 'Healthcare', 'Education', 'Arts', 'Business', 'Science', 'Law',
+                      'Sports', 'Travel', 'Writing']
+NOTEBOOK_TRAITS = ['problem_solving', 'creativity', 'people_interaction', 'leadership', 'technical_skills',
+                   'analytical_thinking', 'communication_skills', 'attention_to_detail',
+                   'stress_tolerance', 'innovation']
+NOTEBOOK_PREFERENCES = ['income_importance', 'job_security', 'work_life_balance', 'career_growth',
+                        'autonomy']
+# (column, probability of 1) for the binary skills and qualifications
+NOTEBOOK_FLAGS = [('programming_skills', 0.3), ('design_skills', 0.2), ('mathematical_skills', 0.4),
+                  ('writing_skills', 0.5), ('public_speaking', 0.3), ('volunteer_experience', 0.4),
+                  ('internship_experience', 0.5)]
+NOTEBOOK_COLUMNS = (NOTEBOOK_TRAITS + NOTEBOOK_PREFERENCES
+                    + ['age', 'years_experience', 'education_level', 'work_environment', 'work_style',
+                       'personality_type', 'programming_skills', 'design_skills', 'mathematical_skills',
+                       'writing_skills', 'public_speaking', 'foreign_languages', 'certifications',
+                       'volunteer_experience', 'internship_experience']
+                    + [f'interest_{name.lower()}' for name in NOTEBOOK_INTERESTS]
+                    + ['career'])
+
+
+def _pick(rng, options, n):
+    """n random entries of options as an object array"""
+    return np.asarray(options, dtype=object)[rng.integers(0, len(options), n)]
+
+
+def _with_extra_label(rng, primary, pool):
+    """primary labels (one per row) with, at EXTRA_LABEL_RATE, another label of pool appended"""
+    pool = np.asarray(pool, dtype=object)
+    extra = pool[rng.integers(0, len(pool), len(primary))]
+    add = (rng.random(len(primary)) < EXTRA_LABEL_RATE) & (extra != primary)
+    labels = primary.copy()
+    labels[add] = primary[add] + ', ' + extra[add]
+    return labels
+
+
+class CareersSchema:
+    """Generator for the careers_dataset.csv layout, built from the dataset's own rows"""
+
+    def __init__(self, dataset=CAREERS_DATASET):
+        self.archetypes = pd.read_csv(dataset)
+        self.columns = list(self.archetypes.columns)
+        self.pools = {field: sorted({label for text in self.archetypes[field] for label in parse_labels(text)})
+                      for field in ('interests', 'skills', 'hobbies')}
+        self.personalities = sorted(self.archetypes['personality'].unique())
+
+        # Archetypes with the same interests and skills differ by percentage band: a row is
+        # assigned the career of the group member with the nearest percentage
+        groups = self.archetypes.groupby(['interests', 'skills'], sort=False).ngroup().to_numpy()
+        self.group = groups
+        percentages = self.archetypes['percentage'].to_numpy(dtype=float)
+        self.members = [np.flatnonzero(groups == g) for g in range(groups.max() + 1)]
+        self.member_percentages = [percentages[members] for members in self.members]
+
+    def block(self, rng, n, start=0):
+        a = self.archetypes
+        base = rng.integers(0, len(a), n)
+        out = {'name': np.char.add('Student', np.arange(start + 1, start + n + 1).astype(str))}
+        out['age'] = rng.integers(15, 20, n)
+        percentage = a['percentage'].to_numpy(dtype=float)[base] + rng.normal(0, PERCENTAGE_SPREAD, n)
+        out['percentage'] = np.clip(np.rint(percentage), 35, 100).astype(int)
+        for field in ('interests', 'skills', 'hobbies'):
+            out[field] = _with_extra_label(rng, a[field].to_numpy(dtype=object)[base], self.pools[field])
+        personality = a['personality'].to_numpy(dtype=object)[base]
+        swap = rng.random(n) < PERSONALITY_SWAP_RATE
+        personality[swap] = _pick(rng, self.personalities, int(swap.sum()))
+        out['personality'] = personality
+        out['work_style'] = a['work_style'].to_numpy(dtype=object)[base]
+        noise = rng.choice([-1, 0, 1], size=(n, len(QUIZ_FIELDS)), p=[0.2, 0.6, 0.2])
+        quiz = np.clip(a[QUIZ_FIELDS].to_numpy()[base] + noise, 1, 5)
+        for i, field in enumerate(QUIZ_FIELDS):
+            out[field] = quiz[:, i]
+
+        career = np.empty(n, dtype=np.int64)
+        group = self.group[base]
+        for g, members in enumerate(self.members):
+            rows = np.flatnonzero(group == g)
+            if len(rows):
+                distance = np.abs(out['percentage'][rows, None] - self.member_percentages[g][None, :])
+                career[rows] = members[distance.argmin(axis=1)]
+        out['career_path'] = a['career_path'].to_numpy(dtype=object)[career]
+        return pd.DataFrame(out, columns=self.columns)
+
+
+class NotebookSchema:
+    """Generator for the notebook's career_prediction_dataset.csv layout"""
+
+    columns = NOTEBOOK_COLUMNS
+
+    def block(self, rng, n, start=0):
+        out = {}
+        for column in NOTEBOOK_TRAITS + NOTEBOOK_PREFERENCES:
+            out[column] = rng.integers(1, 6, n)
+        age = rng.integers(18, 65, n)
+        out['age'] = age
+        out['years_experience'] = np.minimum(np.maximum(age - 22, 0), rng.integers(0, 40, n))
+        out['education_level'] = _pick(rng, NOTEBOOK_EDUCATION_LEVELS, n)
+        out['work_environment'] = _pick(rng, NOTEBOOK_WORK_ENVIRONMENTS, n)
+        out['work_style'] = _pick(rng, NOTEBOOK_WORK_STYLES, n)
+        out['personality_type'] = _pick(rng, NOTEBOOK_PERSONALITY_TYPES, n)
+
+        # 1-5 distinct interests per row: the k lowest of a random key per interest
+        keys = rng.random((n, len(NOTEBOOK_INTERESTS)))
+        ranks = keys.argsort(axis=1).argsort(axis=1)
+        interests = ranks < rng.integers(1, 6, n)[:, None]
+
+        for column, p in NOTEBOOK_FLAGS:
+            out[column] = (rng.random(n) < p).astype(int)
+        out['foreign_languages'] = rng.integers(0, 4, n)
+        out['certifications'] = rng.integers(0, 6, n)
+        for i, name in enumerate(NOTEBOOK_INTERESTS):
+            out[f'interest_{name.lower()}'] = interests[:, i].astype(int)
+
+        out['career'] = self.assign_careers(rng, out, interests)
+        return pd.DataFrame(out, columns=self.columns)
+
+    @staticmethod
+    def assign_careers(rng, p, interests):
+        """assign_career_based_on_profile for whole columns: the first matching rule wins"""
+        n = len(p['age'])
+
+        def likes(name):
+            return interests[:, NOTEBOOK_INTERESTS.index(name)]
+
+        def choice(*careers):
+            return _pick(rng, careers, n)
+
+        education = p['education_level']
+        # The default rule compares technical skills, creativity and people interaction
+        top = np.maximum.reduce([p['technical_skills'], p['creativity'], p['people_interaction']])
+        rules = [
+            (p['technical_skills'] >= 4) & (p['programming_skills'] == 1) & likes('Technology'),
+            (p['people_interaction'] >= 4) & likes('Healthcare')
+            & np.isin(education, ['Master Degree', 'PhD', 'Professional Degree']),
+            (p['creativity'] >= 4) & (p['design_skills'] == 1) & likes('Arts'),
+            (p['leadership'] >= 4) & (p['people_interaction'] >= 4) & likes('Business'),
+            (p['people_interaction'] >= 4) & likes('Education') & (p['communication_skills'] >= 4),
+            (p['analytical_thinking'] >= 4) & likes('Law') & (education == 'Professional Degree'),
+            (p['writing_skills'] == 1) & (p['creativity'] >= 3) & likes('Writing'),
+            (p['analytical_thinking'] >= 4) & (p['mathematical_skills'] == 1) & likes('Business'),
+            (p['problem_solving'] >= 4) & (p['technical_skills'] >= 4) & (p['mathematical_skills'] == 1),
+            (p['people_interaction'] >= 4) & np.isin(education, ['Master Degree', 'PhD']),
+            top == p['technical_skills'],
+            top == p['creativity'],
+        ]
+        careers = [
+            np.where(p['analytical_thinking'] >= 4,
+                     choice('Data Scientist', 'Software Engineer', 'Research Scientist'),
+                     choice('Web Developer', 'Software Engineer')),
+            np.where(p['leadership'] >= 4, 'Doctor', choice('Nurse', 'Pharmacist', 'Dentist')),
+            choice('Graphic Designer', 'UX Designer', 'Artist'),
+            np.where(p['income_importance'] >= 4,
+                     choice('Marketing Manager', 'Sales Manager', 'Consultant'),
+                     choice('HR Manager', 'Operations Manager', 'Project Manager')),
+            'Teacher',
+            'Lawyer',
+            'Writer/Journalist',
+            choice('Financial Analyst', 'Accountant'),
+            choice('Mechanical Engineer', 'Civil Engineer'),
+            'Psychologist',
+            choice('Business Analyst', 'Product Manager'),
+            'Architect',
+        ]
+        return np.select(rules, careers, default=choice('Sales Manager', 'Consultant'))
+
+
+def make_schema(name, dataset=CAREERS_DATASET):
+    if name not in SCHEMAS:
+        raise ValueError(f'schema must be one of {SCHEMAS}, got {name!r}')
+    return CareersSchema(dataset) if name == 'careers' else NotebookSchema()
+
+
+def generate(schema, rows, seed=42, block_size=DEFAULT_BLOCK_SIZE):
+    """Yield DataFrames of up to block_size profiles, rows in total"""
+    rng = np.random.default_rng(seed)
+    for start in range(0, rows, block_size):
+        yield schema.block(rng, min(block_size, rows - start), start)
+
+
+def write_csv(path, schema, rows, seed=42, block_size=DEFAULT_BLOCK_SIZE):
+    """Stream rows profiles to path; returns the number of rows written"""
+    written = 0
+    for block in generate(schema, rows, seed, block_size):
+        block.to_csv(path, mode='w' if written == 0 else 'a', header=written == 0, index=False)
+        written += len(block)
+    if written == 0:
+        pd.DataFrame(columns=schema.columns).to_csv(path, index=False)
+    return written
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Generate synthetic career profiles')
+    parser.add_argument('schema', choices=SCHEMAS)
+    parser.add_argument('output', help='CSV file to write')
+    parser.add_argument('--rows', type=int, default=DEFAULT_BLOCK_SIZE)
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--block-size', type=int, default=DEFAULT_BLOCK_SIZE)
+    parser.add_argument('--dataset', default=CAREERS_DATASET,
+                        help='archetype rows for the careers schema (default %(default)s)')
+    args = parser.parse_args()
+    if args.rows < 0 or args.block_size < 1:
+        parser.error('--rows must be >= 0 and --block-size positive')
+
+    start = time.perf_counter()
+    rows = write_csv(args.output, make_schema(args.schema, args.dataset), args.rows, args.seed, args.block_size)
+    seconds = time.perf_counter() - start
+    print(f'Wrote {rows} {args.schema} profiles to {args.output} in {seconds:.1f} s', file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
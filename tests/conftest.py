@@ -0,0 +1,25 @@
+"""Shared fixtures: the app imported from the repository root against a temporary database."""
+import os
+import sys
+import tempfile
+import warnings
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+
+@pytest.fixture(scope='session')
+def pathfinder_app():
+    os.chdir(ROOT)
+    os.environ['PATHFINDER_DB'] = os.path.join(tempfile.mkdtemp(prefix='pathfinder-test-'), 'test.db')
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')  # the model pickle's sklearn version
+        import pathfinder_app
+    return pathfinder_app
+
+
+@pytest.fixture
+def client(pathfinder_app):
+    return pathfinder_app.app.test_client()
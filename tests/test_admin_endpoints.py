@@ -0,0 +1,22 @@
+import pytest
+
+ADMIN_ENDPOINTS = ['/model/info', '/predict/cache', '/pages/cache', '/metrics', '/analytics/careers']
+
+
+@pytest.fixture
+def admin_token(pathfinder_app, monkeypatch):
+    monkeypatch.setattr(pathfinder_app, 'ADMIN_TOKEN', 'secret')
+    return 'secret'
+
+
+@pytest.mark.parametrize('path', ADMIN_ENDPOINTS)
+def test_internal_state_needs_the_admin_token(client, admin_token, path):
+    assert client.get(path).status_code == 403
+    assert client.get(path, headers={'X-Admin-Token': 'wrong'}).status_code == 403
+    assert client.get(path, headers={'X-Admin-Token': admin_token}).status_code == 200
+    assert client.get(path, headers={'Authorization': f'Bearer {admin_token}'}).status_code == 200
+
+
+@pytest.mark.parametrize('path', ADMIN_ENDPOINTS)
+def test_disabled_without_a_configured_token(client, path):
+    assert client.get(path, headers={'X-Admin-Token': ''}).status_code == 403
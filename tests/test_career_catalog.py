@@ -0,0 +1,18 @@
+from career_catalog import CareerCatalog
+
+CAREERS = {name: {} for name in (
+    'Aerospace Engineering', 'Biomedical Engineering', 'Chemical Engineering',
+    'Engineering Manager', 'Software Engineer', 'Engine Mechanic')}
+
+
+def test_names_starting_with_query_fill_the_limit_first():
+    catalog = CareerCatalog(CAREERS)
+    assert catalog.search('eng', limit=2) == ['Engine Mechanic', 'Engineering Manager']
+    # Then the other matches, ordered by the matching words
+    assert catalog.search('eng', limit=4) == ['Engine Mechanic', 'Engineering Manager',
+                                              'Software Engineer', 'Aerospace Engineering']
+    assert len(catalog.search('eng', limit=10)) == 6
+
+
+def test_search_normalizes_the_query():
+    assert CareerCatalog(CAREERS).search('  SOFTWARE-eng') == ['Software Engineer']
@@ -0,0 +1,51 @@
+import numpy as np
+import pytest
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.tree import DecisionTreeClassifier, DecisionTreeRegressor
+
+from forest_engine import FlatForest, flatten_tree
+
+
+@pytest.fixture(scope='module')
+def data():
+    rng = np.random.default_rng(0)
+    X = np.hstack([rng.integers(14, 26, (600, 1)), rng.uniform(35, 100, (600, 1)),
+                   rng.integers(0, 2, (600, 8)), rng.integers(1, 6, (600, 3))]).astype(float)
+    y = np.array(['Doctor', 'Lawyer', 'Pilot', 'Teacher'])[(X[:, 1] > 60) + 2 * (X[:, 2] == 1)]
+    y[rng.random(600) < 0.2] = 'Pilot'  # noise, so the trees grow deep and disagree
+    return X, y
+
+
+def test_flat_forest_matches_sklearn(data):
+    X, y = data
+    clf = RandomForestClassifier(n_estimators=15, max_depth=8, random_state=0).fit(X, y)
+    forest = FlatForest.from_sklearn(clf)
+    # Rows near, not on, the training points, so they also take unseen paths
+    X_test = X[:300] + np.random.default_rng(1).normal(0, 0.3, (300, X.shape[1]))
+
+    expected = clf.predict_proba(X_test)
+    assert np.allclose(forest.predict_proba(X_test), expected, rtol=0, atol=1e-9)
+    # Exact ties may break differently after float summation; compare the other rows
+    top2 = np.sort(expected, axis=1)[:, -2:]
+    clear = top2[:, 1] - top2[:, 0] > 1e-9
+    assert np.array_equal(forest.predict(X_test)[clear], clf.predict(X_test)[clear])
+    assert list(forest.classes_) == list(clf.classes_)
+
+
+def test_flat_forest_of_one_tree_reaches_sklearn_leaves(data):
+    X, y = data
+    tree = DecisionTreeClassifier(max_depth=6, random_state=0).fit(X, y)
+    assert np.array_equal(FlatForest.from_sklearn(tree).apply(X)[:, 0], tree.apply(X.astype(np.float32)))
+
+
+def test_flatten_tree_offsets_and_leaves(data):
+    X, y = data
+    t = DecisionTreeRegressor(max_depth=4, random_state=0).fit(X, (y == 'Doctor').astype(float)).tree_
+    feature, threshold, left, right = flatten_tree(t, offset=5)
+    leaf = t.children_left == -1
+    nodes = np.arange(t.node_count) + 5
+    assert np.array_equal(left[leaf], nodes[leaf]) and np.array_equal(right[leaf], nodes[leaf])
+    assert np.all(np.isinf(threshold[leaf])) and np.all(feature[leaf] == 0)
+    assert np.array_equal(left[~leaf], t.children_left[~leaf] + 5)
+    assert np.array_equal(right[~leaf], t.children_right[~leaf] + 5)
+    assert np.array_equal(feature[~leaf], t.feature[~leaf])
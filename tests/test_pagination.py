@@ -0,0 +1,14 @@
+import re
+
+
+def page_links(pathfinder_app, page, pages):
+    with pathfinder_app.app.test_request_context('/courses'):
+        html = pathfinder_app.render_template('pagination.html', page={'page': page, 'pages': pages},
+                                              page_url=lambda number: f'?page={number}')
+    return re.findall(r'>(\d+)</a>', html)
+
+
+def test_links_window_around_current_page(pathfinder_app):
+    assert page_links(pathfinder_app, 2000, 4000) == ['1', '1998', '1999', '2000', '2001', '2002', '4000']
+    assert page_links(pathfinder_app, 1, 4000) == ['1', '2', '3', '4000']
+    assert page_links(pathfinder_app, 4, 7) == [str(n) for n in range(1, 8)]
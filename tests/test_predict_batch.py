@@ -0,0 +1,31 @@
+import pytest
+
+VALID = {'interests': ['Technology'], 'skills': ['Programming'], 'percentage': 85}
+
+
+@pytest.mark.parametrize('bad', [
+    {'interests': ['Technology', 1]},
+    {'interests': [['x']]},
+    {'personality': ['x']},
+    {'work_style': {'a': 1}},
+    {'age': 'old'},
+    'not a profile',
+])
+def test_malformed_row_is_a_row_error(client, bad):
+    response = client.post('/predict/batch', json=[VALID, bad, VALID])
+    assert response.status_code == 200
+    results = response.get_json()['results']
+    assert [r['index'] for r in results] == [0, 1, 2]
+    assert results[1]['error']
+    assert results[0]['career_path'] == results[2]['career_path']
+
+
+@pytest.mark.parametrize('bad', ['{"interests": ["A", 1]}', '{"personality": ["x"]}', '["x"]', 'null'])
+def test_malformed_profile_is_a_400(client, bad):
+    response = client.post('/predict', data=bad, content_type='application/json')
+    assert response.status_code == 400
+    assert 'error' in response.get_json()
+
+
+def test_missing_categorical_takes_default(client):
+    assert client.post('/predict', json=dict(VALID, personality=None)).status_code == 200
@@ -0,0 +1,52 @@
+import pytest
+from flask import make_response
+
+
+@pytest.fixture
+def logged_in(pathfinder_app, client):
+    """A client that logged in through /login, so the login flash is still in its session"""
+    email = 'cache-test@example.com'
+    if not pathfinder_app.get_user_by_email(email):
+        pathfinder_app.create_user('Cache', 'Test', email, 'password123', 16, '10th')
+    client.post('/login', data={'email': email, 'password': 'password123'})
+    return client
+
+
+def test_logged_in_pages_revalidate(pathfinder_app, logged_in):
+    with logged_in.session_transaction() as session:
+        assert '_flashes' in session  # base.html does not show flashes
+    hits = pathfinder_app.response_cache.hits
+
+    first = logged_in.get('/courses')
+    assert first.status_code == 200 and first.headers.get('ETag')
+    assert 'private' in first.headers['Cache-Control']
+    revalidated = logged_in.get('/courses', headers={'If-None-Match': first.headers['ETag']})
+    assert revalidated.status_code == 304
+    assert pathfinder_app.response_cache.hits > hits
+
+
+def test_views_not_declared_flash_free_are_not_cached_with_flashes_pending(pathfinder_app):
+    cache = pathfinder_app.response_cache
+    view = cache.cached(lambda: make_response(pathfinder_app.render_template('login.html')))
+    with pathfinder_app.app.test_request_context('/login'):
+        pathfinder_app.session['_flashes'] = [('success', 'Shown once')]
+        lookups = cache.hits + cache.misses
+        page = view()
+        assert b'Shown once' in page.get_data()
+        assert 'ETag' not in page.headers
+        assert cache.hits + cache.misses == lookups
+
+
+def test_result_page_revalidates_after_login(logged_in):
+    profile = {'name': 'Cache Test', 'age': '16', 'education_level': '10th', 'percentage': '82',
+               'interests': ['Technology'], 'skills': ['Programming'], 'hobbies': ['Reading'],
+               'personality': 'Introvert', 'work_style': 'Analytical'}
+    submitted = logged_in.post('/submit_profile', data=profile)
+    assert '/results/' in submitted.headers['Location']
+
+    page = logged_in.get(submitted.headers['Location'])
+    assert page.status_code == 200 and page.headers.get('ETag')
+    assert 'no-cache' in page.headers['Cache-Control']
+    revalidated = logged_in.get(submitted.headers['Location'],
+                                headers={'If-None-Match': page.headers['ETag']})
+    assert revalidated.status_code == 304
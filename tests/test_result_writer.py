@@ -0,0 +1,44 @@
+import threading
+
+from result_writer import ResultWriter
+
+
+class FlakyDatabase:
+    """Records saved rows; rows whose career is in `bad` fail while `broken` is set"""
+
+    def __init__(self, bad=()):
+        self.rows = []
+        self.bad = set(bad)
+        self.broken = True
+        self.lock = threading.Lock()
+
+    def save_user_results(self, rows):
+        rows = list(rows)
+        if self.broken and any(row[1] in self.bad for row in rows):
+            raise RuntimeError('disk I/O error')
+        with self.lock:
+            self.rows.extend(rows)
+
+
+def test_failed_batch_keeps_its_rows():
+    database = FlakyDatabase(bad={'Lawyer'})
+    writer = ResultWriter(database, batch_size=10, flush_interval=0.01).start()
+    for career in ('Doctor', 'Lawyer', 'Pilot'):
+        writer.submit(1, career, {})
+    writer.flush()
+    assert sorted(row[1] for row in database.rows) == ['Doctor', 'Pilot']
+    assert writer.stats()['unwritten'] == 1
+
+    database.broken = False
+    writer.close()
+    assert sorted(row[1] for row in database.rows) == ['Doctor', 'Lawyer', 'Pilot']
+    assert writer.stats()['unwritten'] == 0
+
+
+def test_submit_after_close_writes_synchronously():
+    database = FlakyDatabase()
+    writer = ResultWriter(database).start()
+    writer.close()
+    writer.submit(1, 'Doctor', {})
+    assert [row[1] for row in database.rows] == ['Doctor']
+    assert writer.stats()['sync_writes'] == 1
@@ -0,0 +1,237 @@
+"""The fallback rules file against the hand-written cascades it replaced.
+
+The cascades below are the app's original get_*_career_recommendation functions, kept here
+as the reference: datasets/fallback_rules.json is the only copy the app uses.
+"""
+import itertools
+import os
+
+import numpy as np
+import pytest
+
+from rule_engine import RuleEngine
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+INTERESTS = ['Technology', 'Science', 'Commerce', 'Business', 'Arts', 'Engineering', 'Music']
+SKILLS = ['Programming', 'Creativity', 'Technical Skills', 'Leadership', 'Communication']
+LEVELS = ['10th', '12th', 'Graduate']
+
+
+def legacy_recommendation(data):
+    """The hand-written fallback cascade the rules file replaced"""
+    interests = data.get('interests', [])
+    skills = data.get('skills', [])
+    percentage = data.get('percentage', 70)
+    education_level = data.get('education_level', '10th')
+
+    # Different career paths based on education level
+    if education_level == '10th':
+        return tenth_grade(interests, skills, percentage)
+    elif education_level == '12th':
+        return twelfth_grade(interests, skills, percentage)
+    else:
+        # Default for other levels
+        return general(interests, skills, percentage)
+
+
+def tenth_grade(interests, skills, percentage):
+    """Get career recommendations for 10th grade students"""
+    if 'Technology' in interests or 'Programming' in skills or 'Engineering' in interests:
+        if percentage >= 85:
+            return 'Computer Science (PCM) - Engineering Path'
+        elif percentage >= 75:
+            return 'IT/Computer Applications - Diploma'
+        elif percentage >= 60:
+            return 'Web Development - Certificate Course'
+        elif percentage >= 45:
+            return 'Engineering - Alternative Paths Available'
+        else:
+            return 'Computer Operator - Vocational Training'
+
+    elif 'Science' in interests:
+        if percentage >= 90:
+            return 'Medical (PCB) - Pre-Medical Path'
+        elif percentage >= 80:
+            return 'Engineering (PCM) - Technical Path'
+        elif percentage >= 70:
+            return 'Pharmacy - Diploma Course'
+        elif percentage >= 45:
+            return 'Engineering - Alternative Paths Available'
+        else:
+            return 'Lab Assistant - Vocational Training'
+
+    elif 'Commerce' in interests or 'Business' in interests:
+        if percentage >= 80:
+            return 'Commerce (PCM/PCB) - Business Path'
+        elif percentage >= 70:
+            return 'Business Administration - Diploma'
+        elif percentage >= 60:
+            return 'Accounting - Certificate Course'
+        else:
+            return 'Retail Management - Vocational Training'
+
+    elif 'Arts' in interests or 'Creativity' in skills:
+        if percentage >= 75:
+            return 'Design (Any Stream) - Creative Path'
+        elif percentage >= 65:
+            return 'Fashion Design - Diploma'
+        elif percentage >= 55:
+            return 'Graphic Design - Certificate Course'
+        else:
+            return 'Craft & Design - Vocational Training'
+
+    else:
+        # Default recommendations based on percentage
+        if percentage >= 85:
+            return 'Science (PCM) - Engineering Path'
+        elif percentage >= 75:
+            return 'Commerce - Business Path'
+        elif percentage >= 65:
+            return 'Arts - Creative Path'
+        elif percentage >= 45:
+            return 'Engineering - Alternative Paths Available'
+        else:
+            return 'Vocational Training - Skill Development'
+
+
+def twelfth_grade(interests, skills, percentage):
+    """Get career recommendations for 12th grade students"""
+    if 'Technology' in interests or 'Programming' in skills:
+        if percentage >= 85:
+            return 'B.Tech Computer Science'
+        elif percentage >= 75:
+            return 'BCA (Bachelor of Computer Applications)'
+        elif percentage >= 65:
+            return 'Diploma in Computer Engineering'
+        else:
+            return 'IT Certification Courses'
+
+    elif 'Science' in interests:
+        if percentage >= 90:
+            return 'MBBS (Medical)'
+        elif percentage >= 80:
+            return 'B.Tech Engineering'
+        elif percentage >= 70:
+            return 'BSc (Bachelor of Science)'
+        else:
+            return 'Diploma in Science/Technology'
+
+    elif 'Commerce' in interests or 'Business' in interests:
+        if percentage >= 80:
+            return 'BBA (Bachelor of Business Administration)'
+        elif percentage >= 70:
+            return 'B.Com (Bachelor of Commerce)'
+        elif percentage >= 60:
+            return 'Diploma in Business Management'
+        else:
+            return 'Certificate in Business Skills'
+
+    elif 'Arts' in interests or 'Creativity' in skills:
+        if percentage >= 75:
+            return 'B.Des (Bachelor of Design)'
+        elif percentage >= 65:
+            return 'BA (Bachelor of Arts)'
+        elif percentage >= 55:
+            return 'Diploma in Design/Arts'
+        else:
+            return 'Certificate in Creative Arts'
+
+    else:
+        # Default recommendations based on percentage
+        if percentage >= 85:
+            return 'B.Tech Engineering'
+        elif percentage >= 75:
+            return 'BBA/B.Com'
+        elif percentage >= 65:
+            return 'BA/BSc'
+        else:
+            return 'Diploma/Certificate Courses'
+
+
+def general(interests, skills, percentage):
+    """Get general career recommendations for other education levels"""
+    if 'Technology' in interests or 'Programming' in skills:
+        if percentage >= 80:
+            return 'Software Engineer'
+        elif percentage >= 60:
+            return 'Web Developer'
+        else:
+            return 'IT Support Specialist'
+
+    elif 'Science' in interests:
+        if percentage >= 85:
+            return 'Medical Doctor'
+        elif percentage >= 70:
+            return 'Pharmacist'
+        else:
+            return 'Lab Technician'
+
+    elif 'Engineering' in interests or 'Technical Skills' in skills:
+        if percentage >= 75:
+            return 'Mechanical Engineer'
+        elif percentage >= 60:
+            return 'Civil Engineer'
+        else:
+            return 'Technician'
+
+    elif 'Business' in interests or 'Leadership' in skills:
+        if percentage >= 70:
+            return 'Business Manager'
+        elif percentage >= 60:
+            return 'Sales Executive'
+        else:
+            return 'Customer Service Representative'
+
+    elif 'Arts' in interests or 'Creativity' in skills:
+        if percentage >= 65:
+            return 'Graphic Designer'
+        elif percentage >= 50:
+            return 'UI/UX Designer'
+        else:
+            return 'Content Creator'
+
+    else:
+        # Default recommendations based on percentage
+        if percentage >= 80:
+            return 'Software Engineer'
+        elif percentage >= 70:
+            return 'Business Manager'
+        elif percentage >= 60:
+            return 'Web Developer'
+        else:
+            return 'Customer Service Representative'
+
+
+def subsets(labels, largest):
+    return [list(combo) for n in range(largest + 1) for combo in itertools.combinations(labels, n)]
+
+
+@pytest.fixture(scope='module')
+def engine():
+    return RuleEngine.from_file(os.path.join(ROOT, 'datasets', 'fallback_rules.json'))
+
+
+@pytest.fixture(scope='module')
+def profiles(engine):
+    """Label combinations of up to two interests and one skill, every breakpoint, the value
+    just below each one and a few in between, and a missing (NaN) percentage"""
+    breakpoints = {b for table in engine.tables.values() for rule in table for b in rule[2]}
+    percentages = sorted(breakpoints | {np.nextafter(b, -np.inf) for b in breakpoints}
+                         | {0.0, 30.0, 100.0}) + [float('nan')]
+    return [{'interests': interests, 'skills': skills, 'percentage': percentage,
+             'education_level': level}
+            for level in LEVELS
+            for interests in subsets(INTERESTS, 2)
+            for skills in subsets(SKILLS, 1)
+            for percentage in percentages]
+
+
+def test_recommend_matches_the_cascades(engine, profiles):
+    for profile in profiles:
+        assert engine.recommend(profile) == legacy_recommendation(profile), profile
+
+
+def test_score_matches_the_cascades(engine, profiles):
+    codes = engine.score(*engine.encode(profiles))
+    for profile, code in zip(profiles, codes):
+        assert engine.careers[code] == legacy_recommendation(profile), profile
@@ -1,79 +1,223 @@
-import pandas as pd
+"""Train the career prediction model.
+
+Run from ml_model/ (paths are relative to it):
+
+    python ../train_model.py [--data PATH] [--artifact-dir DIR] [--profile]
+
+The pipeline has four stages: load (read and encode the CSV), split, train and save. The
+encoded feature matrix, targets and fitted encoders are cached under --cache-dir, keyed by a
+hash of the dataset file, so re-running on unchanged data skips reading and encoding
+entirely. Encoding goes through FeatureEncoder.encode_frame, the same column layout that is
+used at serve time. The forest is trained on every core (--jobs, default all).
+
+Training also distills the forest into a shallow tree (see distilled_model.py), fitted on
+the training rows plus --distill-rows unlabelled profiles that the forest labels itself: half
+synthetic profiles around the dataset's rows, half spread over the whole input space. It is
+saved in the bundle with its report: how often it escalates to the forest, how often it agrees
+with it and the single-row latency saved, measured on held-out and fresh profiles of both
+kinds. --distill-depth 0 skips it.
+"""
+import argparse
+import hashlib
+import os
+import sys
+import time
+from contextlib import contextmanager
+
+import joblib
 import numpy as np
+import pandas as pd
 from sklearn.ensemble import RandomForestClassifier
 from sklearn.model_selection import train_test_split
-from sklearn.preprocessing import MultiLabelBinarizer, LabelEncoder
-from sklearn.pipeline import Pipeline
-from sklearn.compose import ColumnTransformer
-from sklearn.impute import SimpleImputer
-from sklearn.preprocessing import StandardScaler, OneHotEncoder
-import joblib
+from sklearn.preprocessing import LabelEncoder, MultiLabelBinarizer
+
+from distilled_model import (DEFAULT_CONFIDENCE, DEFAULT_MAX_DEPTH, DistilledModel, evaluate, print_report,
+                             random_features)
+from feature_encoder import FeatureEncoder, QUIZ_FIELDS, parse_labels
+from model_artifact import save_model_artifact
+from synthetic_profiles import CareersSchema, generate
 
-# Load dataset
 DATA_PATH = '../datasets/careers_dataset.csv'
-df = pd.read_csv(DATA_PATH)
-
-# Preprocess features
-categorical_cols = ['interests', 'skills', 'hobbies', 'personality', 'work_style']
-quiz_cols = [f'quiz_q{i}' for i in range(1, 11)]
-
-# Split comma-separated columns into lists
-def split_col(col):
-    return col.fillna('').apply(lambda x: [i.strip() for i in x.split(',') if i.strip()])
-
-for col in ['interests', 'skills', 'hobbies']:
-    df[col] = split_col(df[col])
-
-# MultiLabelBinarizer for multi-valued categorical columns
-mlb_interests = MultiLabelBinarizer()
-mlb_skills = MultiLabelBinarizer()
-mlb_hobbies = MultiLabelBinarizer()
-
-X = df[['age', 'percentage', 'interests', 'skills', 'hobbies', 'personality', 'work_style'] + quiz_cols]
-y = df['career_path']
-
-# Transform features
-X_interests = mlb_interests.fit_transform(X['interests'])
-X_skills = mlb_skills.fit_transform(X['skills'])
-X_hobbies = mlb_hobbies.fit_transform(X['hobbies'])
-
-# Encode personality and work_style
-le_personality = LabelEncoder()
-le_work_style = LabelEncoder()
-X_personality = le_personality.fit_transform(X['personality'])
-X_work_style = le_work_style.fit_transform(X['work_style'])
-
-# Combine all features
-X_all = np.hstack([
-    X[['age', 'percentage']].values,
-    X_interests,
-    X_skills,
-    X_hobbies,
-    X_personality.reshape(-1, 1),
-    X_work_style.reshape(-1, 1),
-    X[quiz_cols].values
-])
-
-# Encode target
-le_career = LabelEncoder()
-y_enc = le_career.fit_transform(y)
-
-# Train/test split
-X_train, X_test, y_train, y_test = train_test_split(X_all, y_enc, test_size=0.2, random_state=42)
-
-# Train model
-clf = RandomForestClassifier(n_estimators=200, random_state=42)
-clf.fit(X_train, y_train)
-
-# Save model and encoders
-joblib.dump({
-    'model': clf,
-    'mlb_interests': mlb_interests,
-    'mlb_skills': mlb_skills,
-    'mlb_hobbies': mlb_hobbies,
-    'le_personality': le_personality,
-    'le_work_style': le_work_style,
-    'le_career': le_career
-}, 'career_predictor.pkl')
-
-print('Model trained and saved as career_predictor.pkl')
\ No newline at end of file
+MODEL_PATH = 'career_predictor.pkl'
+CACHE_DIR = '.train_cache'
+# Bump when the encoding changes so old cache entries are no longer used
+CACHE_VERSION = 1
+# Unlabelled profiles the distilled tree is fitted on (besides the training rows) and evaluated on
+DISTILL_ROWS = 50000
+DISTILL_EVAL_ROWS = 10000
+
+LABEL_FIELDS = ['interests', 'skills', 'hobbies']
+CODE_FIELDS = ['personality', 'work_style']
+COLUMNS = ['age', 'percentage'] + LABEL_FIELDS + CODE_FIELDS + QUIZ_FIELDS + ['career_path']
+
+
+class StageTimer:
+    """Wall-clock time per pipeline stage, printed by report() when profiling"""
+
+    def __init__(self):
+        self.stages = []
+
+    @contextmanager
+    def stage(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.stages.append((name, time.perf_counter() - start))
+
+    def report(self, file=sys.stderr):
+        total = sum(seconds for _, seconds in self.stages)
+        print(f'{"stage":<20} {"seconds":>9} {"share":>7}', file=file)
+        for name, seconds in self.stages:
+            share = seconds / total if total else 0.0
+            print(f'{name:<20} {seconds:>9.3f} {share:>7.1%}', file=file)
+        print(f'{"total":<20} {total:>9.3f}', file=file)
+
+
+def dataset_hash(path):
+    digest = hashlib.sha256(f'v{CACHE_VERSION}'.encode())
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def fit_encoders(df):
+    """Encoders fitted on the distinct values of each column (labels split on commas)"""
+    encoders = {}
+    for field in LABEL_FIELDS:
+        labels = set()
+        for text in df[field].dropna().unique():
+            labels.update(parse_labels(text))
+        mlb = MultiLabelBinarizer()
+        mlb.fit([sorted(labels)])
+        encoders[f'mlb_{field}'] = mlb
+    for field in CODE_FIELDS:
+        encoders[f'le_{field}'] = LabelEncoder().fit(df[field].dropna().str.strip().unique())
+    encoders['le_career'] = LabelEncoder().fit(df['career_path'].dropna().unique())
+    return encoders
+
+
+def encode_dataset(path):
+    """(X, y, encoders, dropped) for a careers_dataset.csv file.
+
+    Rows without a career or with a non-numeric age, percentage or quiz answer are dropped;
+    blank feature cells take the FeatureEncoder defaults.
+    """
+    df = pd.read_csv(path, usecols=COLUMNS, dtype=str, keep_default_na=False, na_values=[''])
+    encoders = fit_encoders(df)
+    X, valid = FeatureEncoder.from_bundle(encoders).encode_frame(df)
+    valid &= df['career_path'].notna().to_numpy()
+    # The forest splits on float32 features, so nothing is lost by caching them that way
+    X = X[valid].astype(np.float32)
+    y = encoders['le_career'].transform(df['career_path'][valid]).astype(np.int32)
+    return X, y, encoders, int((~valid).sum())
+
+
+def synthetic_features(path, encoders, rows, seed):
+    """Encoded synthetic profiles around the rows of the dataset at path (careers are ignored)"""
+    encoder = FeatureEncoder.from_bundle(encoders)
+    blocks = []
+    for df in generate(CareersSchema(path), rows, seed=seed):
+        X, valid = encoder.encode_frame(df.astype(str))
+        blocks.append(X[valid].astype(np.float32))
+    return np.vstack(blocks)
+
+
+def distillation_features(path, encoders, rows, seed):
+    """rows profiles to distill on: half synthetic_features, half random_features"""
+    synthetic = synthetic_features(path, encoders, rows // 2, seed)
+    spread = random_features(FeatureEncoder.from_bundle(encoders), rows - rows // 2,
+                             np.random.default_rng(seed))
+    return np.vstack([synthetic, spread])
+
+
+def load_training_data(path, cache_dir=CACHE_DIR, timer=None):
+    """Encoded (X, y, encoders) for path, from the cache when the file is unchanged"""
+    timer = timer or StageTimer()
+    cache_file = None
+    if cache_dir:
+        with timer.stage('hash dataset'):
+            cache_file = os.path.join(cache_dir, f'{dataset_hash(path)}.joblib')
+        if os.path.exists(cache_file):
+            with timer.stage('load cache'):
+                cached = joblib.load(cache_file)
+            print(f'Using cached features from {cache_file}')
+            return cached['X'], cached['y'], cached['encoders']
+
+    with timer.stage('read + encode'):
+        X, y, encoders, dropped = encode_dataset(path)
+    if dropped:
+        print(f'Dropped {dropped} rows with a missing career or a non-numeric field')
+    if cache_file:
+        with timer.stage('write cache'):
+            os.makedirs(cache_dir, exist_ok=True)
+            # Written under a temporary name first so a killed run never leaves half a file
+            tmp = f'{cache_file}.{os.getpid()}.tmp'
+            joblib.dump({'X': X, 'y': y, 'encoders': encoders}, tmp)
+            os.replace(tmp, cache_file)
+    return X, y, encoders
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Train the career prediction model')
+    parser.add_argument('--data', default=DATA_PATH, help='training CSV (default %(default)s)')
+    parser.add_argument('--output', default=MODEL_PATH, help='model bundle to write (default %(default)s)')
+    parser.add_argument('--artifact-dir',
+                        help='also write the memory-mappable artifact layout (see model_artifact.py) to this directory')
+    parser.add_argument('--cache-dir', default=CACHE_DIR,
+                        help='where encoded datasets are cached (default %(default)s)')
+    parser.add_argument('--no-cache', action='store_true', help='always re-encode the dataset')
+    parser.add_argument('--jobs', type=int, default=-1,
+                        help='processes used to train the forest (default %(default)s: all cores)')
+    parser.add_argument('--distill-depth', type=int, default=DEFAULT_MAX_DEPTH,
+                        help='depth of the distilled fast-path tree (default %(default)s, 0 to skip)')
+    parser.add_argument('--distill-rows', type=int, default=DISTILL_ROWS,
+                        help='unlabelled profiles to distill on besides the training rows (default %(default)s)')
+    parser.add_argument('--confidence', type=float, default=DEFAULT_CONFIDENCE,
+                        help='leaf confidence below which the distilled tree escalates to the forest '
+                             '(default %(default)s)')
+    parser.add_argument('--profile', action='store_true', help='report the time spent in each stage')
+    args = parser.parse_args()
+
+    timer = StageTimer()
+    X_all, y_enc, encoders = load_training_data(args.data, None if args.no_cache else args.cache_dir, timer)
+
+    with timer.stage('split'):
+        X_train, X_test, y_train, y_test = train_test_split(X_all, y_enc, test_size=0.2, random_state=42)
+
+    with timer.stage('train'):
+        clf = RandomForestClassifier(n_estimators=200, random_state=42, n_jobs=args.jobs)
+        clf.fit(X_train, y_train)
+
+    bundle = {'model': clf, **encoders}
+    distilled = None
+    if args.distill_depth:
+        with timer.stage('distill'):
+            X_distill = np.vstack([X_train, distillation_features(args.data, encoders, args.distill_rows, seed=1)])
+            distilled = DistilledModel.fit(clf, X_distill, max_depth=args.distill_depth,
+                                           threshold=args.confidence)
+    # Serving predicts one row at a time, where worker threads only add overhead
+    clf.n_jobs = None
+    if distilled:
+        with timer.stage('evaluate distilled'):
+            X_eval = np.vstack([X_test, distillation_features(args.data, encoders, DISTILL_EVAL_ROWS, seed=2)])
+            bundle['distilled'] = distilled
+            bundle['distilled_report'] = evaluate(distilled, clf, X_eval)
+
+    with timer.stage('save'):
+        joblib.dump(bundle, args.output)
+        if args.artifact_dir:
+            save_model_artifact(bundle, args.artifact_dir)
+
+    print(f'Model trained on {len(X_train)} rows and saved as {args.output}')
+    if distilled:
+        print_report(bundle['distilled_report'])
+    if args.artifact_dir:
+        print(f'Memory-mappable artifact saved to {args.artifact_dir}')
+    if args.profile:
+        timer.report()
+
+
+if __name__ == '__main__':
+    main()